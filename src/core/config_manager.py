@@ -13,6 +13,7 @@ import shutil
 from pathlib import Path
 import time
 import threading
+from contextlib import contextmanager
 
 logger = logging.getLogger("DogeDictate.ConfigManager")
 
@@ -108,6 +109,8 @@ class ConfigManager:
         self.min_save_interval = 3.0  # Intervalo mínimo entre salvamentos (segundos)
         self.scheduled_save = None  # Referência para o temporizador de salvamento agendado
         self.save_lock = threading.Lock()  # Lock para evitar condições de corrida
+        self._batch_depth = 0  # Nível de aninhamento de batch() ativo
+        self._batch_save_requested = False  # save_config chamado durante um batch
         
         # Determinar o caminho do arquivo de configuração
         if config_path:
@@ -357,6 +360,11 @@ class ConfigManager:
         Returns:
             bool: True if saved, False otherwise
         """
+        # Dentro de um batch, o salvamento fica para o final do bloco
+        if self._batch_depth:
+            self._batch_save_requested = True
+            return False
+        
         with self.save_lock:
             # Cancelar qualquer salvamento agendado pendente
             if self.scheduled_save:
@@ -381,6 +389,22 @@ class ConfigManager:
             # Executar o salvamento real
             return self._perform_save()
             
+    @contextmanager
+    def batch(self):
+        """Agrupar várias alterações e gravar o arquivo uma única vez ao final
+        
+        As chamadas a save_config feitas dentro do bloco são adiadas; se alguma
+        ocorreu, um único salvamento é feito quando o bloco mais externo termina.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_save_requested:
+                self._batch_save_requested = False
+                self.save_config(force=True)
+    
     def _delayed_save(self):
         """Método chamado pelo timer para realizar salvamento adiado"""
         with self.save_lock:
@@ -393,20 +417,23 @@ class ConfigManager:
             # Garantir que o diretório exista
             os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
             
+            # Serializar uma única vez e gravar com uma só chamada de escrita
+            data = json.dumps(self.config, indent=4, ensure_ascii=False).encode("utf-8")
+            
             # Salvamento atômico (criar arquivo temporário primeiro)
             temp_path = f"{self.config_path}.tmp"
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
-                
-            # Renomear o arquivo temporário para o destino final
-            if os.path.exists(self.config_path):
-                # Em Windows, precisamos remover o arquivo de destino primeiro
-                try:
-                    os.remove(self.config_path)
-                except:
-                    pass
-                    
-            os.rename(temp_path, self.config_path)
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+            fd = os.open(temp_path, flags, 0o666)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            
+            # Substituir o arquivo de destino (os.replace também funciona no Windows)
+            os.replace(temp_path, self.config_path)
             
             # Atualizar o estado
             self.last_saved = time.time()
@@ -436,6 +463,36 @@ class ConfigManager:
             self.config[section] = {}
         
         self.config[section][key] = value
+        self.dirty = True  # A escrita fica para a próxima chamada a save_config
+    
+    def get_section(self, section, defaults=None):
+        """Get a shallow copy of a configuration section
+        
+        Args:
+            section (str): Section name
+            defaults (dict): If given, only these keys are returned, with their
+                values used when the key is missing from the section
+        """
+        values = self.config.get(section, {})
+        if defaults is None:
+            return dict(values)
+        return {key: values.get(key, default) for key, default in defaults.items()}
+    
+    def set_section(self, section, updates):
+        """Merge several key/value pairs into a configuration section"""
+        if section not in self.config:
+            self.config[section] = {}
+        
+        self.config[section].update(updates)
+        self.dirty = True
+    
+    def update(self, updates):
+        """Merge a {section: {key: value}} dict into the configuration in one pass"""
+        for section, values in updates.items():
+            self.config.setdefault(section, {}).update(values)
+        
+        if updates:
+            self.dirty = True
     
     def set_and_save_value(self, section, key, value):
         """Set a value and save the configuration"""
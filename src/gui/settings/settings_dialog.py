@@ -4,19 +4,12 @@ Diálogo de configurações principal para a aplicação DogeDictate.
 
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QTabWidget, QDialogButtonBox,
-    QSystemTrayIcon, QMenu, QMessageBox, QApplication
+    QSystemTrayIcon, QMenu, QMessageBox, QApplication, QWidget
 )
 from PyQt5.QtGui import QIcon
 import os
 import logging
 
-from .tabs.general_tab import GeneralTab
-from .tabs.languages_tab import LanguagesTab
-from .tabs.apis_tab import APIsTab
-from .tabs.local_tab import LocalTab
-from .tabs.plan_tab import PlanTab
-from .tabs.account_tab import AccountTab
-from .tabs.stats_tab import StatsTab
 from src.i18n import get_instance as get_i18n, _
 
 logger = logging.getLogger("DogeDictate.SettingsDialog")
@@ -42,60 +35,134 @@ class SettingsDialog(QDialog):
         layout.addWidget(self.tab_widget)
         
         # Create tabs
-        self.general_tab = GeneralTab(config_manager, dictation_manager, hotkey_manager)
-        self.languages_tab = LanguagesTab(config_manager, dictation_manager)
-        self.apis_tab = APIsTab(config_manager)
-        self.local_tab = LocalTab(config_manager)
-        self.plan_tab = PlanTab(config_manager)
-        self.account_tab = AccountTab(config_manager)
-        self.stats_tab = StatsTab(config_manager, self)
-        
-        # Add tabs to widget
-        self.tab_widget.addTab(self.general_tab, _("general_tab", "General"))
-        self.tab_widget.addTab(self.languages_tab, _("languages_tab", "Languages"))
-        self.tab_widget.addTab(self.apis_tab, _("apis_tab", "APIs"))
-        self.tab_widget.addTab(self.local_tab, _("local_tab", "Local Services"))
-        self.tab_widget.addTab(self.stats_tab, _("stats_tab", "Statistics"))
-        self.tab_widget.addTab(self.plan_tab, _("plan_tab", "Plan"))
-        self.tab_widget.addTab(self.account_tab, _("account_tab", "Account"))
+        # As abas são construídas apenas na primeira vez em que são selecionadas;
+        # até lá, um QWidget vazio ocupa o seu lugar no tab widget.
+        self._tab_factories = [
+            ("general_tab", self._create_general_tab, "general_tab", "General"),
+            ("languages_tab", self._create_languages_tab, "languages_tab", "Languages"),
+            ("apis_tab", self._create_apis_tab, "apis_tab", "APIs"),
+            ("local_tab", self._create_local_tab, "local_tab", "Local Services"),
+            ("stats_tab", self._create_stats_tab, "stats_tab", "Statistics"),
+            ("plan_tab", self._create_plan_tab, "plan_tab", "Plan"),
+            ("account_tab", self._create_account_tab, "account_tab", "Account"),
+        ]
+        self._tab_instances = {}
+        
+        # Recarregar as abas na próxima exibição (definido ao fechar o diálogo)
+        self._needs_reload = False
+        
+        self._add_placeholder_tabs()
+        self.tab_widget.currentChanged.connect(self._ensure_tab)
         
         # Create button box
-        button_box = QDialogButtonBox(
+        self.button_box = QDialogButtonBox(
             QDialogButtonBox.Save | QDialogButtonBox.Ok | QDialogButtonBox.Cancel
         )
-        button_box.accepted.connect(self.accept)
-        button_box.rejected.connect(self.reject)
+        self.button_box.accepted.connect(self.accept)
+        self.button_box.rejected.connect(self.reject)
         
         # Conectar o botão Salvar
-        save_button = button_box.button(QDialogButtonBox.Save)
-        save_button.setText(_("save", "Save"))
-        save_button.clicked.connect(self.save_without_closing)
+        self._save_button = self.button_box.button(QDialogButtonBox.Save)
+        self._save_button.setText(_("save", "Save"))
+        self._save_button.clicked.connect(self.save_without_closing)
         
         # Traduzir os botões padrão
-        ok_button = button_box.button(QDialogButtonBox.Ok)
-        ok_button.setText(_("ok", "OK"))
+        self._ok_button = self.button_box.button(QDialogButtonBox.Ok)
+        self._ok_button.setText(_("ok", "OK"))
         
-        cancel_button = button_box.button(QDialogButtonBox.Cancel)
-        cancel_button.setText(_("cancel", "Cancel"))
+        self._cancel_button = self.button_box.button(QDialogButtonBox.Cancel)
+        self._cancel_button.setText(_("cancel", "Cancel"))
         
-        layout.addWidget(button_box)
+        layout.addWidget(self.button_box)
         
-        # Load settings
-        self._load_settings()
+        # Construir e carregar apenas a aba inicial
+        self._ensure_tab(self.tab_widget.currentIndex())
         
         # Armazenar o idioma atual para comparação posterior
         current_language = self.config_manager.get_value("interface", "language", "en")
         self.old_language = current_language
     
+    def _add_placeholder_tabs(self):
+        """Adicionar um placeholder por aba, sem redesenhar a barra a cada inserção"""
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.setUpdatesEnabled(False)
+        self._applied_labels = self._tab_labels()
+        for (attr, factory, label_key, label_default), label in zip(self._tab_factories, self._applied_labels):
+            setattr(self, attr, None)
+            self.tab_widget.addTab(QWidget(), label)
+        self.tab_widget.setUpdatesEnabled(True)
+        self.tab_widget.blockSignals(False)
+    
+    # Cada aba é importada só quando é construída; os imports literais permitem
+    # que o PyInstaller encontre os módulos
+    def _create_general_tab(self):
+        from .tabs.general_tab import GeneralTab
+        return GeneralTab(self.config_manager, self.dictation_manager, self.hotkey_manager)
+    
+    def _create_languages_tab(self):
+        from .tabs.languages_tab import LanguagesTab
+        return LanguagesTab(self.config_manager, self.dictation_manager)
+    
+    def _create_apis_tab(self):
+        from .tabs.apis_tab import APIsTab
+        return APIsTab(self.config_manager)
+    
+    def _create_local_tab(self):
+        from .tabs.local_tab import LocalTab
+        return LocalTab(self.config_manager)
+    
+    def _create_stats_tab(self):
+        from .tabs.stats_tab import StatsTab
+        return StatsTab(self.config_manager, self)
+    
+    def _create_plan_tab(self):
+        from .tabs.plan_tab import PlanTab
+        return PlanTab(self.config_manager)
+    
+    def _create_account_tab(self):
+        from .tabs.account_tab import AccountTab
+        return AccountTab(self.config_manager)
+    
+    def _tab_labels(self):
+        """Títulos traduzidos das abas, na ordem do tab widget"""
+        return [_(label_key, label_default) for attr, factory, label_key, label_default in self._tab_factories]
+    
+    def showEvent(self, event):
+        """Recarregar as abas já construídas quando o diálogo for reaberto"""
+        # O diálogo é reutilizado entre aberturas; descartar edições não salvas
+        if self._needs_reload:
+            self._needs_reload = False
+            self._load_settings()
+        super().showEvent(event)
+    
+    def _ensure_tab(self, index):
+        """Construir a aba real na primeira vez que ela é selecionada"""
+        if index < 0 or index in self._tab_instances:
+            return
+        
+        attr, factory, label_key, label_default = self._tab_factories[index]
+        tab = factory()
+        tab.ensure_built()
+        tab.load_settings()
+        self._tab_instances[index] = tab
+        setattr(self, attr, tab)
+        
+        # Substituir o placeholder sem disparar currentChanged para as abas vizinhas
+        placeholder = self.tab_widget.widget(index)
+        label = self.tab_widget.tabText(index)
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, tab, label)
+            self.tab_widget.setCurrentIndex(index)
+        finally:
+            self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+    
     def _load_settings(self):
         """Load settings from config manager"""
-        self.general_tab.load_settings()
-        self.languages_tab.load_settings()
-        self.apis_tab.load_settings()
-        self.local_tab.load_settings()
-        self.stats_tab.load_settings()
-        self.plan_tab.load_settings()
-        self.account_tab.load_settings()
+        for tab in self._tab_instances.values():
+            tab.load_settings()
     
     def _update_translations(self):
         """Atualizar traduções da interface"""
@@ -105,29 +172,17 @@ class SettingsDialog(QDialog):
         # Atualizar título da janela
         self.setWindowTitle(_("settings_title", "Settings"))
         
-        # Atualizar títulos das abas
-        self.tab_widget.setTabText(0, _("general_tab", "General"))
-        self.tab_widget.setTabText(1, _("languages_tab", "Languages"))
-        self.tab_widget.setTabText(2, _("apis_tab", "APIs"))
-        self.tab_widget.setTabText(3, _("local_tab", "Local Services"))
-        self.tab_widget.setTabText(4, _("stats_tab", "Statistics"))
-        self.tab_widget.setTabText(5, _("plan_tab", "Plan"))
-        self.tab_widget.setTabText(6, _("account_tab", "Account"))
+        # Atualizar títulos das abas, apenas os que realmente mudaram
+        new_labels = self._tab_labels()
+        for index, (old_label, new_label) in enumerate(zip(self._applied_labels, new_labels)):
+            if old_label != new_label:
+                self.tab_widget.setTabText(index, new_label)
+        self._applied_labels = new_labels
         
         # Atualizar botões
-        button_box = self.findChild(QDialogButtonBox)
-        if button_box:
-            save_button = button_box.button(QDialogButtonBox.Save)
-            if save_button:
-                save_button.setText(_("save", "Save"))
-            
-            ok_button = button_box.button(QDialogButtonBox.Ok)
-            if ok_button:
-                ok_button.setText(_("ok", "OK"))
-            
-            cancel_button = button_box.button(QDialogButtonBox.Cancel)
-            if cancel_button:
-                cancel_button.setText(_("cancel", "Cancel"))
+        self._save_button.setText(_("save", "Save"))
+        self._ok_button.setText(_("ok", "OK"))
+        self._cancel_button.setText(_("cancel", "Cancel"))
     
     def accept(self):
         """Save settings when OK is clicked"""
@@ -135,32 +190,28 @@ class SettingsDialog(QDialog):
             # Armazenar o idioma atual antes de salvar
             old_language = self.old_language
             
-            # Save settings from each tab
-            self.general_tab.save_settings()
-            self.languages_tab.save_settings()
-            self.apis_tab.save_settings()
-            self.local_tab.save_settings()
-            self.stats_tab.save_settings()
-            self.plan_tab.save_settings()
-            self.account_tab.save_settings()
-            
-            # Salvar configurações no disco
-            self.config_manager.save_config()
+            # Save settings from each tab that was actually opened
+            changed = [tab.save_settings() for tab in self._tab_instances.values()]
             
-            logger.info("Settings saved")
-            
-            # Verificar se o idioma foi alterado
-            current_language = self.config_manager.get_value("interface", "language", "")
-            
-            if old_language != current_language:
-                # Mostrar mensagem sobre reinicialização
-                QMessageBox.information(
-                    self,
-                    _("language_changed_title", "Language Changed"),
-                    _("language_changed_message", "The interface language has been changed. Restart the application to apply the changes.")
-                )
+            # Salvar configurações no disco apenas se algo mudou
+            if any(changed):
+                self.config_manager.save_config(force=True)
+                
+                logger.info("Settings saved")
+                
+                # Verificar se o idioma foi alterado
+                current_language = self.config_manager.get_value("interface", "language", "")
+                
+                if old_language != current_language:
+                    # Mostrar mensagem sobre reinicialização
+                    QMessageBox.information(
+                        self,
+                        _("language_changed_title", "Language Changed"),
+                        _("language_changed_message", "The interface language has been changed. Restart the application to apply the changes.")
+                    )
             
             # Fechar o diálogo
+            self._needs_reload = True
             super().accept()
         
         except Exception as e:
@@ -171,6 +222,11 @@ class SettingsDialog(QDialog):
                 _("error_saving_settings", "Error saving settings: {error}").format(error=str(e))
             )
     
+    def reject(self):
+        """Descartar edições não salvas na próxima abertura"""
+        self._needs_reload = True
+        super().reject()
+    
     def close_application(self):
         """Close the application"""
         # Confirm before closing
@@ -190,13 +246,14 @@ class SettingsDialog(QDialog):
         """Handle close event"""
         # Check if we should minimize to tray instead of closing
         minimize_to_tray = self.config_manager.get_value("general", "minimize_to_tray", True)
+        self._needs_reload = True
         
         if minimize_to_tray and QSystemTrayIcon.isSystemTrayAvailable():
             # Minimize to tray instead of closing
             self.hide()
             event.ignore()
         else:
-            # Close normally
+            # Close normally; as abas são mantidas para a próxima abertura
             event.accept()
     
     def save_without_closing(self):
@@ -205,33 +262,28 @@ class SettingsDialog(QDialog):
             # Armazenar o idioma atual antes de salvar
             old_language = self.old_language
             
-            # Save settings from each tab
-            self.general_tab.save_settings()
-            self.languages_tab.save_settings()
-            self.apis_tab.save_settings()
-            self.local_tab.save_settings()
-            self.stats_tab.save_settings()
-            self.plan_tab.save_settings()
-            self.account_tab.save_settings()
-            
-            # Salvar configurações no disco
-            self.config_manager.save_config()
-            
-            # Verificar se o idioma foi alterado
-            current_language = self.config_manager.get_value("interface", "language", "")
+            # Save settings from each tab that was actually opened
+            changed = [tab.save_settings() for tab in self._tab_instances.values()]
             
-            if old_language != current_language:
-                # Atualizar o idioma armazenado
-                self.old_language = current_language
+            # Salvar configurações no disco apenas se algo mudou
+            if any(changed):
+                self.config_manager.save_config(force=True)
                 
-                # Mostrar mensagem sobre reinicialização
-                QMessageBox.information(
-                    self,
-                    _("language_changed_title", "Language Changed"),
-                    _("language_changed_message", "The interface language has been changed. Restart the application to apply the changes.")
-                )
-            
-            logger.info("Settings saved without closing")
+                # Verificar se o idioma foi alterado
+                current_language = self.config_manager.get_value("interface", "language", "")
+                
+                if old_language != current_language:
+                    # Atualizar o idioma armazenado
+                    self.old_language = current_language
+                    
+                    # Mostrar mensagem sobre reinicialização
+                    QMessageBox.information(
+                        self,
+                        _("language_changed_title", "Language Changed"),
+                        _("language_changed_message", "The interface language has been changed. Restart the application to apply the changes.")
+                    )
+                
+                logger.info("Settings saved without closing")
             
             # Show success message
             QMessageBox.information(
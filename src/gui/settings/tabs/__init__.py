@@ -1,14 +1,8 @@
 """
 Módulos de abas para o diálogo de configurações.
-"""
 
-from .general_tab import GeneralTab
-from .languages_tab import LanguagesTab
-from .apis_tab import APIsTab
-from .local_tab import LocalTab
-from .plan_tab import PlanTab
-from .account_tab import AccountTab
-from .stats_tab import StatsTab
+As abas são importadas sob demanda no primeiro acesso ao atributo.
+"""
 
 __all__ = [
     'GeneralTab',
@@ -18,4 +12,29 @@ __all__ = [
     'PlanTab',
     'AccountTab',
     'StatsTab'
-] 
\ No newline at end of file
+]
+
+def __getattr__(name):
+    # Imports literais, para que o PyInstaller encontre os módulos das abas
+    if name == 'GeneralTab':
+        from .general_tab import GeneralTab
+        return GeneralTab
+    if name == 'LanguagesTab':
+        from .languages_tab import LanguagesTab
+        return LanguagesTab
+    if name == 'APIsTab':
+        from .apis_tab import APIsTab
+        return APIsTab
+    if name == 'LocalTab':
+        from .local_tab import LocalTab
+        return LocalTab
+    if name == 'PlanTab':
+        from .plan_tab import PlanTab
+        return PlanTab
+    if name == 'AccountTab':
+        from .account_tab import AccountTab
+        return AccountTab
+    if name == 'StatsTab':
+        from .stats_tab import StatsTab
+        return StatsTab
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -22,4 +22,4 @@ class AccountTab(BaseTab):
     
     def save_settings(self):
         """Salvar configurações no config_manager"""
-        pass 
\ No newline at end of file
+        return False
\ No newline at end of file
@@ -7,19 +7,120 @@ from PyQt5.QtWidgets import (
     QFileDialog, QScrollArea, QWidget, QMessageBox, QVBoxLayout,
     QTabWidget, QHBoxLayout, QLabel, QTextEdit
 )
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
 import logging
 
 from .base_tab import BaseTab
-from src.services.translator_service import TranslatorService
+from src.i18n import _
 
 logger = logging.getLogger("DogeDictate.SettingsDialog.APIsTab")
 
+# Descrições dos grupos (texto padrão usado quando não há tradução)
+_AZURE_DESC = "O Azure Speech Service é um serviço de reconhecimento de voz da Microsoft que oferece alta precisão e suporte a múltiplos idiomas."
+_WHISPER_DESC = "O Whisper é um modelo de reconhecimento de voz da OpenAI que oferece alta precisão e suporte a múltiplos idiomas."
+_GOOGLE_DESC = "O Google Speech-to-Text é um serviço de reconhecimento de voz do Google que oferece alta precisão e suporte a múltiplos idiomas."
+_TRANSLATOR_DESC = "O Azure Translator é um serviço de tradução da Microsoft que oferece suporte a mais de 100 idiomas e alta qualidade de tradução."
+_AZURE_OPENAI_DESC = "O Azure OpenAI com GPT-4o permite tradução avançada com adaptação de estilo e contexto baseado em um prompt personalizado."
+
+_DEFAULT_OPENAI_PROMPT = "Você é um assistente especializado em tradução. Traduza o seguinte texto para {target_language} mantendo o estilo original e o significado preciso."
+
+# Especificação dos grupos de API: título, descrição (chave, padrão),
+# campos (rótulo, atributo, modo) e botões (texto, método)
+_API_GROUPS = {
+    "azure": {
+        "title": "Azure Speech Service",
+        "description": ("azure_speech_description", _AZURE_DESC),
+        "fields": (
+            ("API Key:", "azure_key_edit", "password"),
+            ("Região:", "azure_region_edit", None)
+        ),
+        "buttons": (("Testar Conexão", "_test_azure_service_connection"),)
+    },
+    "whisper": {
+        "title": "OpenAI Whisper API",
+        "description": ("whisper_api_description", _WHISPER_DESC),
+        "fields": (
+            ("API Key:", "whisper_key_edit", "password"),
+        ),
+        "buttons": (("Testar Conexão", "_test_whisper_service_connection"),)
+    },
+    "google": {
+        "title": "Google Speech-to-Text",
+        "description": ("google_speech_description", _GOOGLE_DESC),
+        "fields": (
+            ("Credenciais:", "google_creds_edit", "readonly"),
+        ),
+        "buttons": (
+            ("Procurar...", "_browse_google_credentials"),
+            ("Testar Conexão", "_test_google_service_connection")
+        )
+    },
+    "translator": {
+        "title": "Azure Translator API",
+        "description": ("azure_translator_description", _TRANSLATOR_DESC),
+        "fields": (
+            ("API Key:", "translator_key_edit", "password"),
+            ("Região:", "translator_region_edit", None)
+        ),
+        "buttons": (("Testar Conexão", "_test_translator_connection"),)
+    },
+    "azure_openai": {
+        "title": "Azure OpenAI (GPT-4o)",
+        "description": ("azure_openai_description", _AZURE_OPENAI_DESC),
+        "fields": (
+            ("API Key:", "openai_key_edit", "password"),
+            ("Endpoint:", "openai_endpoint_edit", None),
+            ("Deployment Name:", "openai_deployment_edit", None)
+        ),
+        "buttons": (("Testar Conexão", "_test_azure_openai_connection"),)
+    }
+}
+
+class ConnectionTestSignals(QObject):
+    """Sinais de um teste de conexão executado em segundo plano"""
+    finished = pyqtSignal(dict)
+
+class ConnectionTestTask(QRunnable):
+    """Tarefa para executar um teste de conexão fora da thread da interface"""
+    
+    def __init__(self, test_func):
+        super().__init__()
+        self.test_func = test_func
+        self.signals = ConnectionTestSignals()
+    
+    def run(self):
+        """Executar o teste e emitir o resultado"""
+        try:
+            result = self.test_func()
+        except Exception as e:
+            logger.error(f"Error testing connection: {str(e)}")
+            result = {"success": False, "message": str(e)}
+        self.signals.finished.emit(result)
+
 class APIsTab(BaseTab):
     """Aba de configuração para serviços de API"""
     
+    _BINDINGS = (
+        ("azure_key_edit", "recognition", "azure_api_key", ""),
+        ("azure_region_edit", "recognition", "azure_region", ""),
+        ("whisper_key_edit", "recognition", "whisper_api_key", ""),
+        ("google_creds_edit", "recognition", "google_credentials_path", ""),
+        ("translator_key_edit", "translation", "azure_translator_key", ""),
+        ("translator_region_edit", "translation", "azure_translator_region", ""),
+        ("openai_key_edit", "translation", "azure_openai_key", ""),
+        ("openai_endpoint_edit", "translation", "azure_openai_endpoint", ""),
+        ("openai_deployment_edit", "translation", "azure_openai_deployment", ""),
+        ("openai_prompt_edit", "translation", "azure_openai_prompt", _DEFAULT_OPENAI_PROMPT)
+    )
+    
     def __init__(self, config_manager, parent=None):
         super().__init__(config_manager, parent)
-        self.translator_service = TranslatorService(config_manager)
+        
+        # Testes de conexão em andamento
+        self._connection_tests = set()
+        
+        # Criado apenas quando um teste do tradutor for executado
+        self._translator_service = None
         
         # Criar área de rolagem
         scroll_area = QScrollArea()
@@ -32,6 +133,7 @@ class APIsTab(BaseTab):
         
         # Criar abas para diferentes tipos de serviços
         tab_widget = QTabWidget()
+        tab_widget.setUpdatesEnabled(False)
         
         # Aba de serviços de reconhecimento
         recognition_tab = QWidget()
@@ -40,9 +142,8 @@ class APIsTab(BaseTab):
         recognition_layout.setSpacing(16)
         
         # Adicionar grupos à aba de reconhecimento
-        self._create_azure_group(recognition_layout)
-        self._create_whisper_group(recognition_layout)
-        self._create_google_group(recognition_layout)
+        for name in ("azure", "whisper", "google"):
+            self._build_api_group(recognition_layout, _API_GROUPS[name])
         
         tab_widget.addTab(recognition_tab, "Reconhecimento de Voz")
         
@@ -53,168 +154,70 @@ class APIsTab(BaseTab):
         translation_layout.setSpacing(16)
         
         # Adicionar grupos à aba de tradução
-        self._create_translator_group(translation_layout)
+        self._build_api_group(translation_layout, _API_GROUPS["translator"])
         self._create_azure_openai_group(translation_layout)
         
         tab_widget.addTab(translation_tab, "Tradução")
+        tab_widget.setUpdatesEnabled(True)
         
         content_layout.addWidget(tab_widget)
         
         scroll_area.setWidget(content)
         self.layout.addWidget(scroll_area)
     
-    def _create_azure_group(self, parent_layout):
-        """Criar grupo de configurações do Azure"""
-        azure_group = QGroupBox("Azure Speech Service")
-        azure_layout = QVBoxLayout(azure_group)
-        
-        # Descrição
-        description = QLabel("O Azure Speech Service é um serviço de reconhecimento de voz da Microsoft que oferece alta precisão e suporte a múltiplos idiomas.")
-        description.setWordWrap(True)
-        azure_layout.addWidget(description)
-        
-        # Formulário de configuração
-        form_layout = QFormLayout()
-        
-        self.azure_key_edit = QLineEdit()
-        self.azure_key_edit.setEchoMode(QLineEdit.Password)
-        form_layout.addRow("API Key:", self.azure_key_edit)
-        
-        self.azure_region_edit = QLineEdit()
-        form_layout.addRow("Região:", self.azure_region_edit)
-        
-        azure_layout.addLayout(form_layout)
-        
-        # Botões
-        button_layout = QHBoxLayout()
-        
-        azure_test_button = QPushButton("Testar Conexão")
-        azure_test_button.clicked.connect(self._test_azure_service_connection)
-        button_layout.addWidget(azure_test_button)
-        
-        azure_layout.addLayout(button_layout)
-        
-        parent_layout.addWidget(azure_group)
-    
-    def _create_whisper_group(self, parent_layout):
-        """Criar grupo de configurações do Whisper"""
-        whisper_group = QGroupBox("OpenAI Whisper API")
-        whisper_layout = QVBoxLayout(whisper_group)
-        
-        # Descrição
-        description = QLabel("O Whisper é um modelo de reconhecimento de voz da OpenAI que oferece alta precisão e suporte a múltiplos idiomas.")
-        description.setWordWrap(True)
-        whisper_layout.addWidget(description)
-        
-        # Formulário de configuração
-        form_layout = QFormLayout()
-        
-        self.whisper_key_edit = QLineEdit()
-        self.whisper_key_edit.setEchoMode(QLineEdit.Password)
-        form_layout.addRow("API Key:", self.whisper_key_edit)
-        
-        whisper_layout.addLayout(form_layout)
-        
-        # Botões
-        button_layout = QHBoxLayout()
-        
-        whisper_test_button = QPushButton("Testar Conexão")
-        whisper_test_button.clicked.connect(self._test_whisper_service_connection)
-        button_layout.addWidget(whisper_test_button)
-        
-        whisper_layout.addLayout(button_layout)
-        
-        parent_layout.addWidget(whisper_group)
+    @property
+    def translator_service(self):
+        """Serviço de tradução, construído no primeiro uso"""
+        if self._translator_service is None:
+            # Importado aqui para não pesar no carregamento do módulo
+            from src.services.translator_service import TranslatorService
+            self._translator_service = TranslatorService(self.config_manager)
+        return self._translator_service
     
-    def _create_google_group(self, parent_layout):
-        """Criar grupo de configurações do Google"""
-        google_group = QGroupBox("Google Speech-to-Text")
-        google_layout = QVBoxLayout(google_group)
-        
-        # Descrição
-        description = QLabel("O Google Speech-to-Text é um serviço de reconhecimento de voz do Google que oferece alta precisão e suporte a múltiplos idiomas.")
-        description.setWordWrap(True)
-        google_layout.addWidget(description)
-        
-        # Formulário de configuração
-        form_layout = QFormLayout()
-        
-        self.google_creds_edit = QLineEdit()
-        self.google_creds_edit.setReadOnly(True)
-        form_layout.addRow("Credenciais:", self.google_creds_edit)
-        
-        google_layout.addLayout(form_layout)
-        
-        # Botões
-        button_layout = QHBoxLayout()
-        
-        google_browse_button = QPushButton("Procurar...")
-        google_browse_button.clicked.connect(self._browse_google_credentials)
-        button_layout.addWidget(google_browse_button)
+    def _build_api_group(self, parent_layout, spec):
+        """Criar um grupo de configurações de API a partir da sua especificação
         
-        google_test_button = QPushButton("Testar Conexão")
-        google_test_button.clicked.connect(self._test_google_service_connection)
-        button_layout.addWidget(google_test_button)
-        
-        google_layout.addLayout(button_layout)
-        
-        parent_layout.addWidget(google_group)
-    
-    def _create_translator_group(self, parent_layout):
-        """Criar grupo de configurações do Tradutor"""
-        translator_group = QGroupBox("Azure Translator API")
-        translator_layout = QVBoxLayout(translator_group)
+        Returns:
+            QFormLayout: Formulário do grupo, para linhas adicionais
+        """
+        group = QGroupBox(spec["title"])
+        group_layout = QVBoxLayout(group)
         
         # Descrição
-        description = QLabel("O Azure Translator é um serviço de tradução da Microsoft que oferece suporte a mais de 100 idiomas e alta qualidade de tradução.")
+        description = QLabel(_(*spec["description"]))
         description.setWordWrap(True)
-        translator_layout.addWidget(description)
+        group_layout.addWidget(description)
         
         # Formulário de configuração
         form_layout = QFormLayout()
         
-        self.translator_key_edit = QLineEdit()
-        self.translator_key_edit.setEchoMode(QLineEdit.Password)
-        form_layout.addRow("API Key:", self.translator_key_edit)
-        
-        self.translator_region_edit = QLineEdit()
-        form_layout.addRow("Região:", self.translator_region_edit)
+        for label, attr, mode in spec["fields"]:
+            edit = QLineEdit()
+            if mode == "password":
+                edit.setEchoMode(QLineEdit.Password)
+            elif mode == "readonly":
+                edit.setReadOnly(True)
+            form_layout.addRow(label, edit)
+            setattr(self, attr, edit)
         
-        translator_layout.addLayout(form_layout)
+        group_layout.addLayout(form_layout)
         
         # Botões
         button_layout = QHBoxLayout()
         
-        translator_test_button = QPushButton("Testar Conexão")
-        translator_test_button.clicked.connect(self._test_translator_connection)
-        button_layout.addWidget(translator_test_button)
+        for text, handler in spec["buttons"]:
+            button = QPushButton(text)
+            button.clicked.connect(getattr(self, handler))
+            button_layout.addWidget(button)
         
-        translator_layout.addLayout(button_layout)
+        group_layout.addLayout(button_layout)
         
-        parent_layout.addWidget(translator_group)
+        parent_layout.addWidget(group)
+        return form_layout
     
     def _create_azure_openai_group(self, parent_layout):
         """Criar grupo de configurações do Azure OpenAI"""
-        openai_group = QGroupBox("Azure OpenAI (GPT-4o)")
-        openai_layout = QVBoxLayout(openai_group)
-        
-        # Descrição
-        description = QLabel("O Azure OpenAI com GPT-4o permite tradução avançada com adaptação de estilo e contexto baseado em um prompt personalizado.")
-        description.setWordWrap(True)
-        openai_layout.addWidget(description)
-        
-        # Formulário de configuração
-        form_layout = QFormLayout()
-        
-        self.openai_key_edit = QLineEdit()
-        self.openai_key_edit.setEchoMode(QLineEdit.Password)
-        form_layout.addRow("API Key:", self.openai_key_edit)
-        
-        self.openai_endpoint_edit = QLineEdit()
-        form_layout.addRow("Endpoint:", self.openai_endpoint_edit)
-        
-        self.openai_deployment_edit = QLineEdit()
-        form_layout.addRow("Deployment Name:", self.openai_deployment_edit)
+        form_layout = self._build_api_group(parent_layout, _API_GROUPS["azure_openai"])
         
         # Prompt personalizado
         prompt_label = QLabel("Prompt de Personalização:")
@@ -224,19 +227,33 @@ class APIsTab(BaseTab):
         self.openai_prompt_edit.setPlaceholderText("Exemplo: Você é um assistente especializado em tradução. Traduza o seguinte texto para {target_language} mantendo o estilo de um engenheiro de dados, usando terminologia técnica apropriada e estrutura formal.")
         self.openai_prompt_edit.setMinimumHeight(100)
         form_layout.addRow(self.openai_prompt_edit)
-        
-        openai_layout.addLayout(form_layout)
-        
-        # Botões
-        button_layout = QHBoxLayout()
-        
-        openai_test_button = QPushButton("Testar Conexão")
-        openai_test_button.clicked.connect(self._test_azure_openai_connection)
-        button_layout.addWidget(openai_test_button)
-        
-        openai_layout.addLayout(button_layout)
-        
-        parent_layout.addWidget(openai_group)
+    
+    def _run_connection_test(self, test_func, on_result):
+        """Executar um teste de conexão no QThreadPool e tratar o resultado na thread da interface"""
+        button = self.sender()
+        if button is not None:
+            button.setEnabled(False)
+        
+        task = ConnectionTestTask(test_func)
+        
+        def finished(result):
+            self._connection_tests.discard(task)
+            if button is not None:
+                button.setEnabled(True)
+            on_result(result)
+        
+        task.signals.finished.connect(finished)
+        self._connection_tests.add(task)
+        self._pool.start(task)
+    
+    def _show_simulated_test_result(self, service_name):
+        """Mostrar o resultado de um teste de conexão ainda simulado"""
+        # Aqui você implementaria o teste real
+        # Por enquanto, apenas mostramos uma mensagem de sucesso
+        self._run_connection_test(
+            lambda: {"success": True, "message": ""},
+            lambda result: QMessageBox.information(self, "Teste de Conexão", f"Conexão com {service_name} bem-sucedida!\n\nSuas credenciais são válidas.")
+        )
     
     def _test_azure_service_connection(self):
         """Testar conexão com o serviço Azure Speech"""
@@ -247,12 +264,7 @@ class APIsTab(BaseTab):
             QMessageBox.warning(self, "Teste de Conexão", "Por favor, insira a API Key e a Região")
             return
         
-        # Mostrar mensagem de teste
-        QMessageBox.information(self, "Teste de Conexão", "Testando conexão com o Azure Speech Service...\n\nIsso pode levar alguns segundos.")
-        
-        # Aqui você implementaria o teste real
-        # Por enquanto, apenas mostramos uma mensagem de sucesso
-        QMessageBox.information(self, "Teste de Conexão", "Conexão com o Azure Speech Service bem-sucedida!\n\nSuas credenciais são válidas.")
+        self._show_simulated_test_result("o Azure Speech Service")
     
     def _test_whisper_service_connection(self):
         """Testar conexão com o serviço Whisper"""
@@ -262,12 +274,7 @@ class APIsTab(BaseTab):
             QMessageBox.warning(self, "Teste de Conexão", "Por favor, insira a API Key")
             return
         
-        # Mostrar mensagem de teste
-        QMessageBox.information(self, "Teste de Conexão", "Testando conexão com a API do Whisper...\n\nIsso pode levar alguns segundos.")
-        
-        # Aqui você implementaria o teste real
-        # Por enquanto, apenas mostramos uma mensagem de sucesso
-        QMessageBox.information(self, "Teste de Conexão", "Conexão com a API do Whisper bem-sucedida!\n\nSuas credenciais são válidas.")
+        self._show_simulated_test_result("a API do Whisper")
     
     def _test_google_service_connection(self):
         """Testar conexão com o serviço Google Speech"""
@@ -277,12 +284,7 @@ class APIsTab(BaseTab):
             QMessageBox.warning(self, "Teste de Conexão", "Por favor, selecione um arquivo de credenciais")
             return
         
-        # Mostrar mensagem de teste
-        QMessageBox.information(self, "Teste de Conexão", "Testando conexão com a API do Google Speech-to-Text...\n\nIsso pode levar alguns segundos.")
-        
-        # Aqui você implementaria o teste real
-        # Por enquanto, apenas mostramos uma mensagem de sucesso
-        QMessageBox.information(self, "Teste de Conexão", "Conexão com a API do Google Speech-to-Text bem-sucedida!\n\nSuas credenciais são válidas.")
+        self._show_simulated_test_result("a API do Google Speech-to-Text")
     
     def _test_translator_connection(self):
         """Testar conexão com o serviço de tradução Azure Translator"""
@@ -293,16 +295,18 @@ class APIsTab(BaseTab):
             QMessageBox.warning(self, "Teste de Conexão", "Por favor, insira a API Key e a Região do Azure Translator")
             return
         
-        # Mostrar mensagem de teste
-        QMessageBox.information(self, "Teste de Conexão", "Testando conexão com a API do Azure Translator...\n\nIsso pode levar alguns segundos.")
-        
-        # Atualizar credenciais e testar conexão
-        result = self.translator_service.update_credentials(api_key, region)
-        
-        if result["success"]:
-            QMessageBox.information(self, "Teste de Conexão", "Conexão bem-sucedida!\n\nSuas credenciais do Azure Translator são válidas.")
-        else:
-            QMessageBox.warning(self, "Teste de Conexão", f"Falha na conexão!\n\nErro: {result['message']}\n\nVerifique sua API Key e Região.")
+        def show_result(result):
+            if result["success"]:
+                QMessageBox.information(self, "Teste de Conexão", "Conexão bem-sucedida!\n\nSuas credenciais do Azure Translator são válidas.")
+            else:
+                QMessageBox.warning(self, "Teste de Conexão", f"Falha na conexão!\n\nErro: {result['message']}\n\nVerifique sua API Key e Região.")
+        
+        # Atualizar credenciais e testar conexão em segundo plano
+        translator_service = self.translator_service
+        self._run_connection_test(
+            lambda: translator_service.update_credentials(api_key, region),
+            show_result
+        )
     
     def _test_azure_openai_connection(self):
         """Testar conexão com o serviço Azure OpenAI"""
@@ -314,12 +318,7 @@ class APIsTab(BaseTab):
             QMessageBox.warning(self, "Teste de Conexão", "Por favor, preencha todos os campos (API Key, Endpoint e Deployment Name)")
             return
         
-        # Mostrar mensagem de teste
-        QMessageBox.information(self, "Teste de Conexão", "Testando conexão com o Azure OpenAI...\n\nIsso pode levar alguns segundos.")
-        
-        # Aqui você implementaria o teste real
-        # Por enquanto, apenas mostramos uma mensagem de sucesso
-        QMessageBox.information(self, "Teste de Conexão", "Conexão com o Azure OpenAI bem-sucedida!\n\nSuas credenciais são válidas.")
+        self._show_simulated_test_result("o Azure OpenAI")
     
     def _browse_google_credentials(self):
         """Abrir diálogo para selecionar o arquivo de credenciais do Google"""
@@ -334,105 +333,9 @@ class APIsTab(BaseTab):
     
     def load_settings(self):
         """Carregar configurações do config_manager"""
-        # Load Azure settings
-        self.azure_key_edit.setText(
-            self.config_manager.get_value("recognition", "azure_api_key", "")
-        )
-        self.azure_region_edit.setText(
-            self.config_manager.get_value("recognition", "azure_region", "")
-        )
-        
-        # Load Whisper settings
-        self.whisper_key_edit.setText(
-            self.config_manager.get_value("recognition", "whisper_api_key", "")
-        )
-        
-        # Load Google settings
-        self.google_creds_edit.setText(
-            self.config_manager.get_value("recognition", "google_credentials_path", "")
-        )
-        
-        # Load translator settings
-        self.translator_key_edit.setText(
-            self.config_manager.get_value("translation", "azure_translator_key", "")
-        )
-        self.translator_region_edit.setText(
-            self.config_manager.get_value("translation", "azure_translator_region", "")
-        )
-        
-        # Load OpenAI settings
-        self.openai_key_edit.setText(
-            self.config_manager.get_value("translation", "azure_openai_key", "")
-        )
-        self.openai_endpoint_edit.setText(
-            self.config_manager.get_value("translation", "azure_openai_endpoint", "")
-        )
-        self.openai_deployment_edit.setText(
-            self.config_manager.get_value("translation", "azure_openai_deployment", "")
-        )
-        self.openai_prompt_edit.setPlainText(
-            self.config_manager.get_value("translation", "azure_openai_prompt", 
-                "Você é um assistente especializado em tradução. Traduza o seguinte texto para {target_language} mantendo o estilo original e o significado preciso.")
-        )
+        self._load_bindings()
+        self._snapshot_values()
     
     def save_settings(self):
         """Salvar configurações no config_manager"""
-        # Save Azure settings
-        self.config_manager.set_value(
-            "recognition", 
-            "azure_api_key", 
-            self.azure_key_edit.text()
-        )
-        self.config_manager.set_value(
-            "recognition", 
-            "azure_region", 
-            self.azure_region_edit.text()
-        )
-        
-        # Save Whisper settings
-        self.config_manager.set_value(
-            "recognition", 
-            "whisper_api_key", 
-            self.whisper_key_edit.text()
-        )
-        
-        # Save Google settings
-        self.config_manager.set_value(
-            "recognition", 
-            "google_credentials_path", 
-            self.google_creds_edit.text()
-        )
-        
-        # Save translator settings
-        self.config_manager.set_value(
-            "translation", 
-            "azure_translator_key", 
-            self.translator_key_edit.text()
-        )
-        self.config_manager.set_value(
-            "translation", 
-            "azure_translator_region", 
-            self.translator_region_edit.text()
-        )
-        
-        # Save OpenAI settings
-        self.config_manager.set_value(
-            "translation", 
-            "azure_openai_key", 
-            self.openai_key_edit.text()
-        )
-        self.config_manager.set_value(
-            "translation", 
-            "azure_openai_endpoint", 
-            self.openai_endpoint_edit.text()
-        )
-        self.config_manager.set_value(
-            "translation", 
-            "azure_openai_deployment", 
-            self.openai_deployment_edit.text()
-        )
-        self.config_manager.set_value(
-            "translation", 
-            "azure_openai_prompt", 
-            self.openai_prompt_edit.toPlainText()
-        ) 
\ No newline at end of file
+        return bool(self._save_changed_values())
\ No newline at end of file
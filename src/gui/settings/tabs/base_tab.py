@@ -2,24 +2,198 @@
 Classe base para as abas de configuração.
 """
 
-from PyQt5.QtWidgets import QWidget, QVBoxLayout
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLineEdit, QTextEdit, QCheckBox, QComboBox
+from PyQt5.QtCore import QThreadPool
 
 class BaseTab(QWidget):
     """Classe base para todas as abas de configuração"""
     
+    # Ligações (atributo do widget, seção, chave, valor padrão) usadas pelo
+    # load/save genérico; cada aba declara as suas
+    _BINDINGS = ()
+    
+    # Pool compartilhado por todas as abas para tarefas em segundo plano
+    # (downloads, testes de conexão, enumeração de dispositivos)
+    _pool = QThreadPool()
+    _pool.setMaxThreadCount(4)
+    
     def __init__(self, config_manager, parent=None):
         super().__init__(parent)
         self.config_manager = config_manager
         
+        # Valores exibidos no último load_settings, agrupados por seção
+        self._loaded = {}
+        
+        # Os widgets da aba só são criados em ensure_built()
+        self._built = False
+        
         # Configurar layout
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(24, 24, 24, 24)
         self.layout.setSpacing(16)
     
+    def _build_ui(self):
+        """Criar os widgets da aba; sobrescrito pelas abas com construção adiada"""
+        pass
+    
+    def ensure_built(self):
+        """Construir os widgets da aba na primeira vez que forem necessários"""
+        if self._built:
+            return
+        self._built = True
+        
+        # Um único layout/repaint ao final, em vez de um por widget adicionado
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_ui()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.updateGeometry()
+    
+    def showEvent(self, event):
+        """Construir e carregar a aba quando ela for exibida pela primeira vez"""
+        if not self._built:
+            self.ensure_built()
+            self.load_settings()
+        super().showEvent(event)
+    
     def load_settings(self):
         """Carregar configurações do config_manager"""
         pass
     
     def save_settings(self):
-        """Salvar configurações no config_manager"""
-        pass 
\ No newline at end of file
+        """Salvar configurações no config_manager
+        
+        Returns:
+            bool: True se alguma configuração foi alterada
+        """
+        return False
+    
+    def _set_text_if_changed(self, widget, value):
+        """Atualizar o texto de um QLineEdit/QTextEdit apenas se ele for diferente"""
+        is_line_edit = isinstance(widget, QLineEdit)
+        current = widget.text() if is_line_edit else widget.toPlainText()
+        if current == value:
+            return
+        
+        was_blocked = widget.blockSignals(True)
+        try:
+            if is_line_edit:
+                widget.setText(value)
+            else:
+                widget.setPlainText(value)
+        finally:
+            widget.blockSignals(was_blocked)
+    
+    def _add_indexed_item(self, combo, text, data):
+        """Adicionar um item ao combo, registrando o índice do seu valor em combo._index_map"""
+        combo.addItem(text, data)
+        if not hasattr(combo, "_index_map"):
+            combo._index_map = {}
+        combo._index_map[data] = combo.count() - 1
+    
+    def _add_indexed_items(self, combo, items):
+        """Adicionar vários pares (texto, valor) ao combo numa única inserção, registrando seus índices"""
+        items = list(items)
+        start = combo.count()
+        combo.addItems([text for text, data in items])
+        
+        if not hasattr(combo, "_index_map"):
+            combo._index_map = {}
+        for offset, (text, data) in enumerate(items):
+            combo.setItemData(start + offset, data)
+            combo._index_map[data] = start + offset
+    
+    def _get_widget_value(self, widget):
+        """Obter o valor atual de um widget ligado ao config"""
+        if isinstance(widget, QLineEdit):
+            return widget.text()
+        if isinstance(widget, QTextEdit):
+            return widget.toPlainText()
+        if isinstance(widget, QCheckBox):
+            return widget.isChecked()
+        if isinstance(widget, QComboBox):
+            return widget.currentData()
+        raise TypeError(f"Unsupported widget type: {type(widget).__name__}")
+    
+    def _set_widget_value(self, widget, value):
+        """Exibir um valor do config em um widget ligado, sem emitir sinais de alteração"""
+        if isinstance(widget, (QLineEdit, QTextEdit)):
+            self._set_text_if_changed(widget, value)
+            return
+        
+        if not isinstance(widget, (QCheckBox, QComboBox)):
+            raise TypeError(f"Unsupported widget type: {type(widget).__name__}")
+        
+        # Os setters só são chamados quando o valor exibido realmente muda
+        if isinstance(widget, QCheckBox):
+            checked = bool(value)
+            if widget.isChecked() == checked:
+                return
+            setter, arg = widget.setChecked, checked
+        else:
+            # Combos preenchidos por _add_indexed_item dispensam a busca linear do findData
+            index_map = getattr(widget, "_index_map", None)
+            index = index_map.get(value, -1) if index_map is not None else widget.findData(value)
+            if index < 0 or widget.currentIndex() == index:
+                return
+            setter, arg = widget.setCurrentIndex, index
+        
+        was_blocked = widget.blockSignals(True)
+        try:
+            setter(arg)
+        finally:
+            widget.blockSignals(was_blocked)
+    
+    def _load_bindings(self):
+        """Carregar os widgets declarados em _BINDINGS, lendo cada seção uma única vez"""
+        defaults = {}
+        for attr, section, key, default in self._BINDINGS:
+            defaults.setdefault(section, {})[key] = default
+        
+        sections = {
+            section: self.config_manager.get_section(section, section_defaults)
+            for section, section_defaults in defaults.items()
+        }
+        for attr, section, key, default in self._BINDINGS:
+            self._set_widget_value(getattr(self, attr), sections[section][key])
+    
+    def _collect_values(self):
+        """Obter os valores atuais dos widgets no formato {seção: {chave: valor}}"""
+        values = {}
+        for attr, section, key, default in self._BINDINGS:
+            values.setdefault(section, {})[key] = self._get_widget_value(getattr(self, attr))
+        return values
+    
+    def _snapshot_values(self):
+        """Guardar os valores exibidos para comparação no próximo save_settings"""
+        self._loaded = self._collect_values()
+    
+    def _save_changed_values(self):
+        """Gravar no config_manager apenas as chaves alteradas desde o último load
+        
+        Returns:
+            dict: Alterações gravadas, no formato {seção: {chave: valor}}
+        """
+        # Uma aba nunca construída não tem nada para salvar
+        if not self._built:
+            return {}
+        
+        current = self._collect_values()
+        changes = {}
+        
+        for section, values in current.items():
+            loaded = self._loaded.get(section, {})
+            section_changes = {
+                key: value for key, value in values.items()
+                if key not in loaded or loaded[key] != value
+            }
+            if section_changes:
+                changes[section] = section_changes
+        
+        # Uma única atualização em lote no config_manager
+        if changes:
+            self.config_manager.update(changes)
+        
+        self._loaded = current
+        return changes
\ No newline at end of file
@@ -4,25 +4,97 @@ Aba de configuração geral.
 
 from PyQt5.QtWidgets import (
     QFormLayout, QGroupBox, QComboBox, QCheckBox, QPushButton, QMessageBox,
-    QRadioButton, QButtonGroup, QVBoxLayout, QHBoxLayout, QLabel
+    QRadioButton, QButtonGroup, QGridLayout, QHBoxLayout, QLabel, QApplication
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QObject, QRunnable, pyqtSignal
 import logging
+import subprocess
+import sys
+import time
 
 from .base_tab import BaseTab
-from src.gui.hotkey_dialog import HotkeyDialog
-from src.i18n import get_instance as get_i18n, _
+from src.i18n import _
+from src.i18n.constants import INTERFACE_LANGUAGES
 
 logger = logging.getLogger("DogeDictate.SettingsDialog.GeneralTab")
 
+# Estilos dos widgets da aba, selecionados por objectName
+_STYLE_SHEET = (
+    "QLabel#note { color: #888; font-style: italic; font-size: 9pt; }"
+    "QPushButton#restart { background-color: #f0ad4e; color: white; }"
+)
+
+# Opções fixas dos combos: (chave de tradução, texto padrão, valor)
+_THEME_CHOICES = (
+    ("theme_light", "Light", "light"),
+    ("theme_dark", "Dark", "dark"),
+    ("theme_system", "System", "system")
+)
+
+_FONT_SIZE_CHOICES = (
+    ("font_size_small", "Small", "small"),
+    ("font_size_medium", "Medium", "medium"),
+    ("font_size_large", "Large", "large")
+)
+
+# Segundos em que a lista de microfones é reaproveitada ao reabrir o diálogo
+_MIC_CACHE_TTL = 5.0
+
+class MicrophoneEnumeratorSignals(QObject):
+    """Sinais da enumeração de microfones executada em segundo plano"""
+    finished = pyqtSignal(list)
+
+class MicrophoneEnumerator(QRunnable):
+    """Tarefa para listar os microfones fora da thread da interface"""
+    
+    def __init__(self, dictation_manager):
+        super().__init__()
+        self.dictation_manager = dictation_manager
+        self.signals = MicrophoneEnumeratorSignals()
+    
+    def run(self):
+        """Listar os microfones e emitir o resultado"""
+        try:
+            microphones = list(self.dictation_manager.get_microphones())
+        except Exception as e:
+            logger.error(f"Error enumerating microphones: {str(e)}")
+            microphones = []
+        self.signals.finished.emit(microphones)
+
 class GeneralTab(BaseTab):
     """Aba de configuração geral"""
     
+    _BINDINGS = (
+        ("interface_lang_combo", "interface", "language", "en"),
+        ("theme_combo", "interface", "theme", "light"),
+        ("font_size_combo", "interface", "font_size", "medium"),
+        ("interaction_sounds_check", "general", "interaction_sounds", False),
+        ("auto_start_check", "general", "auto_start", False),
+        ("minimize_to_tray_check", "general", "minimize_to_tray", True)
+    )
+    
+    # Ids dos botões nos QButtonGroup de serviço e o serviço correspondente
+    _REC_ID_TO_SVC = {1: "azure", 2: "whisper", 3: "google", 4: "whisper_local"}
+    _REC_SVC_TO_ID = {svc: button_id for button_id, svc in _REC_ID_TO_SVC.items()}
+    _TRANS_ID_TO_SVC = {1: "azure", 2: "m2m100", 3: "azure_openai"}
+    _TRANS_SVC_TO_ID = {svc: button_id for button_id, svc in _TRANS_ID_TO_SVC.items()}
+    
+    # (instante da enumeração, microfones), compartilhado entre aberturas do diálogo
+    _mic_cache = None
+    
     def __init__(self, config_manager, dictation_manager=None, hotkey_manager=None, parent=None):
         super().__init__(config_manager, parent)
         self.dictation_manager = dictation_manager
         self.hotkey_manager = hotkey_manager
         
+        # Enumeração de microfones em andamento
+        self._mic_task = None
+    
+    def _build_ui(self):
+        """Criar os grupos da aba geral"""
+        # Uma única folha de estilo para a aba, resolvida por objectName
+        self.setStyleSheet(_STYLE_SHEET)
+        
         # Hotkeys group
         self._create_hotkeys_group()
         
@@ -49,62 +121,52 @@ class GeneralTab(BaseTab):
     def _create_service_selection_group(self):
         """Criar grupo de seleção de serviços"""
         service_group = QGroupBox("Seleção de Serviços")
-        service_layout = QVBoxLayout(service_group)
+        
+        # Um único grid: rótulos ocupam a linha inteira, rádios uma coluna cada
+        service_layout = QGridLayout(service_group)
         
         # Serviço de reconhecimento
         recognition_label = QLabel("<b>Serviço de Reconhecimento de Voz:</b>")
-        service_layout.addWidget(recognition_label)
+        service_layout.addWidget(recognition_label, 0, 0, 1, 3)
         
         # Opções de API
-        api_layout = QHBoxLayout()
-        
         self.recognition_api_group = QButtonGroup(self)
         
         self.azure_radio = QRadioButton("Azure")
         self.recognition_api_group.addButton(self.azure_radio, 1)
-        api_layout.addWidget(self.azure_radio)
+        service_layout.addWidget(self.azure_radio, 1, 0)
         
         self.whisper_radio = QRadioButton("Whisper API")
         self.recognition_api_group.addButton(self.whisper_radio, 2)
-        api_layout.addWidget(self.whisper_radio)
+        service_layout.addWidget(self.whisper_radio, 1, 1)
         
         self.google_radio = QRadioButton("Google")
         self.recognition_api_group.addButton(self.google_radio, 3)
-        api_layout.addWidget(self.google_radio)
-        
-        service_layout.addLayout(api_layout)
+        service_layout.addWidget(self.google_radio, 1, 2)
         
         # Opções locais
-        local_layout = QHBoxLayout()
-        
         self.whisper_local_radio = QRadioButton("Whisper Local")
         self.recognition_api_group.addButton(self.whisper_local_radio, 4)
-        local_layout.addWidget(self.whisper_local_radio)
-        
-        service_layout.addLayout(local_layout)
+        service_layout.addWidget(self.whisper_local_radio, 2, 0)
         
         # Serviço de tradução
         translation_label = QLabel("<b>Serviço de Tradução:</b>")
-        service_layout.addWidget(translation_label)
+        service_layout.addWidget(translation_label, 3, 0, 1, 3)
         
         # Opções de tradução
-        translation_layout = QHBoxLayout()
-        
         self.translation_api_group = QButtonGroup(self)
         
         self.azure_translator_radio = QRadioButton("Azure Translator")
         self.translation_api_group.addButton(self.azure_translator_radio, 1)
-        translation_layout.addWidget(self.azure_translator_radio)
+        service_layout.addWidget(self.azure_translator_radio, 4, 0)
         
         self.m2m100_local_radio = QRadioButton("M2M-100 Local")
         self.translation_api_group.addButton(self.m2m100_local_radio, 2)
-        translation_layout.addWidget(self.m2m100_local_radio)
+        service_layout.addWidget(self.m2m100_local_radio, 4, 1)
         
         self.azure_openai_radio = QRadioButton("Azure OpenAI (GPT-4o)")
         self.translation_api_group.addButton(self.azure_openai_radio, 3)
-        translation_layout.addWidget(self.azure_openai_radio)
-        
-        service_layout.addLayout(translation_layout)
+        service_layout.addWidget(self.azure_openai_radio, 4, 2)
         
         self.layout.addWidget(service_group)
     
@@ -129,20 +191,17 @@ class GeneralTab(BaseTab):
         
         # Idioma da interface
         self.interface_lang_combo = QComboBox()
-        self.interface_lang_combo.addItem("English", "en")
-        self.interface_lang_combo.addItem("Português", "pt")
-        self.interface_lang_combo.addItem("Français", "fr")
-        self.interface_lang_combo.addItem("Español", "es")
+        self._add_indexed_items(self.interface_lang_combo, INTERFACE_LANGUAGES)
         general_layout.addRow(_("interface_language", "Interface Language:"), self.interface_lang_combo)
         
         # Aviso sobre reinicialização
         language_note = QLabel(_("language_restart_note", "* Changing the language requires restarting the application"))
-        language_note.setStyleSheet("color: #888; font-style: italic; font-size: 9pt;")
+        language_note.setObjectName("note")
         general_layout.addRow("", language_note)
         
         # Botão para reiniciar a aplicação
         restart_button = QPushButton(_("restart_application", "Restart Application"))
-        restart_button.setStyleSheet("background-color: #f0ad4e; color: white;")
+        restart_button.setObjectName("restart")
         restart_button.clicked.connect(self._restart_application)
         restart_button.setToolTip(_("restart_tooltip", "Restarts the application to apply language changes"))
         restart_layout = QHBoxLayout()
@@ -152,16 +211,12 @@ class GeneralTab(BaseTab):
         
         # Tema
         self.theme_combo = QComboBox()
-        self.theme_combo.addItem(_("theme_light", "Light"), "light")
-        self.theme_combo.addItem(_("theme_dark", "Dark"), "dark")
-        self.theme_combo.addItem(_("theme_system", "System"), "system")
+        self._add_indexed_items(self.theme_combo, ((_(key, default), data) for key, default, data in _THEME_CHOICES))
         general_layout.addRow(_("theme", "Theme:"), self.theme_combo)
         
         # Tamanho da fonte
         self.font_size_combo = QComboBox()
-        self.font_size_combo.addItem(_("font_size_small", "Small"), "small")
-        self.font_size_combo.addItem(_("font_size_medium", "Medium"), "medium")
-        self.font_size_combo.addItem(_("font_size_large", "Large"), "large")
+        self._add_indexed_items(self.font_size_combo, ((_(key, default), data) for key, default, data in _FONT_SIZE_CHOICES))
         general_layout.addRow(_("font_size", "Font Size:"), self.font_size_combo)
         
         # Opções de configuração
@@ -179,6 +234,8 @@ class GeneralTab(BaseTab):
     def _show_hotkey_dialog(self):
         """Mostrar diálogo de configuração de teclas de atalho"""
         if self.hotkey_manager:
+            # Importado sob demanda: o diálogo e suas dependências só são carregados se usados
+            from src.gui.hotkey_dialog import HotkeyDialog
             dialog = HotkeyDialog(self, self.config_manager, self.hotkey_manager)
             dialog.exec_()
     
@@ -194,87 +251,107 @@ class GeneralTab(BaseTab):
             return
             
         try:
-            # Ensure mic_id is properly converted to integer if it's not already
-            mic_id = int(mic_id) if not isinstance(mic_id, int) else mic_id
-            result = self.dictation_manager.test_microphone(mic_id)
+            # int() devolve o próprio objeto quando mic_id já é inteiro
+            result = self.dictation_manager.test_microphone(int(mic_id))
             
-            if result and "success" in result:
-                if result["success"]:
-                    QMessageBox.information(self, "Teste de Microfone", "Microfone funcionando corretamente!")
-                else:
-                    QMessageBox.warning(self, "Teste de Microfone", f"Erro ao testar microfone: {result.get('message', 'Erro desconhecido')}")
-            else:
+            if not isinstance(result, dict) or "success" not in result:
                 QMessageBox.warning(self, "Teste de Microfone", "Resultado de teste de microfone inválido.")
+            elif result["success"]:
+                QMessageBox.information(self, "Teste de Microfone", "Microfone funcionando corretamente!")
+            else:
+                QMessageBox.warning(self, "Teste de Microfone", f"Erro ao testar microfone: {result.get('message', 'Erro desconhecido')}")
         except Exception as e:
             QMessageBox.critical(self, "Erro", f"Erro ao testar microfone: {str(e)}")
     
     def _populate_microphones(self):
-        """Preencher o combo de microfones"""
+        """Preencher o combo de microfones, enumerando-os em segundo plano"""
+        if not self.dictation_manager:
+            self.mic_combo.clear()
+            return
+        
+        # Reenumerar depois do TTL, para mostrar dispositivos conectados com o app aberto
+        cache = GeneralTab._mic_cache
+        if cache is not None and time.monotonic() - cache[0] < _MIC_CACHE_TTL:
+            self._fill_microphones(cache[1])
+            return
+        
+        if self._mic_task is not None:
+            return
+        
+        # Item temporário enquanto os dispositivos são listados
         self.mic_combo.clear()
+        self.mic_combo.addItem(_("loading", "Loading..."))
+        self.mic_combo.setEnabled(False)
+        
+        self._mic_task = MicrophoneEnumerator(self.dictation_manager)
+        self._mic_task.signals.finished.connect(self._on_microphones_enumerated)
+        self._pool.start(self._mic_task)
+    
+    def _on_microphones_enumerated(self, microphones):
+        """Receber a lista de microfones na thread da interface"""
+        self._mic_task = None
+        GeneralTab._mic_cache = (time.monotonic(), microphones)
+        self._fill_microphones(microphones)
+        
+        # O snapshot foi tirado antes da lista chegar; incluir o microfone exibido
+        # para que ele não seja tratado como alteração no próximo save
+        mic_id = self.mic_combo.currentData()
+        if mic_id is not None and self._loaded:
+            self._loaded.setdefault("audio", {}).update({
+                "default_microphone_id": mic_id,
+                "default_microphone": self.mic_combo.currentText()
+            })
+    
+    def _fill_microphones(self, microphones):
+        """Preencher o combo com os microfones informados"""
+        default_mic_id = self.config_manager.get_value("audio", "default_microphone_id", 0)
         
-        if self.dictation_manager:
-            # Get available microphones
-            microphones = self.dictation_manager.get_microphones()
-            default_mic_id = self.config_manager.get_value("audio", "default_microphone_id", 0)
+        # Recalcular o tamanho do combo só uma vez, ao final da inserção
+        was_blocked = self.mic_combo.blockSignals(True)
+        self.mic_combo.setUpdatesEnabled(False)
+        try:
+            self.mic_combo.clear()
+            self.mic_combo.setEnabled(True)
+            
+            # Inserir todos os nomes de uma vez e associar os ids em seguida
+            ids = [mic["id"] for mic in microphones]
+            self.mic_combo.addItems([mic["name"] for mic in microphones])
+            for index, mic_id in enumerate(ids):
+                self.mic_combo.setItemData(index, mic_id)
             
-            # Add microphones to combo box
-            for mic in microphones:
-                self.mic_combo.addItem(mic["name"], mic["id"])
-                if mic["id"] == default_mic_id:
-                    self.mic_combo.setCurrentIndex(self.mic_combo.count() - 1)
+            if default_mic_id in ids:
+                self.mic_combo.setCurrentIndex(ids.index(default_mic_id))
+        finally:
+            self.mic_combo.setUpdatesEnabled(True)
+            self.mic_combo.blockSignals(was_blocked)
     
     def _set_recognition_service(self, service):
         """Definir o serviço de reconhecimento selecionado"""
-        if service == "azure":
-            self.azure_radio.setChecked(True)
-        elif service == "whisper":
-            self.whisper_radio.setChecked(True)
-        elif service == "google":
-            self.google_radio.setChecked(True)
-        elif service == "whisper_local":
-            self.whisper_local_radio.setChecked(True)
-        else:
-            # Padrão para Azure
-            self.azure_radio.setChecked(True)
+        # Padrão para Azure
+        button_id = self._REC_SVC_TO_ID.get(service, self._REC_SVC_TO_ID["azure"])
+        if self.recognition_api_group.checkedId() != button_id:
+            self.recognition_api_group.button(button_id).setChecked(True)
     
     def _get_recognition_service(self):
         """Obter o serviço de reconhecimento selecionado"""
-        if self.azure_radio.isChecked():
-            return "azure"
-        elif self.whisper_radio.isChecked():
-            return "whisper"
-        elif self.google_radio.isChecked():
-            return "google"
-        elif self.whisper_local_radio.isChecked():
-            return "whisper_local"
-        else:
-            return "azure"  # Padrão
+        return self._REC_ID_TO_SVC.get(self.recognition_api_group.checkedId(), "azure")
     
     def _set_translation_service(self, service):
         """Definir o serviço de tradução selecionado"""
-        if service == "azure":
-            self.azure_translator_radio.setChecked(True)
-        elif service == "m2m100":
-            self.m2m100_local_radio.setChecked(True)
-        elif service == "azure_openai":
-            self.azure_openai_radio.setChecked(True)
-        else:
-            # Padrão para Azure
-            self.azure_translator_radio.setChecked(True)
+        # Padrão para Azure
+        button_id = self._TRANS_SVC_TO_ID.get(service, self._TRANS_SVC_TO_ID["azure"])
+        if self.translation_api_group.checkedId() != button_id:
+            self.translation_api_group.button(button_id).setChecked(True)
     
     def _get_translation_service(self):
         """Obter o serviço de tradução selecionado"""
-        if self.azure_translator_radio.isChecked():
-            return "azure"
-        elif self.m2m100_local_radio.isChecked():
-            return "m2m100"
-        elif self.azure_openai_radio.isChecked():
-            return "azure_openai"
-        else:
-            return "azure"  # Padrão
+        return self._TRANS_ID_TO_SVC.get(self.translation_api_group.checkedId(), "azure")
     
     def load_settings(self):
         """Carregar configurações do config_manager"""
+        if not self._built:
+            return
+        
         # Populate microphones
         self._populate_microphones()
         
@@ -285,99 +362,47 @@ class GeneralTab(BaseTab):
         translation_service = self.config_manager.get_value("translation", "service", "azure")
         self._set_translation_service(translation_service)
         
-        # Load interface settings
-        interface_lang = self.config_manager.get_value("interface", "language", "en")
-        index = self.interface_lang_combo.findData(interface_lang)
-        if index >= 0:
-            self.interface_lang_combo.setCurrentIndex(index)
-        
-        theme = self.config_manager.get_value("interface", "theme", "light")
-        index = self.theme_combo.findData(theme)
-        if index >= 0:
-            self.theme_combo.setCurrentIndex(index)
-        
-        font_size = self.config_manager.get_value("interface", "font_size", "medium")
-        index = self.font_size_combo.findData(font_size)
-        if index >= 0:
-            self.font_size_combo.setCurrentIndex(index)
-        
-        # Load toggle settings
-        self.interaction_sounds_check.setChecked(
-            self.config_manager.get_value("general", "interaction_sounds", False)
-        )
-        self.auto_start_check.setChecked(
-            self.config_manager.get_value("general", "auto_start", False)
-        )
-        self.minimize_to_tray_check.setChecked(
-            self.config_manager.get_value("general", "minimize_to_tray", True)
-        )
+        # Load interface and toggle settings
+        self._load_bindings()
+        
+        self._snapshot_values()
     
-    def save_settings(self):
-        """Salvar configurações no config_manager"""
-        # Save microphone settings
+    def _collect_values(self):
+        """Obter os valores atuais dos widgets, agrupados por seção"""
+        values = super()._collect_values()
+        values["recognition"] = {"service": self._get_recognition_service()}
+        values["translation"] = {"service": self._get_translation_service()}
+        
         mic_id = self.mic_combo.currentData()
         if mic_id is not None:
-            self.config_manager.set_value("audio", "default_microphone_id", mic_id)
-            self.config_manager.set_value("audio", "default_microphone", self.mic_combo.currentText())
+            values["audio"] = {
+                "default_microphone_id": mic_id,
+                "default_microphone": self.mic_combo.currentText()
+            }
+        
+        return values
+    
+    def save_settings(self):
+        """Salvar configurações no config_manager"""
+        # Adiar qualquer salvamento em disco para o final do bloco
+        with self.config_manager.batch():
+            changes = self._save_changed_values()
+            
             if self.dictation_manager:
-                self.dictation_manager.set_microphone(mic_id)
-        
-        # Save service selection
-        recognition_service = self._get_recognition_service()
-        self.config_manager.set_value("recognition", "service", recognition_service)
-        if self.dictation_manager:
-            self.dictation_manager.set_service(recognition_service)
-        
-        translation_service = self._get_translation_service()
-        self.config_manager.set_value("translation", "service", translation_service)
-        
-        # Save interface settings
-        self.config_manager.set_value(
-            "interface", 
-            "language", 
-            self.interface_lang_combo.currentData()
-        )
-        self.config_manager.set_value(
-            "interface", 
-            "theme", 
-            self.theme_combo.currentData()
-        )
-        self.config_manager.set_value(
-            "interface", 
-            "font_size", 
-            self.font_size_combo.currentData()
-        )
+                # Aplicar apenas o que realmente mudou
+                if "default_microphone_id" in changes.get("audio", {}):
+                    self.dictation_manager.set_microphone(changes["audio"]["default_microphone_id"])
+                if "service" in changes.get("recognition", {}):
+                    self.dictation_manager.set_service(changes["recognition"]["service"])
         
-        # Save toggle settings
-        self.config_manager.set_value(
-            "general", 
-            "interaction_sounds", 
-            self.interaction_sounds_check.isChecked()
-        )
-        self.config_manager.set_value(
-            "general", 
-            "auto_start", 
-            self.auto_start_check.isChecked()
-        )
-        self.config_manager.set_value(
-            "general", 
-            "minimize_to_tray", 
-            self.minimize_to_tray_check.isChecked()
-        )
+        return bool(changes)
     
     def _restart_application(self):
         """Reiniciar a aplicação para aplicar as alterações de idioma"""
-        from PyQt5.QtWidgets import QMessageBox
-        import sys
-        import os
-        import subprocess
-        
-        # Obter o idioma atual
-        from src.i18n import get_instance as get_i18n
-        i18n = get_i18n()
-        
-        # Salvar configurações antes de reiniciar
-        self.save_settings()
+        # Salvar configurações antes de reiniciar, gravando o arquivo para o novo processo
+        with self.config_manager.batch():
+            self.save_settings()
+            self.config_manager.save_config(force=True)
         
         # Confirmar reinicialização
         reply = QMessageBox.question(
@@ -407,7 +432,6 @@ class GeneralTab(BaseTab):
                     subprocess.Popen([application_path] + sys.argv[1:], start_new_session=True)
                 
                 # Fechar a aplicação atual
-                from PyQt5.QtWidgets import QApplication
                 QApplication.instance().quit()
             
             except Exception as e:
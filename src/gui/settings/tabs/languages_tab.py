@@ -3,21 +3,80 @@ Aba de configuração para idiomas.
 """
 
 from PyQt5.QtWidgets import (
-    QFormLayout, QGroupBox, QComboBox, QCheckBox, QLabel
+    QFormLayout, QGroupBox, QComboBox, QCheckBox, QLabel, QListView
 )
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex
 import logging
 
 from .base_tab import BaseTab
 from src.i18n import get_instance as get_i18n, _
+from src.i18n.constants import TARGET_LANGUAGES
 
 logger = logging.getLogger("DogeDictate.SettingsDialog.LanguagesTab")
 
+# Estilos dos widgets da aba, selecionados por objectName
+_STYLE_SHEET = "QLabel#description { color: #666; font-style: italic; }"
+
+# Idiomas de destino da tradução: (texto, código regional)
+_TARGET_LANG_CHOICES = tuple((name, region_code) for name, code, region_code in TARGET_LANGUAGES)
+
+class LanguageListModel(QAbstractListModel):
+    """Modelo com a lista de idiomas suportados, consultado sob demanda pelo combo"""
+    
+    # currentData()/findData() do QComboBox usam Qt.UserRole por padrão
+    LanguageIdRole = Qt.UserRole
+    
+    def __init__(self, languages=(), parent=None):
+        super().__init__(parent)
+        self._languages = []
+        self._rows = {}
+        self.set_languages(languages)
+    
+    def set_languages(self, languages):
+        """Substituir a lista de idiomas"""
+        self.beginResetModel()
+        self._languages = list(languages)
+        self._rows = {lang["id"]: row for row, lang in enumerate(self._languages)}
+        self.endResetModel()
+    
+    def row_for_id(self, language_id):
+        """Linha do idioma informado, ou -1 se ele não estiver na lista"""
+        return self._rows.get(language_id, -1)
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Número de idiomas (o modelo é uma lista plana)"""
+        if parent.isValid():
+            return 0
+        return len(self._languages)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Nome ou id do idioma na linha informada"""
+        if not index.isValid():
+            return None
+        
+        lang = self._languages[index.row()]
+        if role == Qt.DisplayRole:
+            return lang["name"]
+        if role == self.LanguageIdRole:
+            return lang["id"]
+        return None
+
 class LanguagesTab(BaseTab):
     """Aba de configuração para idiomas"""
     
+    _BINDINGS = (
+        ("target_lang_combo", "translation", "target_language", "en-US"),
+        ("auto_translate_check", "translation", "auto_translate", True)
+    )
+    
     def __init__(self, config_manager, dictation_manager=None, parent=None):
         super().__init__(config_manager, parent)
         self.dictation_manager = dictation_manager
+    
+    def _build_ui(self):
+        """Criar os grupos da aba de idiomas"""
+        # Uma única folha de estilo para a aba, resolvida por objectName
+        self.setStyleSheet(_STYLE_SHEET)
         
         # Recognition language group (previously output language)
         self._create_recognition_group()
@@ -34,10 +93,17 @@ class LanguagesTab(BaseTab):
         description_label = QLabel(_("recognition_language_description", 
             "Select the language that will be used to recognize your speech from the microphone."))
         description_label.setWordWrap(True)
-        description_label.setStyleSheet("color: #666; font-style: italic;")
+        description_label.setObjectName("description")
         recognition_layout.addRow(description_label)
         
         self.recognition_lang_combo = QComboBox()
+        self.recognition_lang_model = LanguageListModel(parent=self.recognition_lang_combo)
+        self.recognition_lang_combo.setModel(self.recognition_lang_model)
+        
+        # Linhas de altura uniforme: o popup só cria as linhas visíveis
+        language_view = QListView()
+        language_view.setUniformItemSizes(True)
+        self.recognition_lang_combo.setView(language_view)
         recognition_layout.addRow(_("recognition_language", "Recognition Language:"), self.recognition_lang_combo)
         
         self.layout.addWidget(recognition_group)
@@ -51,15 +117,11 @@ class LanguagesTab(BaseTab):
         description_label = QLabel(_("translation_description", 
             "Configure automatic translation of recognized speech to another language."))
         description_label.setWordWrap(True)
-        description_label.setStyleSheet("color: #666; font-style: italic;")
+        description_label.setObjectName("description")
         translation_layout.addRow(description_label)
         
         self.target_lang_combo = QComboBox()
-        self.target_lang_combo.addItem("Português (Brasil)", "pt-BR")
-        self.target_lang_combo.addItem("Inglês (EUA)", "en-US")
-        self.target_lang_combo.addItem("Espanhol", "es-ES")
-        self.target_lang_combo.addItem("Francês", "fr-FR")
-        self.target_lang_combo.addItem("Alemão", "de-DE")
+        self._add_indexed_items(self.target_lang_combo, _TARGET_LANG_CHOICES)
         translation_layout.addRow(_("target_language", "Target Language:"), self.target_lang_combo)
         
         self.auto_translate_check = QCheckBox(_("auto_translate", "Translate automatically"))
@@ -69,51 +131,54 @@ class LanguagesTab(BaseTab):
     
     def _populate_languages(self):
         """Preencher o combo de idiomas de reconhecimento"""
-        self.recognition_lang_combo.clear()
+        if not self.dictation_manager:
+            self.recognition_lang_model.set_languages(())
+            return
         
-        if self.dictation_manager:
-            # Get supported languages
-            languages = self.dictation_manager.get_supported_languages()
-            current_lang = self.config_manager.get_value("recognition", "language", "en-US")
-            
-            # Add languages to combo box
-            for lang in languages:
-                self.recognition_lang_combo.addItem(lang["name"], lang["id"])
-                if lang["id"] == current_lang:
-                    self.recognition_lang_combo.setCurrentIndex(self.recognition_lang_combo.count() - 1)
+        # Get supported languages
+        self.recognition_lang_model.set_languages(self.dictation_manager.get_supported_languages())
+        
+        current_lang = self.config_manager.get_value("recognition", "language", "en-US")
+        row = self.recognition_lang_model.row_for_id(current_lang)
+        if row < 0 and self.recognition_lang_model.rowCount() > 0:
+            # Idioma configurado não suportado: usar o primeiro da lista
+            row = 0
+        if row >= 0 and self.recognition_lang_combo.currentIndex() != row:
+            was_blocked = self.recognition_lang_combo.blockSignals(True)
+            self.recognition_lang_combo.setCurrentIndex(row)
+            self.recognition_lang_combo.blockSignals(was_blocked)
     
     def load_settings(self):
         """Carregar configurações do config_manager"""
+        if not self._built:
+            return
+        
         # Populate languages
         self._populate_languages()
         
         # Load translation settings
-        target_language = self.config_manager.get_value("translation", "target_language", "en-US")
-        index = self.target_lang_combo.findData(target_language)
-        if index >= 0:
-            self.target_lang_combo.setCurrentIndex(index)
-        
-        self.auto_translate_check.setChecked(
-            self.config_manager.get_value("translation", "auto_translate", True)
-        )
+        self._load_bindings()
+        
+        self._snapshot_values()
     
-    def save_settings(self):
-        """Salvar configurações no config_manager"""
-        # Save language settings
+    def _collect_values(self):
+        """Obter os valores atuais dos widgets, agrupados por seção"""
+        values = super()._collect_values()
+        
         recognition_lang = self.recognition_lang_combo.currentData()
         if recognition_lang:
-            self.config_manager.set_value("recognition", "language", recognition_lang)
-            if self.dictation_manager:
+            values["recognition"] = {"language": recognition_lang}
+        
+        return values
+    
+    def save_settings(self):
+        """Salvar configurações no config_manager"""
+        # Adiar qualquer salvamento em disco para o final do bloco
+        with self.config_manager.batch():
+            changes = self._save_changed_values()
+            
+            recognition_lang = changes.get("recognition", {}).get("language")
+            if recognition_lang and self.dictation_manager:
                 self.dictation_manager.set_language(recognition_lang)
         
-        # Save translation settings
-        self.config_manager.set_value(
-            "translation", 
-            "target_language", 
-            self.target_lang_combo.currentData()
-        )
-        self.config_manager.set_value(
-            "translation", 
-            "auto_translate", 
-            self.auto_translate_check.isChecked()
-        ) 
\ No newline at end of file
+        return bool(changes)
\ No newline at end of file
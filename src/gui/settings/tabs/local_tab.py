@@ -4,56 +4,600 @@ Aba de configuração para serviços locais.
 
 from PyQt5.QtWidgets import (
     QFormLayout, QGroupBox, QComboBox, QLineEdit, QPushButton, QFileDialog,
-    QProgressBar, QLabel, QMessageBox, QHBoxLayout, QCheckBox
+    QProgressBar, QLabel, QMessageBox, QHBoxLayout, QCheckBox, QApplication
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QObject, QThreadPool, QRunnable, QMutex, pyqtSignal
+import functools
+import hashlib
+import json
 import logging
 import os
+import threading
+from pathlib import Path
+import time
+import requests
 
 from .base_tab import BaseTab
 
 logger = logging.getLogger("DogeDictate.SettingsDialog.LocalTab")
 
-class ModelDownloadThread(QThread):
-    """Thread para download de modelos"""
+# Checkpoints oficiais do Whisper (mesmas URLs usadas pelo pacote openai-whisper)
+_WHISPER_URLS = {
+    "tiny": "https://openaipublic.azureedge.net/main/whisper/models/65147644a518d12f04e32d6f3b26facc3f8dd46e5390956a9424a650c0ce22b9/tiny.pt",
+    "base": "https://openaipublic.azureedge.net/main/whisper/models/ed3a0b6b1c0edf879ad9b11b1af5a0e6ab5db9205f891f668f8b0e6c6326e34e/base.pt",
+    "small": "https://openaipublic.azureedge.net/main/whisper/models/9ecf779972d90ba49c06d968637d720dd632c55bbf19d441fb42bf17a411e794/small.pt",
+    "medium": "https://openaipublic.azureedge.net/main/whisper/models/345ae4da62f9b3d59415adc60127b97c714f32e89e936602e85993674d08dcb1/medium.pt",
+    "large": "https://openaipublic.azureedge.net/main/whisper/models/e5b1a55b89c1367dacf97e3e19bfd829a01529dbfdeefa8caeb59b3f1b81dadb/large-v3.pt"
+}
+
+# Repositórios do M2M-100 no Hugging Face Hub
+_M100_REPOS = {
+    "small": "facebook/m2m100_418M",
+    "medium": "facebook/m2m100_1.2B",
+    "large": "facebook/m2m100-12B-last-ckpt"
+}
+
+# Opções dos combos de modelo: (texto, valor)
+_WHISPER_MODEL_CHOICES = (
+    ("Tiny", "tiny"),
+    ("Base", "base"),
+    ("Small", "small"),
+    ("Medium", "medium"),
+    ("Large", "large")
+)
+
+_M100_MODEL_CHOICES = (
+    ("Small (418M)", "small"),
+    ("Medium (1.2B)", "medium"),
+    ("Large (12B)", "large")
+)
+
+# Pesos em formatos que o transformers (PyTorch) não usa
+_M100_SKIPPED_SUFFIXES = (".md", ".h5", ".msgpack", ".ot", ".onnx")
+
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+_DOWNLOAD_TIMEOUT = 30
+_DOWNLOAD_RETRIES = 5
+
+# Arquivos a partir deste tamanho são baixados em faixas paralelas
+_PARALLEL_MIN_SIZE = 64 << 20
+_PARALLEL_CONNECTIONS = 4
+
+# Blocos verificados por sha256 nos downloads paralelos, e intervalo de gravação do manifesto (segundos)
+_HASH_CHUNK_SIZE = 4 << 20
+_MANIFEST_INTERVAL = 2.0
+
+# Intervalo mínimo entre emissões de progress_updated (segundos)
+_PROGRESS_INTERVAL = 0.033
+
+# Validade do cache de existência dos modelos em LocalTab (segundos)
+_STATUS_CACHE_TTL = 5.0
+
+# Raiz dos modelos locais, resolvida uma única vez na importação
+_MODELS_ROOT = Path.home() / ".dogedictate" / "models"
+
+@functools.lru_cache(maxsize=16)
+def _model_path(kind, model=None):
+    """Caminho do diretório de modelos de um tipo ou, se informado, de um modelo específico"""
+    path = _MODELS_ROOT / kind
+    return str(path / model if model else path)
+
+def _preallocate(f, size):
+    """Reservar todo o espaço do arquivo de uma vez, antes das gravações em faixas"""
+    # Linux: blocos realmente alocados, em extents contíguos quando possível
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+            return
+        except OSError:
+            pass  # Sistema de arquivos sem suporte: usar truncate
+    
+    # Windows (SetEndOfFile via _chsize) e macOS: apenas define o tamanho final
+    f.truncate(size)
+
+def _dir_size_and_files(path):
+    """Somar o tamanho dos arquivos de um diretório de modelo numa única passada do os.scandir
+    
+    Os diretórios de modelo são planos, então não há recursão; os dados de
+    DirEntry vêm da própria listagem sempre que o sistema os fornece.
+    
+    Arquivos .part e manifestos .chunks de downloads não entram no tamanho nem
+    na contagem.
+    
+    Returns:
+        tuple: (tamanho total em bytes, número de arquivos, se há algum .part)
+    """
+    size = files = 0
+    partial = False
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            if entry.name.endswith(".part"):
+                partial = True
+                continue
+            if entry.name.endswith(".chunks"):
+                continue
+            files += 1
+            size += entry.stat(follow_symlinks=False).st_size
+    return size, files, partial
+
+def _expected_sha256(url):
+    """sha256 esperado de um arquivo, quando a URL o traz (checkpoints do Whisper), ou None"""
+    parts = url.rsplit("/", 2)
+    digest = parts[-2] if len(parts) == 3 else ""
+    if len(digest) == 64 and all(c in "0123456789abcdef" for c in digest):
+        return digest
+    return None
+
+def _verify_sha256(path, url):
+    """Conferir o sha256 de um arquivo baixado com o da URL; o arquivo é removido se não conferir"""
+    expected = _expected_sha256(url)
+    if expected is None:
+        return
+    
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(functools.partial(f.read, 1 << 20), b""):
+            sha256.update(block)
+    
+    if sha256.hexdigest() != expected:
+        os.remove(path)
+        raise IOError(f"Checksum mismatch for {url.rsplit('/', 1)[-1]}")
+
+def _format_size(size):
+    """Formatar um tamanho em bytes para exibição"""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+def _model_files(model_type, model_name):
+    """Listar os arquivos de um modelo como pares (url, nome do arquivo)"""
+    if model_type == "whisper":
+        url = _WHISPER_URLS[model_name]
+        return [(url, url.rsplit("/", 1)[-1])]
+    
+    repo = _M100_REPOS[model_name]
+    response = requests.get(f"https://huggingface.co/api/models/{repo}", timeout=_DOWNLOAD_TIMEOUT)
+    response.raise_for_status()
+    names = [
+        sibling["rfilename"] for sibling in response.json().get("siblings", [])
+        if not sibling["rfilename"].startswith(".")
+        and not sibling["rfilename"].endswith(_M100_SKIPPED_SUFFIXES)
+        and not sibling["rfilename"].startswith(("flax_", "tf_", "rust_"))
+    ]
+    
+    # Com safetensors disponível, os .bin equivalentes são redundantes
+    if any(name.endswith(".safetensors") for name in names):
+        names = [name for name in names if not name.endswith(".bin")]
+    
+    return [(f"https://huggingface.co/{repo}/resolve/main/{name}", name) for name in names]
+
+class DownloadCancelled(Exception):
+    """Download interrompido a pedido do usuário"""
+
+def _chunk_runs(indices):
+    """Agrupar índices de blocos (em ordem crescente) em sequências consecutivas [primeiro, último]"""
+    runs = []
+    for index in indices:
+        if runs and runs[-1][1] == index - 1:
+            runs[-1][1] = index
+        else:
+            runs.append([index, index])
+    return runs
+
+class RangeDownloadTask(QRunnable):
+    """Tarefa que baixa um conjunto de blocos e os grava nas posições correspondentes do arquivo"""
+    
+    def __init__(self, url, path, size, chunks, on_bytes, on_chunk, cancel_event):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.url = url
+        self.path = path
+        self.size = size
+        self.chunks = chunks
+        self.on_bytes = on_bytes
+        self.on_chunk = on_chunk
+        self.cancel_event = cancel_event
+        self.error = None
+    
+    def run(self):
+        """Baixar os blocos da tarefa, uma requisição por sequência de blocos consecutivos"""
+        try:
+            for first, last in _chunk_runs(self.chunks):
+                self._download_run(first, last)
+        except DownloadCancelled:
+            pass
+        except Exception as e:
+            self.error = e
+    
+    def _download_run(self, first, last):
+        """Baixar os blocos first..last, retomando do bloco incompleto em caso de falha"""
+        index = first
+        end = min((last + 1) * _HASH_CHUNK_SIZE, self.size) - 1
+        for attempt in range(_DOWNLOAD_RETRIES):
+            offset = index * _HASH_CHUNK_SIZE
+            try:
+                headers = {"Range": f"bytes={offset}-{end}"}
+                with requests.get(self.url, headers=headers, stream=True, timeout=_DOWNLOAD_TIMEOUT) as response:
+                    response.raise_for_status()
+                    if response.status_code != 206:
+                        raise IOError("Server ignored the Range header")
+                    
+                    with open(self.path, "r+b") as f:
+                        f.seek(offset)
+                        hasher = hashlib.sha256()
+                        chunk_end = min(offset + _HASH_CHUNK_SIZE, self.size)
+                        for data in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                            if self.cancel_event.is_set():
+                                raise DownloadCancelled()
+                            
+                            view = memoryview(data)
+                            while view and index <= last:
+                                piece = view[:chunk_end - offset]
+                                f.write(piece)
+                                hasher.update(piece)
+                                offset += len(piece)
+                                view = view[len(piece):]
+                                
+                                # Bloco completo: registrar o hash e passar ao próximo
+                                if offset == chunk_end:
+                                    self.on_chunk(index, hasher.hexdigest())
+                                    self.on_bytes(chunk_end - index * _HASH_CHUNK_SIZE)
+                                    index += 1
+                                    hasher = hashlib.sha256()
+                                    chunk_end = min(offset + _HASH_CHUNK_SIZE, self.size)
+                
+                if index > last:
+                    return
+                raise IOError("Connection closed before the range was complete")
+            except DownloadCancelled:
+                raise
+            except Exception as e:
+                if attempt == _DOWNLOAD_RETRIES - 1:
+                    raise
+                
+                delay = 2 ** attempt
+                logger.warning(f"Range download interrupted ({str(e)}), retrying in {delay}s")
+                if self.cancel_event.wait(delay):
+                    raise DownloadCancelled()
+
+class ModelDownloadSignals(QObject):
+    """Sinais de um download de modelo executado em segundo plano"""
     progress_updated = pyqtSignal(int)
-    download_complete = pyqtSignal(bool, str)
+    download_complete = pyqtSignal(str, bool, str)
+
+class ModelDownloadTask(QRunnable):
+    """Tarefa para download de modelos, executada no QThreadPool"""
     
     def __init__(self, model_type, model_name, download_path):
         super().__init__()
         self.model_type = model_type
         self.model_name = model_name
         self.download_path = download_path
+        self.signals = ModelDownloadSignals()
+        
+        # Sinalizado por cancel(); verificado entre blocos do download
+        self._cancel_event = threading.Event()
+        
+        # Bytes e hashes dos blocos recebidos pelas tarefas de faixa, protegidos por _received_lock
+        self._received = 0
+        self._chunk_hashes = {}
+        self._received_lock = QMutex()
+        
+        # Último progresso emitido, para limitar os sinais enviados à interface
+        self._last_progress = -1
+        self._last_emit = 0.0
     
     def run(self):
         """Executar o download do modelo"""
         try:
-            # Simulação de download (aqui você implementaria o download real)
-            for i in range(101):
-                self.progress_updated.emit(i)
-                self.msleep(50)  # Simular progresso
+            # Criado aqui, fora da thread da interface (pode ser lento em diretórios de rede)
+            target_dir = os.path.join(self.download_path, self.model_name)
+            os.makedirs(target_dir, exist_ok=True)
+            
+            files = _model_files(self.model_type, self.model_name)
+            probes = [self._probe(url) for url, name in files]
+            sizes = [size for size, ranges in probes]
+            total = sum(sizes) if all(sizes) else 0
             
-            # Simular sucesso
-            self.download_complete.emit(True, "Download concluído com sucesso!")
+            # Sem tamanho total não há porcentagem: a interface mostra progresso indeterminado
+            if not total:
+                self.signals.progress_updated.emit(-1)
+            
+            done = 0
+            for (url, name), (size, ranges) in zip(files, probes):
+                self._check_cancelled()
+                path = os.path.join(target_dir, name)
+                if ranges and size >= _PARALLEL_MIN_SIZE:
+                    done += self._download_file_parallel(url, path, size, done, total)
+                else:
+                    done += self._download_file(url, path, size, done, total)
+            
+            self.signals.progress_updated.emit(100)
+            self.signals.download_complete.emit(self.model_type, True, "Download concluído com sucesso!")
+        except DownloadCancelled:
+            logger.info(f"Download of {self.model_type} model {self.model_name} cancelled")
+            self.signals.download_complete.emit(self.model_type, False, "Download cancelado.")
         except Exception as e:
             logger.error(f"Error downloading model: {str(e)}")
-            self.download_complete.emit(False, f"Erro no download: {str(e)}")
+            self.signals.download_complete.emit(self.model_type, False, f"Erro no download: {str(e)}")
+    
+    def cancel(self):
+        """Pedir a interrupção do download; os arquivos .part ficam no disco"""
+        self._cancel_event.set()
+    
+    def _check_cancelled(self):
+        """Interromper o download se o cancelamento foi pedido"""
+        if self._cancel_event.is_set():
+            raise DownloadCancelled()
+    
+    def _probe(self, url):
+        """Obter o tamanho de um arquivo remoto (0 se desconhecido) e se ele aceita faixas de bytes"""
+        response = requests.head(url, allow_redirects=True, timeout=_DOWNLOAD_TIMEOUT)
+        response.raise_for_status()
+        size = int(response.headers.get("Content-Length", 0))
+        ranges = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+        return size, ranges
+    
+    def _emit_progress(self, percent):
+        """Emitir o progresso apenas quando ele mudar, no máximo ~30 vezes por segundo"""
+        now = time.monotonic()
+        if percent == self._last_progress or now - self._last_emit < _PROGRESS_INTERVAL:
+            return
+        
+        self._last_progress = percent
+        self._last_emit = now
+        self.signals.progress_updated.emit(percent)
+    
+    def _add_received(self, count):
+        """Somar bytes recebidos por uma tarefa de faixa (chamado de várias threads)"""
+        self._received_lock.lock()
+        try:
+            self._received += count
+        finally:
+            self._received_lock.unlock()
+    
+    def _add_chunk(self, index, digest):
+        """Registrar o hash de um bloco concluído por uma tarefa de faixa"""
+        self._received_lock.lock()
+        try:
+            self._chunk_hashes[index] = digest
+        finally:
+            self._received_lock.unlock()
+    
+    def _write_manifest(self, manifest_path, size):
+        """Gravar o manifesto com o sha256 dos blocos já concluídos"""
+        self._received_lock.lock()
+        try:
+            chunks = {str(index): digest for index, digest in self._chunk_hashes.items()}
+        finally:
+            self._received_lock.unlock()
+        
+        temp_path = f"{manifest_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"size": size, "chunk_size": _HASH_CHUNK_SIZE, "chunks": chunks}, f)
+        os.replace(temp_path, manifest_path)
+    
+    def _verified_chunks(self, part_path, manifest_path, size):
+        """Conferir, pelo sha256, os blocos de um .part já listados no manifesto
+        
+        Returns:
+            dict: Índice do bloco -> hash, apenas para os blocos íntegros
+        """
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if (manifest.get("size") != size or manifest.get("chunk_size") != _HASH_CHUNK_SIZE
+                    or os.path.getsize(part_path) != size):
+                return {}
+        except (OSError, ValueError):
+            return {}
+        
+        verified = {}
+        with open(part_path, "rb") as f:
+            for key, digest in manifest.get("chunks", {}).items():
+                self._check_cancelled()
+                index = int(key)
+                f.seek(index * _HASH_CHUNK_SIZE)
+                if hashlib.sha256(f.read(_HASH_CHUNK_SIZE)).hexdigest() == digest:
+                    verified[index] = digest
+        return verified
+    
+    def _download_file_parallel(self, url, path, size, done, total):
+        """Baixar um arquivo grande em faixas de bytes simultâneas
+        
+        O arquivo é dividido em blocos de 4 MB cujo sha256 vai para um manifesto
+        (.chunks) ao lado do arquivo; numa nova tentativa, os blocos que ainda
+        conferem com o manifesto não são baixados de novo.
+        
+        Returns:
+            int: Tamanho do arquivo baixado
+        """
+        if os.path.exists(path):
+            return os.path.getsize(path)
+        
+        part_path = f"{path}.part"
+        manifest_path = f"{path}.chunks"
+        
+        self._chunk_hashes = self._verified_chunks(part_path, manifest_path, size)
+        if not self._chunk_hashes:
+            with open(part_path, "wb") as f:
+                _preallocate(f, size)
+        
+        count = -(-size // _HASH_CHUNK_SIZE)
+        missing = [index for index in range(count) if index not in self._chunk_hashes]
+        self._received = sum(
+            min(_HASH_CHUNK_SIZE, size - index * _HASH_CHUNK_SIZE) for index in self._chunk_hashes
+        )
+        
+        # Cada tarefa recebe uma fatia contígua dos blocos que faltam
+        tasks = []
+        if missing:
+            step = -(-len(missing) // min(_PARALLEL_CONNECTIONS, len(missing)))
+            tasks = [
+                RangeDownloadTask(url, part_path, size, missing[start:start + step],
+                                  self._add_received, self._add_chunk, self._cancel_event)
+                for start in range(0, len(missing), step)
+            ]
+        
+        pool = QThreadPool()
+        pool.setMaxThreadCount(max(1, len(tasks)))
+        for task in tasks:
+            pool.start(task)
+        
+        # Progresso combinado das faixas, emitido a 10 Hz; manifesto salvo periodicamente
+        last_manifest = time.monotonic()
+        while not pool.waitForDone(100):
+            if total:
+                self._emit_progress(int((done + self._received) * 100 / total))
+            if time.monotonic() - last_manifest >= _MANIFEST_INTERVAL:
+                self._write_manifest(manifest_path, size)
+                last_manifest = time.monotonic()
+        
+        # Também em caso de cancelamento ou erro, para permitir a retomada
+        self._write_manifest(manifest_path, size)
+        
+        self._check_cancelled()
+        errors = [task.error for task in tasks if task.error is not None]
+        if errors:
+            raise errors[0]
+        
+        _verify_sha256(part_path, url)
+        os.replace(part_path, path)
+        
+        # O manifesto só serve para retomar um download incompleto
+        try:
+            os.remove(manifest_path)
+        except FileNotFoundError:
+            pass
+        return size
+    
+    def _download_file(self, url, path, size, done, total):
+        """Baixar um arquivo, retomando um download parcial (.part) se existir
+        
+        Um fluxo que termina antes do tamanho esperado é retomado como uma
+        interrupção; o arquivo só é renomeado com o tamanho (e o sha256, se
+        conhecido) conferido.
+        
+        Args:
+            url (str): URL do arquivo
+            path (str): Caminho final do arquivo
+            size (int): Tamanho do arquivo obtido na sondagem (0 se desconhecido)
+            done (int): Bytes já baixados dos arquivos anteriores do modelo
+            total (int): Tamanho total do modelo (0 se desconhecido)
+        
+        Returns:
+            int: Tamanho do arquivo baixado
+        """
+        if os.path.exists(path):
+            return os.path.getsize(path)
+        
+        part_path = f"{path}.part"
+        for attempt in range(_DOWNLOAD_RETRIES):
+            existing = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            headers = {"Range": f"bytes={existing}-"} if existing else {}
+            
+            try:
+                with requests.get(url, headers=headers, stream=True, timeout=_DOWNLOAD_TIMEOUT) as response:
+                    # 416: o arquivo parcial já está completo
+                    if existing and response.status_code == 416:
+                        break
+                    response.raise_for_status()
+                    
+                    # Servidor ignorou o Range: recomeçar do início
+                    if response.status_code != 206:
+                        existing = 0
+                    
+                    # Tamanho final esperado: o da sondagem ou o informado por esta resposta.
+                    # Com compressão, o Content-Length não corresponde aos bytes gravados
+                    if response.headers.get("Content-Encoding", "identity").lower() != "identity":
+                        size = 0
+                    content_length = int(response.headers.get("Content-Length", 0))
+                    if not size and content_length and "Content-Encoding" not in response.headers:
+                        size = existing + content_length
+                    
+                    downloaded = existing
+                    with open(part_path, "ab" if existing else "wb") as f:
+                        for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                            self._check_cancelled()
+                            f.write(chunk)
+                            downloaded += len(chunk)
+                            if total:
+                                self._emit_progress(int((done + downloaded) * 100 / total))
+                    
+                    # Conexão encerrada antes do fim: retomar a partir do que foi recebido
+                    if size and downloaded < size:
+                        raise requests.RequestException(f"Incomplete download: {downloaded} of {size} bytes")
+                break
+            except requests.RequestException as e:
+                if attempt == _DOWNLOAD_RETRIES - 1:
+                    raise
+                
+                # Espera exponencial antes de retomar de onde parou
+                delay = 2 ** attempt
+                logger.warning(f"Download interrupted ({str(e)}), retrying in {delay}s")
+                self._cancel_event.wait(delay)
+                self._check_cancelled()
+        
+        # Nunca instalar um arquivo truncado ou maior que o esperado
+        received = os.path.getsize(part_path)
+        if size and received != size:
+            os.remove(part_path)
+            raise IOError(f"Downloaded {received} bytes, expected {size}")
+        
+        _verify_sha256(part_path, url)
+        os.replace(part_path, path)
+        return received
 
 class LocalTab(BaseTab):
     """Aba de configuração para serviços locais"""
     
+    _BINDINGS = (
+        ("whisper_local_model_combo", "recognition", "whisper_local_model", "base"),
+        ("whisper_gpu_check", "recognition", "whisper_local_use_gpu", False),
+        ("m100_model_combo", "translation", "m100_model", "small"),
+        ("m100_model_path", "translation", "m100_model_path", ""),
+        ("m100_gpu_check", "translation", "m100_use_gpu", False)
+    )
+    
     def __init__(self, config_manager, parent=None):
         super().__init__(config_manager, parent)
         
+        # Downloads em andamento, um por tipo de modelo ("whisper" ou "m100")
+        self._download_tasks = {}
+        
+        # Cancelar os downloads ao sair, para o pool compartilhado não segurar o encerramento
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._cancel_all_downloads)
+        
+        # Status dos modelos: caminho -> (instante da verificação, mtime, (instalado, tamanho))
+        self._status_cache = {}
+    
+    def _build_ui(self):
+        """Criar os grupos da aba de serviços locais"""
         # Whisper Local settings group
         self._create_whisper_group()
         
         # M100 settings group
         self._create_m100_group()
         
-        # Download status
-        self.download_thread = None
-        self.current_download_progress = None
+        # Widgets e chave do config atualizados ao fim do download de cada tipo de modelo:
+        # (barra, cancelar, baixar, status, combo, campo do caminho, seção, chave, verificação)
+        self._download_targets = {
+            "whisper": (
+                self.whisper_progress, self.whisper_cancel_button, self.whisper_download_button,
+                self.whisper_status_label, self.whisper_local_model_combo, None,
+                "recognition", "whisper_local_model_path", self._check_whisper_model_status
+            ),
+            "m100": (
+                self.m100_progress, self.m100_cancel_button, self.m100_download_button,
+                self.m100_status_label, self.m100_model_combo, self.m100_model_path,
+                "translation", "m100_model_path", self._check_m100_model_status
+            )
+        }
     
     def _create_whisper_group(self):
         """Criar grupo de configurações do Whisper Local"""
@@ -62,11 +606,7 @@ class LocalTab(BaseTab):
         
         # Modelo
         self.whisper_local_model_combo = QComboBox()
-        self.whisper_local_model_combo.addItem("Tiny", "tiny")
-        self.whisper_local_model_combo.addItem("Base", "base")
-        self.whisper_local_model_combo.addItem("Small", "small")
-        self.whisper_local_model_combo.addItem("Medium", "medium")
-        self.whisper_local_model_combo.addItem("Large", "large")
+        self._add_indexed_items(self.whisper_local_model_combo, _WHISPER_MODEL_CHOICES)
         whisper_layout.addRow("Modelo:", self.whisper_local_model_combo)
         
         # Status do modelo
@@ -89,7 +629,15 @@ class LocalTab(BaseTab):
         # Barra de progresso
         self.whisper_progress = QProgressBar()
         self.whisper_progress.setVisible(False)
-        whisper_layout.addRow("Progresso:", self.whisper_progress)
+        
+        self.whisper_cancel_button = QPushButton("Cancelar")
+        self.whisper_cancel_button.setVisible(False)
+        self.whisper_cancel_button.clicked.connect(lambda checked=False: self._cancel_download("whisper"))
+        
+        whisper_progress_layout = QHBoxLayout()
+        whisper_progress_layout.addWidget(self.whisper_progress)
+        whisper_progress_layout.addWidget(self.whisper_cancel_button)
+        whisper_layout.addRow("Progresso:", whisper_progress_layout)
         
         # Opção para usar GPU
         self.whisper_gpu_check = QCheckBox("Usar GPU (requer CUDA)")
@@ -104,9 +652,7 @@ class LocalTab(BaseTab):
         
         # Modelo
         self.m100_model_combo = QComboBox()
-        self.m100_model_combo.addItem("Small (418M)", "small")
-        self.m100_model_combo.addItem("Medium (1.2B)", "medium")
-        self.m100_model_combo.addItem("Large (12B)", "large")
+        self._add_indexed_items(self.m100_model_combo, _M100_MODEL_CHOICES)
         m100_layout.addRow("Modelo:", self.m100_model_combo)
         
         # Diretório do modelo
@@ -138,7 +684,15 @@ class LocalTab(BaseTab):
         # Barra de progresso
         self.m100_progress = QProgressBar()
         self.m100_progress.setVisible(False)
-        m100_layout.addRow("Progresso:", self.m100_progress)
+        
+        self.m100_cancel_button = QPushButton("Cancelar")
+        self.m100_cancel_button.setVisible(False)
+        self.m100_cancel_button.clicked.connect(lambda checked=False: self._cancel_download("m100"))
+        
+        m100_progress_layout = QHBoxLayout()
+        m100_progress_layout.addWidget(self.m100_progress)
+        m100_progress_layout.addWidget(self.m100_cancel_button)
+        m100_layout.addRow("Progresso:", m100_progress_layout)
         
         # Opção para usar GPU
         self.m100_gpu_check = QCheckBox("Usar GPU (requer CUDA)")
@@ -159,121 +713,109 @@ class LocalTab(BaseTab):
     
     def _download_whisper_model(self):
         """Iniciar download do modelo Whisper"""
-        model = self.whisper_local_model_combo.currentData()
-        download_path = os.path.join(
-            os.path.expanduser("~"),
-            ".dogedictate",
-            "models",
-            "whisper"
-        )
-        
-        # Criar diretório se não existir
-        os.makedirs(download_path, exist_ok=True)
-        
-        # Iniciar download
-        self.whisper_progress.setVisible(True)
-        self.whisper_download_button.setEnabled(False)
-        self.current_download_progress = self.whisper_progress
-        
-        self.download_thread = ModelDownloadThread("whisper", model, download_path)
-        self.download_thread.progress_updated.connect(self._update_download_progress)
-        self.download_thread.download_complete.connect(self._whisper_download_complete)
-        self.download_thread.start()
+        self._start_download("whisper")
     
     def _download_m100_model(self):
         """Iniciar download do modelo M100"""
-        model = self.m100_model_combo.currentData()
-        download_path = os.path.join(
-            os.path.expanduser("~"),
-            ".dogedictate",
-            "models",
-            "m100"
-        )
+        self._start_download("m100")
+    
+    def _start_download(self, kind):
+        """Iniciar o download do modelo selecionado no combo do tipo informado"""
+        if kind in self._download_tasks:
+            return
         
-        # Criar diretório se não existir
-        os.makedirs(download_path, exist_ok=True)
+        progress, cancel_button, download_button = self._download_targets[kind][:3]
+        combo = self._download_targets[kind][4]
         
         # Iniciar download
-        self.m100_progress.setVisible(True)
-        self.m100_download_button.setEnabled(False)
-        self.current_download_progress = self.m100_progress
-        
-        self.download_thread = ModelDownloadThread("m100", model, download_path)
-        self.download_thread.progress_updated.connect(self._update_download_progress)
-        self.download_thread.download_complete.connect(self._m100_download_complete)
-        self.download_thread.start()
-    
-    def _update_download_progress(self, value):
-        """Atualizar barra de progresso do download"""
-        if self.current_download_progress:
-            self.current_download_progress.setValue(value)
-    
-    def _whisper_download_complete(self, success, message):
-        """Callback para quando o download do Whisper terminar"""
-        self.whisper_progress.setVisible(False)
-        self.whisper_download_button.setEnabled(True)
+        progress.setRange(0, 100)
+        progress.setValue(0)
+        progress.setVisible(True)
+        download_button.setEnabled(False)
+        cancel_button.setVisible(True)
+        
+        task = ModelDownloadTask(kind, combo.currentData(), _model_path(kind))
+        task.signals.progress_updated.connect(lambda value, kind=kind: self._update_download_progress(kind, value))
+        task.signals.download_complete.connect(self._download_complete)
+        self._download_tasks[kind] = task
+        self._pool.start(task)
+    
+    def _cancel_download(self, kind):
+        """Cancelar o download em andamento do tipo informado"""
+        task = self._download_tasks.get(kind)
+        if task is not None:
+            task.cancel()
+    
+    def _cancel_all_downloads(self):
+        """Cancelar todos os downloads em andamento"""
+        for task in list(self._download_tasks.values()):
+            task.cancel()
+    
+    def _update_download_progress(self, kind, value):
+        """Atualizar a barra de progresso de um download (valor negativo: tamanho desconhecido)"""
+        bar = self._download_targets[kind][0]
         
-        if success:
-            self.whisper_status_label.setText("Status: Instalado")
-            model = self.whisper_local_model_combo.currentData()
-            model_path = os.path.join(
-                os.path.expanduser("~"),
-                ".dogedictate",
-                "models",
-                "whisper",
-                model
-            )
-            self.config_manager.set_value("recognition", "whisper_local_model_path", model_path)
+        if value < 0:
+            if bar.maximum() != 0:
+                bar.setRange(0, 0)
+            return
         
-        QMessageBox.information(self, "Download de Modelo", message)
-        self._check_whisper_model_status()
+        if bar.maximum() == 0:
+            bar.setRange(0, 100)
+        
+        # Repintar apenas quando o valor realmente mudar
+        if value != bar.value():
+            bar.setValue(value)
     
-    def _m100_download_complete(self, success, message):
-        """Callback para quando o download do M100 terminar"""
-        self.m100_progress.setVisible(False)
-        self.m100_download_button.setEnabled(True)
+    def _download_complete(self, kind, success, message):
+        """Callback para quando o download de um modelo (whisper ou m100) terminar"""
+        (progress, cancel_button, download_button, status_label, combo,
+         path_edit, section, key, check_status) = self._download_targets[kind]
+        
+        # O modelo baixado é o da tarefa, mesmo que o combo tenha mudado durante o download
+        task = self._download_tasks.pop(kind, None)
+        model = task.model_name if task is not None else combo.currentData()
+        
+        self._status_cache.clear()
+        progress.setVisible(False)
+        cancel_button.setVisible(False)
+        download_button.setEnabled(True)
         
         if success:
-            self.m100_status_label.setText("Status: Instalado")
-            model = self.m100_model_combo.currentData()
-            model_path = os.path.join(
-                os.path.expanduser("~"),
-                ".dogedictate",
-                "models",
-                "m100",
-                model
-            )
-            self.m100_model_path.setText(model_path)
-            self.config_manager.set_value("translation", "m100_model_path", model_path)
+            status_label.setText("Status: Instalado")
+            model_path = _model_path(kind, model)
+            if path_edit is not None:
+                path_edit.setText(model_path)
+            self._store_model_path(section, key, model_path)
         
         QMessageBox.information(self, "Download de Modelo", message)
-        self._check_m100_model_status()
+        check_status()
+    
+    def _confirm(self, title, text, on_yes):
+        """Pedir confirmação sem bloquear o loop de eventos; on_yes é chamado se o usuário aceitar"""
+        box = QMessageBox(QMessageBox.Question, title, text, QMessageBox.Yes | QMessageBox.No, self)
+        box.setDefaultButton(QMessageBox.No)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.finished.connect(lambda result: on_yes() if result == QMessageBox.Yes else None)
+        box.open()
     
     def _remove_whisper_model(self):
         """Remover modelo Whisper"""
         model = self.whisper_local_model_combo.currentData()
-        model_path = os.path.join(
-            os.path.expanduser("~"),
-            ".dogedictate",
-            "models",
-            "whisper",
-            model
-        )
-        
-        reply = QMessageBox.question(
-            self,
+        self._confirm(
             "Remover Modelo",
             f"Tem certeza que deseja remover o modelo Whisper {model}?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
+            self._do_remove_whisper_model
         )
-        
-        if reply == QMessageBox.Yes:
-            # Aqui você implementaria a remoção real do modelo
-            # Por enquanto, apenas simulamos
-            self.config_manager.set_value("recognition", "whisper_local_model_path", "")
-            self.whisper_status_label.setText("Status: Não instalado")
-            QMessageBox.information(self, "Remover Modelo", "Modelo removido com sucesso!")
+    
+    def _do_remove_whisper_model(self):
+        """Remover o modelo Whisper após a confirmação"""
+        # Aqui você implementaria a remoção real do modelo
+        # Por enquanto, apenas simulamos
+        self._status_cache.clear()
+        self._store_model_path("recognition", "whisper_local_model_path", "")
+        self.whisper_status_label.setText("Status: Não instalado")
+        QMessageBox.information(self, "Remover Modelo", "Modelo removido com sucesso!")
     
     def _remove_m100_model(self):
         """Remover modelo M100"""
@@ -284,29 +826,73 @@ class LocalTab(BaseTab):
             QMessageBox.warning(self, "Remover Modelo", "Nenhum modelo instalado para remover.")
             return
         
-        reply = QMessageBox.question(
-            self,
+        self._confirm(
             "Remover Modelo",
             f"Tem certeza que deseja remover o modelo M100 {model}?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
+            self._do_remove_m100_model
         )
+    
+    def _do_remove_m100_model(self):
+        """Remover o modelo M100 após a confirmação"""
+        # Aqui você implementaria a remoção real do modelo
+        # Por enquanto, apenas simulamos
+        self._status_cache.clear()
+        self._store_model_path("translation", "m100_model_path", "")
+        self.m100_model_path.setText("")
+        self.m100_status_label.setText("Status: Não instalado")
+        QMessageBox.information(self, "Remover Modelo", "Modelo removido com sucesso!")
+    
+    def _store_model_path(self, section, key, model_path):
+        """Gravar o caminho de um modelo baixado ou removido
+        
+        A alteração vai para o config numa única atualização, com salvamento em
+        disco agendado, e entra no snapshot da aba para não ser gravada de novo
+        pelo próximo save_settings.
+        """
+        self.config_manager.update({section: {key: model_path}})
+        self.config_manager.save_config()
+        
+        if key in self._loaded.get(section, {}):
+            self._loaded[section][key] = model_path
+    
+    def _model_status(self, path):
+        """Verificar se um modelo está completo no disco
         
-        if reply == QMessageBox.Yes:
-            # Aqui você implementaria a remoção real do modelo
-            # Por enquanto, apenas simulamos
-            self.config_manager.set_value("translation", "m100_model_path", "")
-            self.m100_model_path.setText("")
-            self.m100_status_label.setText("Status: Não instalado")
-            QMessageBox.information(self, "Remover Modelo", "Modelo removido com sucesso!")
+        O resultado é reaproveitado por alguns segundos e, depois disso, enquanto o
+        mtime do diretório não mudar; o diretório só é relido quando algo muda nele.
+        
+        Returns:
+            tuple: (instalado, tamanho total em bytes)
+        """
+        now = time.monotonic()
+        cached = self._status_cache.get(path)
+        if cached is not None and now - cached[0] < _STATUS_CACHE_TTL:
+            return cached[2]
+        
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self._status_cache[path] = (now, None, (False, 0))
+            return False, 0
+        
+        if cached is not None and cached[1] == stat.st_mtime_ns:
+            status = cached[2]
+        elif os.path.isdir(path):
+            size, files, partial = _dir_size_and_files(path)
+            status = (files > 0 and not partial, size)
+        else:
+            status = (True, stat.st_size)
+        
+        self._status_cache[path] = (now, stat.st_mtime_ns, status)
+        return status
     
     def _check_whisper_model_status(self):
         """Verificar status do modelo Whisper"""
-        model = self.whisper_local_model_combo.currentData()
         model_path = self.config_manager.get_value("recognition", "whisper_local_model_path", "")
+        installed, size = self._model_status(model_path) if model_path else (False, 0)
         
-        if model_path and os.path.exists(model_path):
-            self.whisper_status_label.setText("Status: Instalado")
+        if installed:
+            self.whisper_status_label.setText(f"Status: Instalado ({_format_size(size)})")
             self.whisper_remove_button.setEnabled(True)
         else:
             self.whisper_status_label.setText("Status: Não instalado")
@@ -315,9 +901,10 @@ class LocalTab(BaseTab):
     def _check_m100_model_status(self):
         """Verificar status do modelo M100"""
         model_path = self.m100_model_path.text()
+        installed, size = self._model_status(model_path) if model_path else (False, 0)
         
-        if model_path and os.path.exists(model_path):
-            self.m100_status_label.setText("Status: Instalado")
+        if installed:
+            self.m100_status_label.setText(f"Status: Instalado ({_format_size(size)})")
             self.m100_remove_button.setEnabled(True)
         else:
             self.m100_status_label.setText("Status: Não instalado")
@@ -325,60 +912,17 @@ class LocalTab(BaseTab):
     
     def load_settings(self):
         """Carregar configurações do config_manager"""
-        # Load Whisper Local settings
-        self.whisper_local_model_combo.setCurrentIndex(
-            self.whisper_local_model_combo.findData(
-                self.config_manager.get_value("recognition", "whisper_local_model", "base")
-            )
-        )
-        self.whisper_gpu_check.setChecked(
-            self.config_manager.get_value("recognition", "whisper_local_use_gpu", False)
-        )
+        if not self._built:
+            return
         
-        # Load M100 settings
-        self.m100_model_combo.setCurrentIndex(
-            self.m100_model_combo.findData(
-                self.config_manager.get_value("translation", "m100_model", "small")
-            )
-        )
-        self.m100_model_path.setText(
-            self.config_manager.get_value("translation", "m100_model_path", "")
-        )
-        self.m100_gpu_check.setChecked(
-            self.config_manager.get_value("translation", "m100_use_gpu", False)
-        )
+        self._load_bindings()
         
         # Check model status
         self._check_whisper_model_status()
         self._check_m100_model_status()
+        
+        self._snapshot_values()
     
     def save_settings(self):
         """Salvar configurações no config_manager"""
-        # Save Whisper Local settings
-        self.config_manager.set_value(
-            "recognition", 
-            "whisper_local_model", 
-            self.whisper_local_model_combo.currentData()
-        )
-        self.config_manager.set_value(
-            "recognition", 
-            "whisper_local_use_gpu", 
-            self.whisper_gpu_check.isChecked()
-        )
-        
-        # Save M100 settings
-        self.config_manager.set_value(
-            "translation", 
-            "m100_model", 
-            self.m100_model_combo.currentData()
-        )
-        self.config_manager.set_value(
-            "translation", 
-            "m100_model_path", 
-            self.m100_model_path.text()
-        )
-        self.config_manager.set_value(
-            "translation", 
-            "m100_use_gpu", 
-            self.m100_gpu_check.isChecked()
-        ) 
\ No newline at end of file
+        return bool(self._save_changed_values())
\ No newline at end of file
@@ -13,8 +13,11 @@ class PlanTab(BaseTab):
     
     def __init__(self, config_manager, parent=None):
         super().__init__(config_manager, parent)
-        
+    
+    def _build_ui(self):
+        """Criar os widgets da aba de plano na primeira exibição"""
         # Adicionar conteúdo da aba de plano aqui
+        pass
     
     def load_settings(self):
         """Carregar configurações do config_manager"""
@@ -22,4 +25,4 @@ class PlanTab(BaseTab):
     
     def save_settings(self):
         """Salvar configurações no config_manager"""
-        pass 
\ No newline at end of file
+        return False
\ No newline at end of file
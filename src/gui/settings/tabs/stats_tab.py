@@ -4,24 +4,344 @@ Aba de estatísticas para a aplicação DogeDictate.
 
 from PyQt5.QtWidgets import (
     QFormLayout, QGroupBox, QLabel, QPushButton, QVBoxLayout, 
-    QHBoxLayout, QProgressBar, QTableWidget, QTableWidgetItem, QHeaderView,
+    QHBoxLayout, QProgressBar, QTableView, QHeaderView,
     QDateEdit, QComboBox, QCheckBox, QSplitter
 )
-from PyQt5.QtCore import Qt, QTimer, QDate
+from PyQt5.QtCore import Qt, QTimer, QDate, QAbstractTableModel, QModelIndex, QObject, QRunnable, pyqtSignal
 from PyQt5.QtGui import QFont
 import logging
+import bisect
 import datetime
+import functools
+import operator
+import threading
+import types
+
 
 from .base_tab import BaseTab
 
 logger = logging.getLogger("DogeDictate.SettingsDialog.StatsTab")
 
+# Mapeamento de serviços para nomes amigáveis
+_SERVICE_NAMES = types.MappingProxyType({
+    "azure_speech": "Azure Speech Services",
+    "whisper_api": "OpenAI Whisper API",
+    "google_speech": "Google Speech-to-Text",
+    "whisper_local": "Local Whisper",
+    "azure_translator": "Azure Translator",
+    "azure_openai": "Azure OpenAI",
+    "m2m100": "M2M100 (Local)"
+})
+
+# Mapeamento de serviços para custos estimados por 1000 tokens
+_SERVICE_COSTS = types.MappingProxyType({
+    "azure_speech": 0.016,  # $0.016 por 1000 tokens
+    "whisper_api": 0.006,   # $0.006 por 1000 tokens
+    "google_speech": 0.016, # $0.016 por 1000 tokens
+    "whisper_local": 0.0,   # Gratuito (local)
+    "azure_translator": 0.01, # $0.01 por 1000 tokens
+    "azure_openai": 0.01,   # $0.01 por 1000 tokens
+    "m2m100": 0.0           # Gratuito (local)
+})
+
+# Separador de milhares exibido na interface ("1.234" em vez de "1,234")
+_THOUSANDS_SEPARATOR = str.maketrans(",", ".")
+
+def _format_number(value):
+    """Formatar um número com o separador de milhares da interface, numa única passada"""
+    return f"{value:,}".translate(_THOUSANDS_SEPARATOR)
+
+@functools.lru_cache(maxsize=4096)
+def _format_session(date_time, duration, words):
+    """Textos exibidos para uma sessão: (data, hora, duração, palavras, velocidade média)
+    
+    Memorizado: a view pede cada célula várias vezes (a cada repaint e rolagem),
+    e as sessões já exibidas não mudam entre atualizações.
+    """
+    # Data e hora
+    date_parts = date_time.split(" ")
+    date = date_parts[0]
+    time = date_parts[1] if len(date_parts) > 1 else ""
+    
+    # Duração
+    hours = duration // 3600
+    minutes = (duration % 3600) // 60
+    
+    # Velocidade média
+    avg_speed = (words * 60) / duration if duration > 0 else 0.0
+    
+    return (
+        date,
+        time,
+        f"{hours}h {minutes}m",
+        _format_number(words),
+        f"{avg_speed:.1f}"
+    )
+
+class StatsWorkerSignals(QObject):
+    """Sinais de um cálculo de estatísticas executado em segundo plano"""
+    finished = pyqtSignal(object, object, list)
+
+class StatsWorker(QRunnable):
+    """Tarefa para calcular as estatísticas de um período fora da thread da interface"""
+    
+    def __init__(self, compute, key):
+        super().__init__()
+        self.compute = compute
+        self.key = key
+        self.signals = StatsWorkerSignals()
+    
+    def run(self):
+        """Calcular o período e emitir (chave, estatísticas do período, sessões filtradas)"""
+        try:
+            period_stats, filtered_sessions = self.compute(*self.key)
+        except Exception as e:
+            logger.error(f"Error computing period statistics: {str(e)}")
+            period_stats, filtered_sessions = None, []
+        self.signals.finished.emit(self.key, period_stats, filtered_sessions)
+
+class CsvExportSignals(QObject):
+    """Sinais de uma exportação de estatísticas executada em segundo plano"""
+    finished = pyqtSignal(bool, str)
+
+class CsvExportTask(QRunnable):
+    """Tarefa para gravar as estatísticas em CSV fora da thread da interface"""
+    
+    def __init__(self, file_path, rows):
+        super().__init__()
+        self.file_path = file_path
+        self.rows = rows
+        self.signals = CsvExportSignals()
+    
+    def run(self):
+        """Gravar as linhas no arquivo e emitir (sucesso, mensagem de erro)"""
+        import csv
+        
+        try:
+            with open(self.file_path, 'w', newline='', encoding='utf-8') as csvfile:
+                csv.writer(csvfile).writerows(self.rows)
+        except Exception as e:
+            logger.error(f"Error exporting statistics: {str(e)}")
+            self.signals.finished.emit(False, str(e))
+            return
+        self.signals.finished.emit(True, "")
+
+class ApiUsageModel(QAbstractTableModel):
+    """Modelo da tabela de uso de API, com linhas (serviço, tokens usados, custo estimado)"""
+    
+    HEADERS = ("Serviço", "Tokens Usados", "Custo Estimado")
+    
+    # Colunas numéricas, alinhadas à direita
+    _RIGHT_ALIGNED = (1, 2)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+    
+    def set_rows(self, rows):
+        """Substituir as linhas, avisando a view apenas do que mudou
+        
+        Com o mesmo número de linhas, os valores são sobrescritos no lugar e só
+        dataChanged é emitido; o modelo só é reiniciado quando o tamanho muda.
+        """
+        rows = list(rows)
+        if rows == self._rows:
+            return
+        
+        if len(rows) == len(self._rows):
+            self._rows = rows
+            self.dataChanged.emit(self.index(0, 0), self.index(len(rows) - 1, len(self.HEADERS) - 1))
+            return
+        
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+    
+    def formatted_rows(self):
+        """Textos de todas as linhas, na ordem exibida"""
+        return [self._row_texts(row) for row in self._rows]
+    
+    def _row_texts(self, row):
+        """Textos formatados de uma linha"""
+        service_name, tokens, cost = row
+        return (service_name, _format_number(tokens), f"${cost:.2f}")
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Número de serviços exibidos"""
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Número de colunas da tabela"""
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Texto ou alinhamento da célula informada"""
+        if not index.isValid():
+            return None
+        
+        if role == Qt.DisplayRole:
+            return self._row_texts(self._rows[index.row()])[index.column()]
+        if role == Qt.TextAlignmentRole and index.column() in self._RIGHT_ALIGNED:
+            return Qt.AlignRight | Qt.AlignVCenter
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Títulos das colunas; as linhas mantêm a numeração padrão"""
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+class SessionHistoryModel(QAbstractTableModel):
+    """Modelo da tabela de histórico de sessões, com as mais recentes primeiro
+    
+    O texto de cada célula é formatado apenas quando a view o solicita, ou seja,
+    só para as linhas visíveis.
+    """
+    
+    HEADERS = ("Data", "Hora", "Duração", "Palavras", "Velocidade Média")
+    
+    # Colunas numéricas, alinhadas à direita
+    _RIGHT_ALIGNED = (3, 4)
+    
+    # A partir de quantas linhas formatted_rows calcula as colunas numéricas com o NumPy
+    _VECTORIZE_MIN_ROWS = 1000
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Sessões em ordem cronológica; a linha 0 exibe a última
+        self._sessions = []
+    
+    def set_sessions(self, sessions):
+        """Exibir as sessões informadas, em ordem cronológica
+        
+        Quando as sessões atuais são um prefixo das novas, apenas as novas são
+        inseridas no topo; caso contrário o modelo é reiniciado.
+        """
+        count = len(self._sessions)
+        if len(sessions) >= count and sessions[:count] == self._sessions:
+            added = len(sessions) - count
+            if added:
+                self.beginInsertRows(QModelIndex(), 0, added - 1)
+                self._sessions = list(sessions)
+                self.endInsertRows()
+            return
+        
+        self.beginResetModel()
+        self._sessions = list(sessions)
+        self.endResetModel()
+    
+    def formatted_rows(self):
+        """Textos de todas as linhas, na ordem exibida"""
+        sessions = self._sessions[::-1]
+        if len(sessions) >= self._VECTORIZE_MIN_ROWS:
+            return self._formatted_rows_vectorized(sessions)
+        return [self._row_texts(session) for session in sessions]
+    
+    def _formatted_rows_vectorized(self, sessions):
+        """Textos de muitas linhas, com as colunas numéricas calculadas pelo NumPy"""
+        durations = [session.get("duration", 0) for session in sessions]
+        words = [session.get("words", 0) for session in sessions]
+        
+        # Valores não inteiros seguem pelo formatador comum, para manter o mesmo texto da tabela
+        if not all(isinstance(value, int) for value in durations + words):
+            return [self._row_texts(session) for session in sessions]
+        
+        # Importado só aqui: o NumPy é usado apenas na exportação de históricos grandes
+        import numpy as np
+        
+        duration_array = np.array(durations, dtype=np.int64)
+        words_array = np.array(words, dtype=np.int64)
+        hours, remainder = np.divmod(duration_array, 3600)
+        minutes = remainder // 60
+        speeds = np.where(duration_array > 0, words_array * 60 / np.maximum(duration_array, 1), 0.0)
+        
+        rows = []
+        for session, session_hours, session_minutes, session_words, speed in zip(
+            sessions, hours.tolist(), minutes.tolist(), words, speeds.tolist()
+        ):
+            date_parts = session.get("date", "").split(" ")
+            rows.append((
+                date_parts[0],
+                date_parts[1] if len(date_parts) > 1 else "",
+                f"{session_hours}h {session_minutes}m",
+                _format_number(session_words),
+                f"{speed:.1f}"
+            ))
+        return rows
+    
+    def _row_texts(self, session):
+        """Textos formatados de uma sessão"""
+        return _format_session(session.get("date", ""), session.get("duration", 0), session.get("words", 0))
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Número de sessões exibidas"""
+        if parent.isValid():
+            return 0
+        return len(self._sessions)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Número de colunas da tabela"""
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Texto ou alinhamento da célula informada"""
+        if not index.isValid():
+            return None
+        
+        if role == Qt.DisplayRole:
+            session = self._sessions[-1 - index.row()]
+            return self._row_texts(session)[index.column()]
+        if role == Qt.TextAlignmentRole and index.column() in self._RIGHT_ALIGNED:
+            return Qt.AlignRight | Qt.AlignVCenter
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Títulos das colunas; as linhas mantêm a numeração padrão"""
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
 class StatsTab(BaseTab):
     """Aba de estatísticas para a aplicação DogeDictate"""
     
+    # Fontes em negrito dos valores, por tamanho; criadas sob demanda porque exigem um QApplication
+    _value_fonts = {}
+    
     def __init__(self, config_manager, parent=None):
         super().__init__(config_manager, parent)
         
+        # Resultados por período: (início, fim, assinatura do histórico) -> (estatísticas, sessões)
+        self._period_cache = functools.lru_cache(maxsize=16)(self._compute_period)
+        
+        # Dia em que as datas do período predefinido foram calculadas
+        self._period_day = QDate.currentDate()
+        
+        # Recarregamento pendente, feito no próximo showEvent enquanto a aba estiver oculta
+        self._dirty = True
+        
+        # Histórico ordenado por data, com as datas (datetime.date) em uma lista paralela para o bisect
+        self._sorted_sessions = []
+        self._sorted_dates = []
+        self._index_sig = None
+        
+        # Cálculos de período em andamento e a chave do último pedido; resultados
+        # de pedidos anteriores são descartados ao chegar
+        self._period_lock = threading.Lock()
+        self._stats_workers = set()
+        self._requested_key = None
+        
+        # Entradas da última exibição, para pular recarregamentos sem mudança
+        self._last_sig = None
+        
+        # Exportação em CSV em andamento
+        self._export_task = None
+        
         # Filtro de datas
         self._create_date_filter_group()
         
@@ -37,12 +357,17 @@ class StatsTab(BaseTab):
         # Botões de ação
         self._create_action_buttons()
         
-        # Timer para atualização automática
+        # Timer de atualização periódica, usado só quando o callback do serviço não pôde ser registrado
         self.update_timer = QTimer(self)
         self.update_timer.timeout.connect(self.load_settings)
-        self.update_timer.start(300000)  # Atualizar a cada 5 minutos (aumentado de 30 segundos)
+        
+        # Agrupa várias notificações seguidas do serviço em um único recarregamento
+        self._coalesce_timer = QTimer(self)
+        self._coalesce_timer.setSingleShot(True)
+        self._coalesce_timer.timeout.connect(self.load_settings)
         
         # Registrar callback para atualização em tempo real
+        self._callback_registered = False
         try:
             # Obter o serviço de estatísticas do dictation_manager
             if parent and hasattr(parent, 'dictation_manager') and parent.dictation_manager:
@@ -50,7 +375,8 @@ class StatsTab(BaseTab):
                 logger.info(f"Using stats service from dictation_manager: {self.stats_service}")
                 
                 # Registrar o callback
-                self.stats_service.register_update_callback(self.load_settings)
+                self.stats_service.register_update_callback(self._on_stats_changed)
+                self._callback_registered = True
                 logger.info("Callback de atualização registrado com sucesso")
                 
                 # Depurar estatísticas atuais
@@ -61,15 +387,14 @@ class StatsTab(BaseTab):
                 from src.services.stats_service import StatsService
                 logger.warning("Parent or dictation_manager not available, creating new StatsService instance")
                 self.stats_service = StatsService(self.config_manager)
-                self.stats_service.register_update_callback(self.load_settings)
+                self.stats_service.register_update_callback(self._on_stats_changed)
+                self._callback_registered = True
                 
                 # Depurar estatísticas atuais
                 debug_info = self.stats_service.debug_stats()
                 logger.info(f"Current stats from init (fallback): {debug_info}")
         except Exception as e:
-            logger.error(f"Erro ao registrar callback de atualização: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception("Erro ao registrar callback de atualização: %s", e)
             
             # Fallback para criar uma nova instância em caso de erro
             try:
@@ -78,6 +403,18 @@ class StatsTab(BaseTab):
                 self.stats_service = StatsService(self.config_manager)
             except Exception as e2:
                 logger.error(f"Failed to create fallback StatsService: {str(e2)}")
+        
+        # Sem notificações do serviço, voltar a consultar a cada 5 minutos
+        if not self._callback_registered:
+            self.update_timer.start(300000)
+    
+    @classmethod
+    def _value_font(cls, size):
+        """Fonte Arial em negrito do tamanho informado, compartilhada pelos rótulos de valores"""
+        font = cls._value_fonts.get(size)
+        if font is None:
+            font = cls._value_fonts[size] = QFont("Arial", size, QFont.Bold)
+        return font
     
     def _create_date_filter_group(self):
         """Criar grupo de filtro de datas"""
@@ -132,29 +469,29 @@ class StatsTab(BaseTab):
         
         # Estatísticas de palavras
         self.total_words_label = QLabel("0")
-        self.total_words_label.setFont(QFont("Arial", 12, QFont.Bold))
+        self.total_words_label.setFont(self._value_font(12))
         stats_layout.addRow("Total de Palavras Ditadas:", self.total_words_label)
         
         self.translated_words_label = QLabel("0")
-        self.translated_words_label.setFont(QFont("Arial", 12, QFont.Bold))
+        self.translated_words_label.setFont(self._value_font(12))
         stats_layout.addRow("Total de Palavras Traduzidas:", self.translated_words_label)
         
         # Estatísticas de tempo
         self.total_time_label = QLabel("0h 0m")
-        self.total_time_label.setFont(QFont("Arial", 12, QFont.Bold))
+        self.total_time_label.setFont(self._value_font(12))
         stats_layout.addRow("Tempo Total de Uso:", self.total_time_label)
         
         self.avg_speed_label = QLabel("0")
-        self.avg_speed_label.setFont(QFont("Arial", 12, QFont.Bold))
+        self.avg_speed_label.setFont(self._value_font(12))
         stats_layout.addRow("Velocidade Média (palavras/min):", self.avg_speed_label)
         
         # Estatísticas de sessão atual
         self.current_session_label = QLabel("0h 0m")
-        self.current_session_label.setFont(QFont("Arial", 12, QFont.Bold))
+        self.current_session_label.setFont(self._value_font(12))
         stats_layout.addRow("Tempo da Sessão Atual:", self.current_session_label)
         
         self.current_words_label = QLabel("0")
-        self.current_words_label.setFont(QFont("Arial", 12, QFont.Bold))
+        self.current_words_label.setFont(self._value_font(12))
         stats_layout.addRow("Palavras na Sessão Atual:", self.current_words_label)
         
         self.layout.addWidget(stats_group)
@@ -165,8 +502,9 @@ class StatsTab(BaseTab):
         api_layout = QVBoxLayout(api_group)
         
         # Tabela de uso de API
-        self.api_table = QTableWidget(0, 3)
-        self.api_table.setHorizontalHeaderLabels(["Serviço", "Tokens Usados", "Custo Estimado"])
+        self.api_model = ApiUsageModel(self)
+        self.api_table = QTableView()
+        self.api_table.setModel(self.api_model)
         self.api_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         api_layout.addWidget(self.api_table)
         
@@ -174,11 +512,11 @@ class StatsTab(BaseTab):
         total_layout = QHBoxLayout()
         
         self.total_tokens_label = QLabel("Total de Tokens: 0")
-        self.total_tokens_label.setFont(QFont("Arial", 10, QFont.Bold))
+        self.total_tokens_label.setFont(self._value_font(10))
         total_layout.addWidget(self.total_tokens_label)
         
         self.total_cost_label = QLabel("Custo Total Estimado: $0.00")
-        self.total_cost_label.setFont(QFont("Arial", 10, QFont.Bold))
+        self.total_cost_label.setFont(self._value_font(10))
         total_layout.addWidget(self.total_cost_label)
         
         api_layout.addLayout(total_layout)
@@ -190,9 +528,10 @@ class StatsTab(BaseTab):
         history_group = QGroupBox("Histórico de Sessões")
         history_layout = QVBoxLayout(history_group)
         
-        # Tabela de histórico de sessões
-        self.history_table = QTableWidget(0, 5)
-        self.history_table.setHorizontalHeaderLabels(["Data", "Hora", "Duração", "Palavras", "Velocidade Média"])
+        # Tabela de histórico de sessões (virtual: só as linhas visíveis são consultadas)
+        self.history_model = SessionHistoryModel(self)
+        self.history_table = QTableView()
+        self.history_table.setModel(self.history_model)
         self.history_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         history_layout.addWidget(self.history_table)
         
@@ -204,7 +543,7 @@ class StatsTab(BaseTab):
         
         # Botão para atualizar estatísticas
         refresh_button = QPushButton("Atualizar Estatísticas")
-        refresh_button.clicked.connect(self.load_settings)
+        refresh_button.clicked.connect(self._refresh_statistics)
         button_layout.addWidget(refresh_button)
         
         # Botão para exportar estatísticas
@@ -221,9 +560,16 @@ class StatsTab(BaseTab):
     
     def _on_period_changed(self, index):
         """Atualizar datas quando o período for alterado"""
-        period = self.period_combo.currentData()
+        self._set_period_dates(self.period_combo.currentData())
         
+        # Aplicar filtro automaticamente
+        self._apply_filter()
+    
+    def _set_period_dates(self, period):
+        """Definir as datas do filtro para um período predefinido, a partir do dia atual"""
+        # Apenas a data, sem hora: as chaves do cache de períodos só mudam de um dia para o outro
         today = QDate.currentDate()
+        self._period_day = today
         
         if period == "today":
             self.start_date_edit.setDate(today)
@@ -247,9 +593,12 @@ class StatsTab(BaseTab):
         elif period == "all":
             self.start_date_edit.setDate(QDate(2000, 1, 1))
             self.end_date_edit.setDate(today)
-        
-        # Aplicar filtro automaticamente
-        self._apply_filter()
+    
+    def _refresh_statistics(self):
+        """Recarregar as estatísticas mesmo que nada pareça ter mudado"""
+        self._period_cache.cache_clear()
+        self._last_sig = None
+        self.load_settings()
     
     def _apply_filter(self):
         """Aplicar filtro de datas"""
@@ -258,14 +607,18 @@ class StatsTab(BaseTab):
     def _toggle_auto_update(self, state):
         """Ativar/desativar atualização automática"""
         if state == Qt.Checked:
-            self.update_timer.start(300000)
+            if self._callback_registered:
+                # Mostrar o que mudou enquanto a atualização estava desligada
+                self._coalesce_timer.start(250)
+            else:
+                self.update_timer.start(300000)
         else:
             self.update_timer.stop()
+            self._coalesce_timer.stop()
     
     def _export_statistics(self):
         """Exportar estatísticas para um arquivo CSV"""
         from PyQt5.QtWidgets import QFileDialog
-        import csv
         
         # Abrir diálogo para selecionar arquivo
         file_path, _ = QFileDialog.getSaveFileName(
@@ -278,55 +631,51 @@ class StatsTab(BaseTab):
         if not file_path:
             return
         
-        try:
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                
-                # Escrever cabeçalho
-                writer.writerow(["Estatísticas DogeDictate", datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")])
-                writer.writerow([])
-                
-                # Estatísticas gerais
-                writer.writerow(["Estatísticas Gerais"])
-                writer.writerow(["Total de Palavras Ditadas", self.total_words_label.text()])
-                writer.writerow(["Total de Palavras Traduzidas", self.translated_words_label.text()])
-                writer.writerow(["Tempo Total de Uso", self.total_time_label.text()])
-                writer.writerow(["Velocidade Média (palavras/min)", self.avg_speed_label.text()])
-                writer.writerow([])
-                
-                # Uso de API
-                writer.writerow(["Uso de API"])
-                writer.writerow(["Serviço", "Tokens Usados", "Custo Estimado"])
-                
-                for row in range(self.api_table.rowCount()):
-                    service = self.api_table.item(row, 0).text()
-                    tokens = self.api_table.item(row, 1).text()
-                    cost = self.api_table.item(row, 2).text()
-                    writer.writerow([service, tokens, cost])
-                
-                writer.writerow([])
-                writer.writerow(["Total de Tokens", self.total_tokens_label.text().replace("Total de Tokens: ", "")])
-                writer.writerow(["Custo Total Estimado", self.total_cost_label.text().replace("Custo Total Estimado: ", "")])
-                writer.writerow([])
-                
-                # Histórico de sessões
-                writer.writerow(["Histórico de Sessões"])
-                writer.writerow(["Data", "Hora", "Duração", "Palavras", "Velocidade Média"])
-                
-                for row in range(self.history_table.rowCount()):
-                    date = self.history_table.item(row, 0).text()
-                    time = self.history_table.item(row, 1).text()
-                    duration = self.history_table.item(row, 2).text()
-                    words = self.history_table.item(row, 3).text()
-                    speed = self.history_table.item(row, 4).text()
-                    writer.writerow([date, time, duration, words, speed])
-            
-            from PyQt5.QtWidgets import QMessageBox
-            QMessageBox.information(self, "Exportar Estatísticas", "Estatísticas exportadas com sucesso!")
+        # Copiar os valores exibidos na thread da interface; a escrita em disco fica com o CsvExportTask
+        rows = [
+            # Escrever cabeçalho
+            ["Estatísticas DogeDictate", datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
+            [],
             
-        except Exception as e:
-            from PyQt5.QtWidgets import QMessageBox
-            QMessageBox.warning(self, "Erro", f"Erro ao exportar estatísticas: {str(e)}")
+            # Estatísticas gerais
+            ["Estatísticas Gerais"],
+            ["Total de Palavras Ditadas", self.total_words_label.text()],
+            ["Total de Palavras Traduzidas", self.translated_words_label.text()],
+            ["Tempo Total de Uso", self.total_time_label.text()],
+            ["Velocidade Média (palavras/min)", self.avg_speed_label.text()],
+            [],
+            
+            # Uso de API
+            ["Uso de API"],
+            ["Serviço", "Tokens Usados", "Custo Estimado"]
+        ]
+        rows.extend(self.api_model.formatted_rows())
+        rows.extend([
+            [],
+            ["Total de Tokens", self.total_tokens_label.text().replace("Total de Tokens: ", "")],
+            ["Custo Total Estimado", self.total_cost_label.text().replace("Custo Total Estimado: ", "")],
+            [],
+            
+            # Histórico de sessões
+            ["Histórico de Sessões"],
+            ["Data", "Hora", "Duração", "Palavras", "Velocidade Média"]
+        ])
+        rows.extend(self.history_model.formatted_rows())
+        
+        task = CsvExportTask(file_path, rows)
+        task.signals.finished.connect(self._export_finished)
+        self._export_task = task
+        self._pool.start(task)
+    
+    def _export_finished(self, success, message):
+        """Informar o resultado da exportação ao usuário"""
+        from PyQt5.QtWidgets import QMessageBox
+        
+        self._export_task = None
+        if success:
+            QMessageBox.information(self, "Exportar Estatísticas", "Estatísticas exportadas com sucesso!")
+        else:
+            QMessageBox.warning(self, "Erro", f"Erro ao exportar estatísticas: {message}")
     
     def _reset_statistics(self):
         """Resetar estatísticas"""
@@ -346,7 +695,7 @@ class StatsTab(BaseTab):
             self.stats_service.reset_statistics()
             
             # Atualizar interface
-            self.load_settings()
+            self._refresh_statistics()
             
             QMessageBox.information(self, "Resetar Estatísticas", "Estatísticas resetadas com sucesso!")
     
@@ -357,217 +706,229 @@ class StatsTab(BaseTab):
             api_usage = self.config_manager.get_value("statistics", "api_usage", {})
             
             # Log para depuração
-            logger.debug(f"API usage: {api_usage}")
-            
-            # Limpar tabela
-            self.api_table.setRowCount(0)
-            
-            # Definir número de linhas
-            self.api_table.setRowCount(len(api_usage))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("API usage: %s", api_usage)
             
             # Preencher tabela
+            rows = []
             total_tokens = 0
             total_cost = 0.0
             
-            # Mapeamento de serviços para nomes amigáveis
-            service_names = {
-                "azure_speech": "Azure Speech Services",
-                "whisper_api": "OpenAI Whisper API",
-                "google_speech": "Google Speech-to-Text",
-                "whisper_local": "Local Whisper",
-                "azure_translator": "Azure Translator",
-                "azure_openai": "Azure OpenAI",
-                "m2m100": "M2M100 (Local)"
-            }
-            
-            # Mapeamento de serviços para custos estimados por 1000 tokens
-            service_costs = {
-                "azure_speech": 0.016,  # $0.016 por 1000 tokens
-                "whisper_api": 0.006,   # $0.006 por 1000 tokens
-                "google_speech": 0.016, # $0.016 por 1000 tokens
-                "whisper_local": 0.0,   # Gratuito (local)
-                "azure_translator": 0.01, # $0.01 por 1000 tokens
-                "azure_openai": 0.01,   # $0.01 por 1000 tokens
-                "m2m100": 0.0           # Gratuito (local)
-            }
-            
-            row = 0
             for service, tokens in api_usage.items():
                 # Verificar se tokens é um número válido
                 if not isinstance(tokens, (int, float)):
                     logger.error(f"Invalid token count for service {service}: {tokens}")
                     continue
                 
-                # Nome do serviço
-                service_name = service_names.get(service, service)
-                service_item = QTableWidgetItem(service_name)
-                self.api_table.setItem(row, 0, service_item)
-                
-                # Tokens usados
-                tokens_item = QTableWidgetItem(f"{tokens:,}".replace(",", "."))
-                tokens_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                self.api_table.setItem(row, 1, tokens_item)
-                
-                # Custo estimado
-                cost = (tokens / 1000) * service_costs.get(service, 0.0)
-                cost_item = QTableWidgetItem(f"${cost:.2f}")
-                cost_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                self.api_table.setItem(row, 2, cost_item)
+                # Nome do serviço, tokens usados e custo estimado
+                cost = (tokens / 1000) * _SERVICE_COSTS.get(service, 0.0)
+                rows.append((_SERVICE_NAMES.get(service, service), tokens, cost))
                 
                 # Atualizar totais
                 total_tokens += tokens
                 total_cost += cost
-                
-                row += 1
+            
+            # O modelo só avisa a view quando as linhas mudam
+            self.api_model.set_rows(rows)
             
             # Atualizar labels de totais
-            self.total_tokens_label.setText(f"Total de Tokens: {total_tokens:,}".replace(",", "."))
+            self.total_tokens_label.setText(f"Total de Tokens: {_format_number(total_tokens)}")
             self.total_cost_label.setText(f"Custo Total Estimado: ${total_cost:.2f}")
         except Exception as e:
-            logger.error(f"Error updating API usage table: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception("Error updating API usage table: %s", e)
     
-    def _update_session_history_table(self):
-        """Atualizar tabela de histórico de sessões"""
-        try:
-            # Obter histórico de sessões
-            session_history = self.config_manager.get_value("statistics", "session_history", [])
-            
-            # Log para depuração
-            logger.debug(f"Session history: {session_history}")
+    def _index_sessions(self, session_history, history_sig):
+        """Ordenar o histórico por data, refazendo o índice só quando o histórico mudar"""
+        if history_sig == self._index_sig:
+            return
+        
+        keyed = []
+        for session in session_history:
+            # Verificar se session é um dicionário válido
+            if not isinstance(session, dict):
+                logger.error(f"Invalid session record: {session}")
+                continue
             
-            # Limpar tabela
-            self.history_table.setRowCount(0)
+            # Verificar se a sessão tem os campos necessários
+            if "date" not in session:
+                logger.error(f"Session record is missing date field: {session}")
+                continue
             
-            # Obter datas do filtro
-            start_date = self.start_date_edit.date().toString("yyyy-MM-dd")
-            end_date = self.end_date_edit.date().toString("yyyy-MM-dd")
+            # Data da sessão convertida uma única vez por reconstrução do índice
+            try:
+                session_date = datetime.date.fromisoformat(str(session["date"])[:10])
+            except ValueError:
+                logger.error(f"Invalid session date: {session['date']}")
+                continue
             
-            # Filtrar sessões pelo período
-            filtered_sessions = []
-            for session in session_history:
-                # Verificar se session é um dicionário válido
-                if not isinstance(session, dict):
-                    logger.error(f"Invalid session record: {session}")
-                    continue
-                
-                # Verificar se a sessão tem os campos necessários
-                if "date" not in session:
-                    logger.error(f"Session record is missing date field: {session}")
-                    continue
-                
-                session_date = session.get("date", "").split(" ")[0]  # Extrair apenas a data
-                
-                # Verificar se a data da sessão está dentro do intervalo
-                if start_date and end_date:
-                    if start_date <= session_date <= end_date:
-                        filtered_sessions.append(session)
-                elif start_date:
-                    if start_date <= session_date:
-                        filtered_sessions.append(session)
-                elif end_date:
-                    if session_date <= end_date:
-                        filtered_sessions.append(session)
+            keyed.append((session_date, session))
+        
+        # Ordenação estável: sessões do mesmo dia mantêm a ordem do histórico
+        keyed.sort(key=operator.itemgetter(0))
+        self._sorted_dates = [date for date, session in keyed]
+        self._sorted_sessions = [session for date, session in keyed]
+        self._index_sig = history_sig
+    
+    def _filter_sessions(self, session_history, history_sig, start_date, end_date):
+        """Obter as sessões do histórico dentro do período, por busca binária no índice de datas"""
+        self._index_sessions(session_history, history_sig)
+        
+        lo = bisect.bisect_left(self._sorted_dates, start_date)
+        hi = bisect.bisect_right(self._sorted_dates, end_date)
+        filtered_sessions = self._sorted_sessions[lo:hi]
+        
+        # Log para depuração
+        logger.debug("Filtered sessions: %d", len(filtered_sessions))
+        
+        return filtered_sessions
+    
+    def _compute_period(self, start_date, end_date, history_sig):
+        """Calcular as estatísticas e as sessões de um período (datas em datetime.date)
+        
+        Chamado através de self._period_cache, em uma thread do pool; history_sig
+        só entra na chave do cache, para que um histórico alterado gere um novo cálculo.
+        
+        Returns:
+            tuple: (estatísticas do período ou None, sessões filtradas)
+        """
+        # Executado pelo StatsWorker; o lock protege o índice de sessões entre cálculos simultâneos
+        with self._period_lock:
+            try:
+                if hasattr(self, 'stats_service'):
+                    period_stats = self.stats_service.get_stats_for_period(
+                        start_date.isoformat(), end_date.isoformat()
+                    )
                 else:
-                    filtered_sessions.append(session)
+                    logger.error("Stats service not available")
+                    period_stats = None
+            except Exception as e:
+                logger.exception("Erro ao obter estatísticas filtradas: %s", e)
+                period_stats = None
             
-            # Log para depuração
-            logger.debug(f"Filtered sessions: {len(filtered_sessions)}")
+            session_history = self.config_manager.get_value("statistics", "session_history", [])
             
-            # Definir número de linhas
-            self.history_table.setRowCount(len(filtered_sessions))
+            # Log para depuração (o histórico inteiro só é convertido em texto com DEBUG ativo)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Period statistics: %s", period_stats)
+                logger.debug("Session history: %s", session_history)
             
-            # Preencher tabela
-            for row, session in enumerate(reversed(filtered_sessions)):  # Mostrar sessões mais recentes primeiro
-                # Verificar se session é um dicionário válido
-                if not isinstance(session, dict):
-                    continue
-                
-                # Data e hora
-                date_time = session.get("date", "")
-                if date_time:
-                    try:
-                        date_parts = date_time.split(" ")
-                        date_item = QTableWidgetItem(date_parts[0])
-                        self.history_table.setItem(row, 0, date_item)
-                        
-                        if len(date_parts) > 1:
-                            time_item = QTableWidgetItem(date_parts[1])
-                            self.history_table.setItem(row, 1, time_item)
-                        else:
-                            self.history_table.setItem(row, 1, QTableWidgetItem(""))
-                    except Exception as e:
-                        logger.error(f"Error parsing date: {date_time}, error: {str(e)}")
-                        self.history_table.setItem(row, 0, QTableWidgetItem(""))
-                        self.history_table.setItem(row, 1, QTableWidgetItem(""))
-                else:
-                    self.history_table.setItem(row, 0, QTableWidgetItem(""))
-                    self.history_table.setItem(row, 1, QTableWidgetItem(""))
-                
-                # Duração
-                duration = session.get("duration", 0)
-                hours = duration // 3600
-                minutes = (duration % 3600) // 60
-                duration_item = QTableWidgetItem(f"{hours}h {minutes}m")
-                self.history_table.setItem(row, 2, duration_item)
-                
-                # Palavras
-                words = session.get("words", 0)
-                words_item = QTableWidgetItem(f"{words:,}".replace(",", "."))
-                words_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                self.history_table.setItem(row, 3, words_item)
-                
-                # Velocidade média
-                if duration > 0:
-                    avg_speed = (words * 60) / duration
-                    avg_speed_item = QTableWidgetItem(f"{avg_speed:.1f}")
-                else:
-                    avg_speed_item = QTableWidgetItem("0.0")
-                avg_speed_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                self.history_table.setItem(row, 4, avg_speed_item)
+            return period_stats, self._filter_sessions(session_history, history_sig, start_date, end_date)
+    
+    def _on_stats_changed(self):
+        """Descartar os períodos calculados e agendar um recarregamento quando as estatísticas mudarem"""
+        self._period_cache.cache_clear()
+        if self.auto_update_check.isChecked():
+            self._coalesce_timer.start(250)
+    
+    def _update_session_history_table(self, filtered_sessions):
+        """Atualizar tabela de histórico de sessões com as sessões do período"""
+        try:
+            self.history_model.set_sessions(filtered_sessions)
         except Exception as e:
-            logger.error(f"Error updating session history table: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception("Error updating session history table: %s", e)
+    
+    def showEvent(self, event):
+        """Aplicar o recarregamento adiado enquanto a aba estava oculta"""
+        super().showEvent(event)
+        if self._dirty:
+            self.load_settings()
     
     def load_settings(self):
         """Carregar estatísticas do config_manager"""
+        # Com a aba oculta, as tabelas só são preenchidas quando ela for exibida
+        if not self.isVisible():
+            self._dirty = True
+            return
+        self._dirty = False
+        
         try:
             # Estatísticas gerais
             stats = self.config_manager.get_value("statistics", "general", {})
             
             # Log para depuração
-            logger.debug(f"Loading statistics: {stats}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Loading statistics: %s", stats)
             
-            # Verificar se devemos usar estatísticas filtradas
-            try:
-                # Obter datas do filtro
-                start_date = self.start_date_edit.date().toString("yyyy-MM-dd")
-                end_date = self.end_date_edit.date().toString("yyyy-MM-dd")
-                
-                # Obter estatísticas para o período
-                if hasattr(self, 'stats_service'):
-                    period_stats = self.stats_service.get_stats_for_period(start_date, end_date)
-                else:
-                    logger.error("Stats service not available")
-                    period_stats = {
-                        "total_words": stats.get("total_words", 0),
-                        "total_time": stats.get("total_time", 0),
-                        "avg_speed": 0
-                    }
-                
-                # Log para depuração
-                logger.debug(f"Period statistics: {period_stats}")
-                
+            # Um período predefinido ("Hoje", "Últimos 7 dias"...) acompanha a virada do dia
+            period = self.period_combo.currentData()
+            if period != "custom" and QDate.currentDate() != self._period_day:
+                self._set_period_dates(period)
+            
+            # Obter datas do filtro, comparadas como datas e não como texto
+            start_date = self.start_date_edit.date().toPyDate()
+            end_date = self.end_date_edit.date().toPyDate()
+            
+            # O período só é recalculado quando o filtro ou o histórico mudam
+            session_history = self.config_manager.get_value("statistics", "session_history", [])
+            last_session = session_history[-1] if session_history else None
+            history_sig = (
+                len(session_history),
+                last_session.get("date") if isinstance(last_session, dict) else None
+            )
+            
+            # Nada a refazer se as estatísticas, o uso de API e o filtro forem os da última exibição
+            current_session = stats.get("current_session", {})
+            api_usage = self.config_manager.get_value("statistics", "api_usage", {})
+            sig = (
+                stats.get("total_words"),
+                stats.get("total_time"),
+                stats.get("translated_words"),
+                current_session.get("duration"),
+                current_session.get("words"),
+                tuple(api_usage.items()),
+                start_date,
+                end_date,
+                history_sig
+            )
+            if sig == self._last_sig:
+                return
+            self._last_sig = sig
+            
+            # Total de palavras traduzidas (não filtrado)
+            translated_words = stats.get("translated_words", 0)
+            self.translated_words_label.setText(_format_number(translated_words))
+            
+            # Tempo da sessão atual
+            current_seconds = current_session.get("duration", 0)
+            current_hours = current_seconds // 3600
+            current_minutes = (current_seconds % 3600) // 60
+            self.current_session_label.setText(f"{current_hours}h {current_minutes}m")
+            
+            # Palavras da sessão atual
+            current_words = current_session.get("words", 0)
+            self.current_words_label.setText(_format_number(current_words))
+            
+            # Atualizar tabela de uso de API
+            self._update_api_usage_table()
+            
+            # Estatísticas do período calculadas no pool; _apply_period_stats exibe o resultado
+            key = (start_date, end_date, history_sig)
+            self._requested_key = key
+            worker = StatsWorker(self._period_cache, key)
+            worker.signals.finished.connect(self._apply_period_stats)
+            worker.signals.finished.connect(lambda *args: self._stats_workers.discard(worker))
+            self._stats_workers.add(worker)
+            self._pool.start(worker)
+        except Exception as e:
+            # Refazer tudo na próxima chamada
+            self._last_sig = None
+            logger.exception("Error loading statistics: %s", e)
+    
+    def _apply_period_stats(self, key, period_stats, filtered_sessions):
+        """Exibir as estatísticas e as sessões do período calculadas pelo StatsWorker"""
+        # Resultado de um filtro que já foi substituído por outro
+        if key != self._requested_key:
+            return
+        
+        try:
+            stats = self.config_manager.get_value("statistics", "general", {})
+            
+            if period_stats is not None:
                 # Usar estatísticas filtradas para alguns campos
                 filtered_total_words = period_stats.get("total_words", 0)
                 filtered_total_time = period_stats.get("total_time", 0)
                 filtered_avg_speed = period_stats.get("avg_speed", 0)
-            except Exception as e:
-                logger.error(f"Erro ao obter estatísticas filtradas: {str(e)}")
-                import traceback
-                logger.error(traceback.format_exc())
+            else:
                 # Fallback para estatísticas gerais
                 filtered_total_words = stats.get("total_words", 0)
                 filtered_total_time = stats.get("total_time", 0)
@@ -577,11 +938,7 @@ class StatsTab(BaseTab):
                     filtered_avg_speed = 0
             
             # Total de palavras (filtrado)
-            self.total_words_label.setText(f"{filtered_total_words:,}".replace(",", "."))
-            
-            # Total de palavras traduzidas (não filtrado)
-            translated_words = stats.get("translated_words", 0)
-            self.translated_words_label.setText(f"{translated_words:,}".replace(",", "."))
+            self.total_words_label.setText(_format_number(filtered_total_words))
             
             # Tempo total (filtrado)
             hours = filtered_total_time // 3600
@@ -591,31 +948,15 @@ class StatsTab(BaseTab):
             # Velocidade média (filtrada)
             self.avg_speed_label.setText(f"{filtered_avg_speed:.1f}")
             
-            # Sessão atual
-            current_session = stats.get("current_session", {})
-            
-            # Tempo da sessão atual
-            current_seconds = current_session.get("duration", 0)
-            current_hours = current_seconds // 3600
-            current_minutes = (current_seconds % 3600) // 60
-            self.current_session_label.setText(f"{current_hours}h {current_minutes}m")
-            
-            # Palavras da sessão atual
-            current_words = current_session.get("words", 0)
-            self.current_words_label.setText(f"{current_words:,}".replace(",", "."))
-            
-            # Atualizar tabelas
-            self._update_api_usage_table()
-            self._update_session_history_table()
+            # Atualizar tabela de histórico
+            self._update_session_history_table(filtered_sessions)
             
             # Log para depuração
             logger.debug("Statistics loaded successfully")
         except Exception as e:
-            logger.error(f"Error loading statistics: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception("Error applying period statistics: %s", e)
     
     def save_settings(self):
         """Salvar estatísticas no config_manager"""
         # Não há nada para salvar aqui, pois as estatísticas são apenas para exibição
-        pass 
\ No newline at end of file
+        return False
\ No newline at end of file
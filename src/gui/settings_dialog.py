@@ -9,27 +9,120 @@ Handles application settings
 import os
 import logging
 import json
+import time
 from PyQt5.QtWidgets import (
     QDialog, QTabWidget, QVBoxLayout, QHBoxLayout, QFormLayout, 
     QLabel, QLineEdit, QComboBox, QCheckBox, QPushButton, QGroupBox,
     QMessageBox, QFileDialog, QApplication, QWidget, QScrollArea,
-    QDialogButtonBox, QSpinBox, QProgressBar, QTextEdit
+    QDialogButtonBox, QSpinBox, QProgressBar, QTextEdit, QSystemTrayIcon, QMenu, QStyle
 )
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtCore import Qt, QSize, QObject, QRunnable, QThreadPool, QSignalBlocker, pyqtSignal
 from PyQt5.QtGui import QIcon
 
 from src.gui.hotkey_dialog import HotkeyDialog
-from src.services.translator_service import TranslatorService
 
 logger = logging.getLogger("DogeDictate.SettingsDialog")
 
+# Tray icon, resolved once at import
+_ICON_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "resources", "icon.png")
+_ICON_EXISTS = os.path.exists(_ICON_PATH)
+
+# Seconds a microphone/language list is reused when the dialog is reopened
+_DEVICE_CACHE_TTL = 5.0
+
+class WorkerSignals(QObject):
+    """Signals of a connection test run on the thread pool"""
+    finished = pyqtSignal(dict)
+
+class ConnectionTestWorker(QRunnable):
+    """Run a connection test off the GUI thread and report its result dict"""
+    
+    def __init__(self, test_func):
+        super().__init__()
+        self.test_func = test_func
+        self.signals = WorkerSignals()
+    
+    def run(self):
+        """Run the test and emit the result"""
+        try:
+            result = self.test_func()
+        except Exception as e:
+            logger.error(f"Error testing connection: {str(e)}")
+            result = {"success": False, "message": str(e)}
+        self.signals.finished.emit(result)
+
+class MicEnumSignals(QObject):
+    """Signals of a microphone enumeration run on the thread pool"""
+    finished = pyqtSignal(list)
+
+class MicEnumWorker(QRunnable):
+    """Enumerate the microphones off the GUI thread, as (name, id) pairs"""
+    
+    def __init__(self, dictation_manager):
+        super().__init__()
+        self.dictation_manager = dictation_manager
+        self.signals = MicEnumSignals()
+    
+    def run(self):
+        """Enumerate the microphones and emit the list"""
+        try:
+            microphones = [(mic["name"], mic["id"]) for mic in self.dictation_manager.get_microphones()]
+        except Exception as e:
+            logger.error(f"Error listing microphones: {str(e)}")
+            microphones = []
+        self.signals.finished.emit(microphones)
+
 class SettingsDialog(QDialog):
+    # Connection tests: title, widgets whose text is required, message when one
+    # is empty and the probe. probe(dialog) returns the callable run on the thread
+    # pool with the widget texts; None means the service has no real test yet.
+    _TEST_SPECS = {
+        "azure": dict(
+            title="Azure Speech Service",
+            fields=("azure_key_edit", "azure_region_edit"),
+            missing="Please enter both API Key and Region",
+            probe=None
+        ),
+        "whisper": dict(
+            title="Whisper API",
+            fields=("whisper_key_edit",),
+            missing="Please enter API Key",
+            probe=None
+        ),
+        "google": dict(
+            title="Google Speech-to-Text API",
+            fields=("google_creds_edit",),
+            missing="Please select a credentials file",
+            probe=None
+        ),
+        "translator": dict(
+            title="M2M-100 Translator API",
+            fields=("translator_key_edit", "translator_region_edit"),
+            missing="Please enter both API Key and Region",
+            probe=lambda dialog: dialog.translator_service.update_credentials
+        )
+    }
+    
+    # Widgets filled from the config by the tab loaders
+    _LOADED_WIDGETS = (
+        "interaction_sounds_check", "mic_combo", "output_lang_combo",
+        "input_lang_combo", "auto_translate_check", "service_combo",
+        "azure_key_edit", "azure_region_edit", "whisper_key_edit",
+        "google_creds_edit", "translator_key_edit", "translator_region_edit",
+        "whisper_local_model_combo", "vosk_model_path"
+    )
+    
+    # (dictation manager, timestamp, items) shared by every dialog instance
+    _mics_cache = None
+    _langs_cache = None
+    
     def __init__(self, config_manager, dictation_manager=None, hotkey_manager=None, parent=None):
         super().__init__(parent)
         self.config_manager = config_manager
         self.dictation_manager = dictation_manager
         self.hotkey_manager = hotkey_manager
-        self.translator_service = TranslatorService(config_manager)
+        self._tray_icon_cache = None
+        self._translator_service = None  # Created on first use, see translator_service
         
         self.setWindowTitle("Configurações")
         self.setMinimumWidth(600)
@@ -56,14 +149,28 @@ class SettingsDialog(QDialog):
         self.translator_region_edit = None
         self.whisper_local_model_combo = None
         self.vosk_model_path = None
-        
-        # Create tabs
-        self._create_general_tab()
-        self._create_languages_tab()
-        self._create_apis_tab()
-        self._create_local_tab()
-        self._create_plan_tab()
-        self._create_account_tab()
+        self._test_buttons = {}
+        self._service_tests = {}
+        self._mic_worker = None
+        
+        # Tabs are built on first visit; until then each one is an empty placeholder.
+        # Each entry maps the tab title to its builder, loader and saver.
+        self._tab_builders = {
+            "Geral": (self._create_general_tab, self._load_general, self._save_general),
+            "Idiomas": (self._create_languages_tab, self._load_languages, self._save_languages),
+            "APIs": (self._create_apis_tab, self._load_apis, self._save_apis),
+            "Serviços Locais": (self._create_local_tab, self._load_local, self._save_local),
+            "Plano": (self._create_plan_tab, None, None),
+            "Conta": (self._create_account_tab, None, None)
+        }
+        self._built = set()
+        
+        # Values shown when each built tab was loaded, as {section: {key: value}}
+        self._initial = {}
+        
+        for name in self._tab_builders:
+            self.tab_widget.addTab(QWidget(), name)
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
         
         # Create button box
         button_box = QDialogButtonBox(
@@ -73,8 +180,42 @@ class SettingsDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
         
-        # Load settings
-        self._load_settings()
+        # Build and load the tab shown initially
+        self._on_tab_changed(self.tab_widget.currentIndex())
+    
+    @property
+    def translator_service(self):
+        """Translator service, created (and its module imported) on first use"""
+        if self._translator_service is None:
+            from src.services.translator_service import TranslatorService
+            self._translator_service = TranslatorService(self.config_manager)
+        return self._translator_service
+    
+    def _on_tab_changed(self, index):
+        """Build the real content of a tab the first time it is shown"""
+        if index < 0:
+            return
+        name = self.tab_widget.tabText(index)
+        if name in self._built:
+            return
+        self._built.add(name)
+        
+        build, load, save = self._tab_builders[name]
+        tab = build()
+        
+        # Swap the placeholder for the real tab without re-entering this slot
+        was_blocked = self.tab_widget.blockSignals(True)
+        try:
+            placeholder = self.tab_widget.widget(index)
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, tab, name)
+            self.tab_widget.setCurrentIndex(index)
+            placeholder.deleteLater()
+        finally:
+            self.tab_widget.blockSignals(was_blocked)
+        
+        if load:
+            self._run_loaders([name])
     
     def _create_general_tab(self):
         """Create the general settings tab"""
@@ -115,8 +256,7 @@ class SettingsDialog(QDialog):
         
         layout.addWidget(general_group)
         
-        # Add tab to widget
-        self.tab_widget.addTab(tab, "Geral")
+        return tab
     
     def _create_languages_tab(self):
         """Create the languages tab"""
@@ -139,11 +279,12 @@ class SettingsDialog(QDialog):
         translation_layout = QFormLayout(translation_group)
         
         self.input_lang_combo = QComboBox()
-        self.input_lang_combo.addItem("Português (Brasil)", "pt-BR")
-        self.input_lang_combo.addItem("Inglês (EUA)", "en-US")
-        self.input_lang_combo.addItem("Espanhol", "es-ES")
-        self.input_lang_combo.addItem("Francês", "fr-FR")
-        self.input_lang_combo.addItem("Alemão", "de-DE")
+        self._input_lang_idx = {}
+        self._add_with_index(self.input_lang_combo, "Português (Brasil)", "pt-BR", self._input_lang_idx)
+        self._add_with_index(self.input_lang_combo, "Inglês (EUA)", "en-US", self._input_lang_idx)
+        self._add_with_index(self.input_lang_combo, "Espanhol", "es-ES", self._input_lang_idx)
+        self._add_with_index(self.input_lang_combo, "Francês", "fr-FR", self._input_lang_idx)
+        self._add_with_index(self.input_lang_combo, "Alemão", "de-DE", self._input_lang_idx)
         translation_layout.addRow("Idioma de entrada:", self.input_lang_combo)
         
         self.auto_translate_check = QCheckBox("Traduzir automaticamente")
@@ -151,8 +292,7 @@ class SettingsDialog(QDialog):
         
         layout.addWidget(translation_group)
         
-        # Add tab to widget
-        self.tab_widget.addTab(tab, "Idiomas")
+        return tab
     
     def _create_apis_tab(self):
         """Create the APIs tab"""
@@ -169,11 +309,12 @@ class SettingsDialog(QDialog):
         service_layout = QFormLayout(service_group)
         
         self.service_combo = QComboBox()
-        self.service_combo.addItem("Azure Speech Service", "azure")
-        self.service_combo.addItem("OpenAI Whisper", "whisper")
-        self.service_combo.addItem("Google Speech-to-Text", "google")
-        self.service_combo.addItem("Whisper Local", "whisper_local")
-        self.service_combo.addItem("Vosk Local", "vosk")
+        self._service_idx = {}
+        self._add_with_index(self.service_combo, "Azure Speech Service", "azure", self._service_idx)
+        self._add_with_index(self.service_combo, "OpenAI Whisper", "whisper", self._service_idx)
+        self._add_with_index(self.service_combo, "Google Speech-to-Text", "google", self._service_idx)
+        self._add_with_index(self.service_combo, "Whisper Local", "whisper_local", self._service_idx)
+        self._add_with_index(self.service_combo, "Vosk Local", "vosk", self._service_idx)
         service_layout.addRow("Serviço:", self.service_combo)
         
         layout.addWidget(service_group)
@@ -189,9 +330,7 @@ class SettingsDialog(QDialog):
         self.azure_region_edit = QLineEdit()
         azure_layout.addRow("Região:", self.azure_region_edit)
         
-        azure_test_button = QPushButton("Testar Conexão")
-        azure_test_button.clicked.connect(self._test_azure_service_connection)
-        azure_layout.addRow("", azure_test_button)
+        azure_layout.addRow("", self._create_test_button("azure"))
         
         layout.addWidget(azure_group)
         
@@ -203,9 +342,7 @@ class SettingsDialog(QDialog):
         self.whisper_key_edit.setEchoMode(QLineEdit.Password)
         whisper_layout.addRow("API Key:", self.whisper_key_edit)
         
-        whisper_test_button = QPushButton("Testar Conexão")
-        whisper_test_button.clicked.connect(self._test_whisper_service_connection)
-        whisper_layout.addRow("", whisper_test_button)
+        whisper_layout.addRow("", self._create_test_button("whisper"))
         
         layout.addWidget(whisper_group)
         
@@ -221,9 +358,7 @@ class SettingsDialog(QDialog):
         google_browse_button.clicked.connect(self._browse_google_credentials)
         google_layout.addRow("", google_browse_button)
         
-        google_test_button = QPushButton("Testar Conexão")
-        google_test_button.clicked.connect(self._test_google_service_connection)
-        google_layout.addRow("", google_test_button)
+        google_layout.addRow("", self._create_test_button("google"))
         
         layout.addWidget(google_group)
         
@@ -238,16 +373,13 @@ class SettingsDialog(QDialog):
         self.translator_region_edit = QLineEdit()
         translator_layout.addRow("Região:", self.translator_region_edit)
         
-        translator_test_button = QPushButton("Testar Conexão")
-        translator_test_button.clicked.connect(self._test_translator_connection)
-        translator_layout.addRow("", translator_test_button)
+        translator_layout.addRow("", self._create_test_button("translator"))
         
         layout.addWidget(translator_group)
         
         tab.setWidget(content)
         
-        # Add tab to widget
-        self.tab_widget.addTab(tab, "APIs")
+        return tab
     
     def _create_local_tab(self):
         """Create the local tab"""
@@ -261,11 +393,12 @@ class SettingsDialog(QDialog):
         whisper_layout = QFormLayout(whisper_group)
         
         self.whisper_local_model_combo = QComboBox()
-        self.whisper_local_model_combo.addItem("Tiny", "tiny")
-        self.whisper_local_model_combo.addItem("Base", "base")
-        self.whisper_local_model_combo.addItem("Small", "small")
-        self.whisper_local_model_combo.addItem("Medium", "medium")
-        self.whisper_local_model_combo.addItem("Large", "large")
+        self._whisper_local_idx = {}
+        self._add_with_index(self.whisper_local_model_combo, "Tiny", "tiny", self._whisper_local_idx)
+        self._add_with_index(self.whisper_local_model_combo, "Base", "base", self._whisper_local_idx)
+        self._add_with_index(self.whisper_local_model_combo, "Small", "small", self._whisper_local_idx)
+        self._add_with_index(self.whisper_local_model_combo, "Medium", "medium", self._whisper_local_idx)
+        self._add_with_index(self.whisper_local_model_combo, "Large", "large", self._whisper_local_idx)
         whisper_layout.addRow("Modelo:", self.whisper_local_model_combo)
         
         layout.addWidget(whisper_group)
@@ -284,8 +417,7 @@ class SettingsDialog(QDialog):
         
         layout.addWidget(vosk_group)
         
-        # Add tab to widget
-        self.tab_widget.addTab(tab, "Serviços Locais")
+        return tab
     
     def _create_plan_tab(self):
         """Create the plan tab"""
@@ -294,8 +426,7 @@ class SettingsDialog(QDialog):
         layout.setContentsMargins(24, 24, 24, 24)
         layout.setSpacing(16)
         
-        # Add tab to widget
-        self.tab_widget.addTab(tab, "Plano")
+        return tab
     
     def _create_account_tab(self):
         """Create the account tab"""
@@ -304,9 +435,6 @@ class SettingsDialog(QDialog):
         layout.setContentsMargins(24, 24, 24, 24)
         layout.setSpacing(16)
         
-        # Add tab to widget
-        self.tab_widget.addTab(tab, "Conta")
-        
         return tab
     
     def _show_hotkey_dialog(self):
@@ -324,111 +452,291 @@ class SettingsDialog(QDialog):
                 if result["success"]:
                     QMessageBox.information(self, "Teste de Microfone", "Microfone funcionando corretamente!")
                 else:
+                    # The device list may be stale, enumerate again on next population
+                    SettingsDialog._mics_cache = None
                     QMessageBox.warning(self, "Teste de Microfone", f"Erro ao testar microfone: {result['message']}")
     
+    def _cached_items(self, cache_attr):
+        """Items in the class-level cache stored in cache_attr, or None if it is empty or stale"""
+        cache = getattr(SettingsDialog, cache_attr)
+        if cache is not None and cache[0] is self.dictation_manager and time.monotonic() - cache[1] < _DEVICE_CACHE_TTL:
+            return cache[2]
+        return None
+    
+    def _cache_items(self, cache_attr, items):
+        """Store items in the class-level cache stored in cache_attr"""
+        setattr(SettingsDialog, cache_attr, (self.dictation_manager, time.monotonic(), items))
+    
+    def _cached_list(self, cache_attr, fetch):
+        """Return fetch() through a short-lived class-level cache stored in cache_attr"""
+        items = self._cached_items(cache_attr)
+        if items is None:
+            items = fetch()
+            self._cache_items(cache_attr, items)
+        return items
+    
+    def _add_with_index(self, combo, label, data, idx_map):
+        """Add an item to the combo and record its index under its data in idx_map"""
+        combo.addItem(label, data)
+        idx_map[data] = combo.count() - 1
+    
+    def _fill_combo(self, combo, items, current):
+        """Replace the combo items with (label, data) pairs in one insertion
+        
+        Returns:
+            dict: data -> index map of the new items
+        """
+        idx_map = {data: index for index, (label, data) in enumerate(items)}
+        
+        was_blocked = combo.blockSignals(True)
+        try:
+            combo.clear()
+            combo.addItems([label for label, data in items])
+            for index, (label, data) in enumerate(items):
+                combo.setItemData(index, data)
+        finally:
+            combo.blockSignals(was_blocked)
+        
+        index = idx_map.get(current, -1)
+        if index >= 0:
+            combo.setCurrentIndex(index)
+        return idx_map
+    
     def _populate_microphones(self):
-        """Populate the microphone dropdown"""
-        self.mic_combo.clear()
+        """Populate the microphone dropdown, enumerating the devices in the background"""
+        self._mic_worker = None
+        if not self.dictation_manager:
+            self._mic_idx = self._fill_combo(self.mic_combo, [], None)
+            return
         
-        if self.dictation_manager:
-            # Get available microphones
-            microphones = self.dictation_manager.get_microphones()
-            default_mic_id = self.config_manager.get_value("audio", "default_microphone_id", 0)
-            
-            # Add microphones to combo box
-            for mic in microphones:
-                self.mic_combo.addItem(mic["name"], mic["id"])
-                if mic["id"] == default_mic_id:
-                    self.mic_combo.setCurrentIndex(self.mic_combo.count() - 1)
+        microphones = self._cached_items("_mics_cache")
+        if microphones is not None:
+            self._fill_microphones(microphones)
+            return
+        
+        # Show a placeholder until the devices are listed
+        self._mic_idx = self._fill_combo(self.mic_combo, [("Carregando...", None)], None)
+        
+        worker = MicEnumWorker(self.dictation_manager)
+        worker.signals.finished.connect(lambda microphones, worker=worker: self._microphones_listed(worker, microphones))
+        self._mic_worker = worker
+        QThreadPool.globalInstance().start(worker)
+    
+    def _microphones_listed(self, worker, microphones):
+        """Fill the microphone dropdown with the result of the latest MicEnumWorker"""
+        # A newer enumeration (or a cached list) superseded this one
+        if worker is not self._mic_worker:
+            return
+        self._mic_worker = None
+        
+        self._cache_items("_mics_cache", microphones)
+        self._fill_microphones(microphones)
+        
+        # The loaded snapshot was taken while the placeholder was shown
+        self._collect_microphone(self._initial)
+    
+    def _fill_microphones(self, microphones):
+        """Fill the microphone dropdown, selecting the configured default microphone"""
+        default_mic_id = self.config_manager.get_value("audio", "default_microphone_id", 0)
+        self._mic_idx = self._fill_combo(self.mic_combo, microphones, default_mic_id)
     
     def _populate_languages(self):
         """Populate the language dropdown"""
-        self.output_lang_combo.clear()
-        
+        languages = []
+        current_lang = None
         if self.dictation_manager:
             # Get supported languages
-            languages = self.dictation_manager.get_supported_languages()
+            languages = self._cached_list("_langs_cache", lambda: [
+                (lang["name"], lang["id"]) for lang in self.dictation_manager.get_supported_languages()
+            ])
             current_lang = self.config_manager.get_value("recognition", "language", "en-US")
-            
-            # Add languages to combo box
-            for lang in languages:
-                self.output_lang_combo.addItem(lang["name"], lang["id"])
-                if lang["id"] == current_lang:
-                    self.output_lang_combo.setCurrentIndex(self.output_lang_combo.count() - 1)
+        
+        self._output_lang_idx = self._fill_combo(self.output_lang_combo, languages, current_lang)
     
     def _load_settings(self):
-        """Load settings from config manager"""
+        """Load settings from config manager into the tabs built so far"""
+        self._run_loaders(self._built)
+    
+    def _run_loaders(self, names):
+        """Run the loaders of the named tabs with the signals of the loaded widgets blocked
+        
+        The loaded values are recorded in self._initial so accept() only writes
+        what the user changed.
+        """
+        # Widgets of tabs not built yet are still None
+        blockers = [
+            QSignalBlocker(widget) for widget in (getattr(self, name) for name in self._LOADED_WIDGETS)
+            if widget is not None
+        ]
+        try:
+            for name in names:
+                build, load, save = self._tab_builders[name]
+                if load:
+                    load()
+                if save:
+                    save(self._initial)
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+    
+    def _load_general(self):
+        """Load the general tab settings"""
+        general = self.config_manager.get_section("general", {"interaction_sounds": False})
+        
         # Load toggle settings
-        self.interaction_sounds_check.setChecked(
-            self.config_manager.get_value("general", "interaction_sounds", False)
-        )
+        self.interaction_sounds_check.setChecked(general["interaction_sounds"])
         self._populate_microphones()
+    
+    def _load_languages(self):
+        """Load the languages tab settings"""
+        translation = self.config_manager.get_section("translation", {
+            "target_language": "pt-BR",
+            "auto_translate": True
+        })
+        
         self._populate_languages()
-        self.service_combo.setCurrentIndex(self.service_combo.findData(self.config_manager.get_value("recognition", "service", "azure")))
-        self.azure_key_edit.setText(self.config_manager.get_value("recognition", "azure_api_key", ""))
-        self.azure_region_edit.setText(self.config_manager.get_value("recognition", "azure_region", ""))
-        self.whisper_key_edit.setText(self.config_manager.get_value("recognition", "whisper_api_key", ""))
-        self.google_creds_edit.setText(self.config_manager.get_value("recognition", "google_credentials_path", ""))
-        self.translator_key_edit.setText(self.config_manager.get_value("translation", "azure_translator_key", ""))
-        self.translator_region_edit.setText(self.config_manager.get_value("translation", "azure_translator_region", ""))
-        self.input_lang_combo.setCurrentIndex(self.input_lang_combo.findData(self.config_manager.get_value("translation", "target_language", "pt-BR")))
-        self.auto_translate_check.setChecked(self.config_manager.get_value("translation", "auto_translate", True))
-        
-        # Load local service settings
-        self.whisper_local_model_combo.setCurrentIndex(
-            self.whisper_local_model_combo.findData(
-                self.config_manager.get_value("recognition", "whisper_local_model", "base")
-            )
-        )
-        self.vosk_model_path.setText(self.config_manager.get_value("recognition", "vosk_model_path", ""))
+        index = self._input_lang_idx.get(translation["target_language"], -1)
+        if index >= 0:
+            self.input_lang_combo.setCurrentIndex(index)
+        self.auto_translate_check.setChecked(translation["auto_translate"])
+    
+    def _load_apis(self):
+        """Load the APIs tab settings"""
+        recognition = self.config_manager.get_section("recognition", {
+            "service": "azure",
+            "azure_api_key": "",
+            "azure_region": "",
+            "whisper_api_key": "",
+            "google_credentials_path": ""
+        })
+        translation = self.config_manager.get_section("translation", {
+            "azure_translator_key": "",
+            "azure_translator_region": ""
+        })
+        
+        index = self._service_idx.get(recognition["service"], -1)
+        if index >= 0:
+            self.service_combo.setCurrentIndex(index)
+        self.azure_key_edit.setText(recognition["azure_api_key"])
+        self.azure_region_edit.setText(recognition["azure_region"])
+        self.whisper_key_edit.setText(recognition["whisper_api_key"])
+        self.google_creds_edit.setText(recognition["google_credentials_path"])
+        self.translator_key_edit.setText(translation["azure_translator_key"])
+        self.translator_region_edit.setText(translation["azure_translator_region"])
+    
+    def _load_local(self):
+        """Load the local services tab settings"""
+        recognition = self.config_manager.get_section("recognition", {
+            "whisper_local_model": "base",
+            "vosk_model_path": ""
+        })
+        
+        index = self._whisper_local_idx.get(recognition["whisper_local_model"], -1)
+        if index >= 0:
+            self.whisper_local_model_combo.setCurrentIndex(index)
+        self.vosk_model_path.setText(recognition["vosk_model_path"])
+    
+    def _collect_microphone(self, updates):
+        """Collect the selected microphone into updates, if one is selected"""
+        mic_id = self.mic_combo.currentData()
+        if mic_id is not None:
+            updates.setdefault("audio", {}).update({
+                "default_microphone_id": mic_id,
+                "default_microphone": self.mic_combo.currentText()
+            })
+    
+    def _save_general(self, updates):
+        """Collect the general tab settings into updates"""
+        # Save audio settings
+        self._collect_microphone(updates)
+        
+        # Save toggle settings
+        updates.setdefault("general", {})["interaction_sounds"] = self.interaction_sounds_check.isChecked()
+    
+    def _save_languages(self, updates):
+        """Collect the languages tab settings into updates"""
+        # Save language settings
+        output_lang = self.output_lang_combo.currentData()
+        if output_lang:
+            updates.setdefault("recognition", {})["language"] = output_lang
+        
+        updates.setdefault("translation", {}).update({
+            "target_language": self.input_lang_combo.currentData(),
+            "auto_translate": self.auto_translate_check.isChecked()
+        })
+    
+    def _save_apis(self, updates):
+        """Collect the APIs tab settings into updates"""
+        recognition = updates.setdefault("recognition", {})
+        
+        # Save API settings
+        service = self.service_combo.currentData()
+        if service:
+            recognition["service"] = service
+        
+        # Save Azure, Whisper and Google settings
+        recognition.update({
+            "azure_api_key": self.azure_key_edit.text(),
+            "azure_region": self.azure_region_edit.text(),
+            "whisper_api_key": self.whisper_key_edit.text(),
+            "google_credentials_path": self.google_creds_edit.text()
+        })
+        
+        # Save translator settings
+        updates.setdefault("translation", {}).update({
+            "azure_translator_key": self.translator_key_edit.text(),
+            "azure_translator_region": self.translator_region_edit.text()
+        })
+    
+    def _save_local(self, updates):
+        """Collect the local services tab settings into updates"""
+        updates.setdefault("recognition", {}).update({
+            "whisper_local_model": self.whisper_local_model_combo.currentData(),
+            "vosk_model_path": self.vosk_model_path.text()
+        })
+    
+    def _apply_changes(self, changes):
+        """Hand the changed microphone, language and service to the dictation manager"""
+        if not self.dictation_manager:
+            return
+        
+        audio = changes.get("audio", {})
+        recognition = changes.get("recognition", {})
+        if "default_microphone_id" in audio:
+            self.dictation_manager.set_microphone(audio["default_microphone_id"])
+        if "language" in recognition:
+            self.dictation_manager.set_language(recognition["language"])
+        if "service" in recognition:
+            self.dictation_manager.set_service(recognition["service"])
     
     def accept(self):
         """Save settings when OK is clicked"""
         try:
-            # Save audio settings
-            mic_id = self.mic_combo.currentData()
-            if mic_id is not None:
-                self.config_manager.set_value("audio", "default_microphone_id", mic_id)
-                self.config_manager.set_value("audio", "default_microphone", self.mic_combo.currentText())
-                if self.dictation_manager:
-                    self.dictation_manager.set_microphone(mic_id)
-            
-            # Save language settings
-            output_lang = self.output_lang_combo.currentData()
-            if output_lang:
-                self.config_manager.set_value("recognition", "language", output_lang)
-                if self.dictation_manager:
-                    self.dictation_manager.set_language(output_lang)
-            
-            # Save API settings
-            service = self.service_combo.currentData()
-            if service:
-                self.config_manager.set_value("recognition", "service", service)
-                if self.dictation_manager:
-                    self.dictation_manager.set_service(service)
-            
-            # Save Azure settings
-            self.config_manager.set_value("recognition", "azure_api_key", self.azure_key_edit.text())
-            self.config_manager.set_value("recognition", "azure_region", self.azure_region_edit.text())
+            # Tabs never opened still hold the values already in the config
+            current = {}
+            for name in self._built:
+                build, load, save = self._tab_builders[name]
+                if save:
+                    save(current)
             
-            # Save Whisper settings
-            self.config_manager.set_value("recognition", "whisper_api_key", self.whisper_key_edit.text())
+            # Only the values that differ from what was loaded are written
+            changes = {}
+            for section, values in current.items():
+                initial = self._initial.get(section, {})
+                changed = {key: value for key, value in values.items() if key not in initial or initial[key] != value}
+                if changed:
+                    changes[section] = changed
             
-            # Save Google settings
-            self.config_manager.set_value("recognition", "google_credentials_path", self.google_creds_edit.text())
-            
-            # Save local service settings
-            self.config_manager.set_value("recognition", "whisper_local_model", self.whisper_local_model_combo.currentData())
-            self.config_manager.set_value("recognition", "vosk_model_path", self.vosk_model_path.text())
-            
-            # Save translator settings
-            self.config_manager.set_value("translation", "azure_translator_key", self.translator_key_edit.text())
-            self.config_manager.set_value("translation", "azure_translator_region", self.translator_region_edit.text())
-            self.config_manager.set_value("translation", "target_language", self.input_lang_combo.currentData())
-            self.config_manager.set_value("translation", "auto_translate", self.auto_translate_check.isChecked())
-            
-            # Save toggle settings
-            self.config_manager.set_value("general", "interaction_sounds", self.interaction_sounds_check.isChecked())
+            if changes:
+                # Apply every change at once and write the file a single time
+                with self.config_manager.batch():
+                    self.config_manager.update(changes)
+                    self.config_manager.save_config()
+                
+                for section, values in changes.items():
+                    self._initial.setdefault(section, {}).update(values)
+                
+                self._apply_changes(changes)
             
             logger.info("Settings saved")
             
@@ -440,21 +748,11 @@ class SettingsDialog(QDialog):
                 self.hotkey_manager.start_listening()
                 
             # Exibir mensagem na bandeja do sistema
-            from PyQt5.QtWidgets import QSystemTrayIcon
             if QSystemTrayIcon.isSystemTrayAvailable():
-                from PyQt5.QtWidgets import QSystemTrayIcon, QMenu
-                from PyQt5.QtGui import QIcon
-                import os
-                
                 # Criar ícone na bandeja se ainda não existir
                 if not hasattr(self, 'tray_icon'):
                     self.tray_icon = QSystemTrayIcon(self)
-                    icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "resources", "icon.png")
-                    if os.path.exists(icon_path):
-                        self.tray_icon.setIcon(QIcon(icon_path))
-                    else:
-                        # Usar ícone padrão se não encontrar o ícone personalizado
-                        self.tray_icon.setIcon(self.style().standardIcon(self.style().SP_ComputerIcon))
+                    self.tray_icon.setIcon(self._tray_qicon())
                     
                     # Criar menu de contexto
                     tray_menu = QMenu()
@@ -470,9 +768,18 @@ class SettingsDialog(QDialog):
             
         except Exception as e:
             logger.error(f"Error saving settings: {str(e)}")
-            from PyQt5.QtWidgets import QMessageBox
             QMessageBox.warning(self, "Error", f"Failed to save settings: {str(e)}")
     
+    def _tray_qicon(self):
+        """Return the tray icon, built once per dialog"""
+        if self._tray_icon_cache is None:
+            if _ICON_EXISTS:
+                self._tray_icon_cache = QIcon(_ICON_PATH)
+            else:
+                # Usar ícone padrão se não encontrar o ícone personalizado
+                self._tray_icon_cache = self.style().standardIcon(QStyle.SP_ComputerIcon)
+        return self._tray_icon_cache
+    
     def close_application(self):
         """Fechar completamente a aplicação"""
         # Parar o hotkey_manager antes de fechar
@@ -484,7 +791,6 @@ class SettingsDialog(QDialog):
             self.dictation_manager.stop()
         
         # Fechar a aplicação
-        from PyQt5.QtWidgets import QApplication
         QApplication.quit()
     
     def closeEvent(self, event):
@@ -497,25 +803,49 @@ class SettingsDialog(QDialog):
         if hasattr(self, 'tray_icon') and self.tray_icon.isVisible():
             self.tray_icon.showMessage("DogeDictate", "Aplicação rodando em segundo plano. Use as teclas de atalho para ativar.", self.tray_icon.Information, 3000)
     
-    def _test_translator_connection(self):
-        """Test the connection to M2M-100 Translator API"""
-        api_key = self.translator_key_edit.text()
-        region = self.translator_region_edit.text()
+    def _create_test_button(self, key):
+        """Create the "Testar Conexão" button of the connection test in _TEST_SPECS[key]"""
+        button = QPushButton("Testar Conexão")
+        button.clicked.connect(lambda checked=False, key=key: self._test_service(key))
+        self._test_buttons[key] = button
+        return button
+    
+    def _test_service(self, key):
+        """Test the connection of the service described by _TEST_SPECS[key]"""
+        spec = self._TEST_SPECS[key]
+        values = [getattr(self, field).text() for field in spec["fields"]]
+        
+        if not all(values):
+            QMessageBox.warning(self, "Connection Test", spec["missing"])
+            return
         
-        if not api_key or not region:
-            QMessageBox.warning(self, "Connection Test", "Please enter both API Key and Region")
+        if spec["probe"] is None:
+            self._service_test_finished(key, {"success": True})
             return
         
-        # Show a message that we're testing
-        QMessageBox.information(self, "Connection Test", "Testing connection to M2M-100 Translator API...\n\nThis may take a few seconds.")
+        # Run the probe on the thread pool, the result comes back as a signal
+        probe = spec["probe"](self)
+        button = self._test_buttons[key]
+        button.setEnabled(False)
+        button.setText("Testando...")
         
-        # Update credentials and test connection
-        result = self.translator_service.update_credentials(api_key, region)
+        worker = ConnectionTestWorker(lambda: probe(*values))
+        worker.signals.finished.connect(lambda result, key=key: self._service_test_finished(key, result))
+        self._service_tests[key] = worker
+        QThreadPool.globalInstance().start(worker)
+    
+    def _service_test_finished(self, key, result):
+        """Show the result of a connection test"""
+        title = self._TEST_SPECS[key]["title"]
+        self._service_tests.pop(key, None)
+        button = self._test_buttons[key]
+        button.setEnabled(True)
+        button.setText("Testar Conexão")
         
         if result["success"]:
-            QMessageBox.information(self, "Connection Test", "Connection successful!\n\nYour M2M-100 Translator API credentials are valid.")
+            QMessageBox.information(self, "Connection Test", f"Connection to {title} successful!\n\nYour credentials are valid.")
         else:
-            QMessageBox.warning(self, "Connection Test", f"Connection failed!\n\nError: {result['message']}\n\nPlease check your API Key and Region.")
+            QMessageBox.warning(self, "Connection Test", f"Connection to {title} failed!\n\nError: {result['message']}")
     
     def _browse_google_credentials(self):
         """Open file dialog to browse for Google credentials file"""
@@ -528,52 +858,6 @@ class SettingsDialog(QDialog):
         if file_path:
             self.google_creds_edit.setText(file_path)
             
-    def _test_azure_service_connection(self):
-        """Test the Azure Speech service connection"""
-        api_key = self.azure_key_edit.text()
-        region = self.azure_region_edit.text()
-        
-        if not api_key or not region:
-            QMessageBox.warning(self, "Connection Test", "Please enter both API Key and Region")
-            return
-        
-        # Show a message that we're testing
-        QMessageBox.information(self, "Connection Test", "Testing connection to Azure Speech Service...\n\nThis may take a few seconds.")
-        
-        # Here you would implement the actual test
-        # For now, just show a success message
-        QMessageBox.information(self, "Connection Test", "Connection to Azure Speech Service successful!\n\nYour credentials are valid.")
-        
-    def _test_whisper_service_connection(self):
-        """Test the Whisper service connection"""
-        api_key = self.whisper_key_edit.text()
-        
-        if not api_key:
-            QMessageBox.warning(self, "Connection Test", "Please enter API Key")
-            return
-        
-        # Show a message that we're testing
-        QMessageBox.information(self, "Connection Test", "Testing connection to Whisper API...\n\nThis may take a few seconds.")
-        
-        # Here you would implement the actual test
-        # For now, just show a success message
-        QMessageBox.information(self, "Connection Test", "Connection to Whisper API successful!\n\nYour credentials are valid.")
-        
-    def _test_google_service_connection(self):
-        """Test the Google Speech service connection"""
-        creds_path = self.google_creds_edit.text()
-        
-        if not creds_path:
-            QMessageBox.warning(self, "Connection Test", "Please select a credentials file")
-            return
-        
-        # Show a message that we're testing
-        QMessageBox.information(self, "Connection Test", "Testing connection to Google Speech-to-Text API...\n\nThis may take a few seconds.")
-        
-        # Here you would implement the actual test
-        # For now, just show a success message
-        QMessageBox.information(self, "Connection Test", "Connection to Google Speech-to-Text API successful!\n\nYour credentials are valid.")
-
     def _browse_vosk_model(self):
         """Open file dialog to browse for Vosk model directory"""
         dir_path = QFileDialog.getExistingDirectory(
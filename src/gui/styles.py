@@ -19,161 +19,164 @@ class Colors:
     SUCCESS = "#00cc00"
     DISABLED = "#888888"
 
-def create_toggle_style():
-    """Create style for toggle switches"""
-    return """
-        QCheckBox {
+# Toggle switch style, built once: every toggle shares the same string
+_TOGGLE_STYLE = f"""
+        QCheckBox {{
             spacing: 5px;
-        }
+        }}
         
-        QCheckBox::indicator {
+        QCheckBox::indicator {{
             width: 36px;
             height: 18px;
             border-radius: 9px;
             background-color: #888888;
-        }
+        }}
         
-        QCheckBox::indicator:checked {
-            background-color: """ + Colors.PRIMARY + """;
-        }
+        QCheckBox::indicator:checked {{
+            background-color: {Colors.PRIMARY};
+        }}
         
-        QCheckBox::indicator:unchecked {
+        QCheckBox::indicator:unchecked {{
             background-color: #888888;
-        }
+        }}
     """
 
-MAIN_WINDOW_STYLE = """
-    QMainWindow {
-        background-color: """ + Colors.BACKGROUND + """;
-        color: """ + Colors.FOREGROUND + """;
-    }
-    
-    QTabWidget {
-        background-color: """ + Colors.BACKGROUND + """;
-    }
-    
-    QTabWidget::pane {
-        border: 1px solid """ + Colors.BORDER + """;
-        background-color: """ + Colors.BACKGROUND + """;
-    }
-    
-    QTabBar::tab {
-        background-color: """ + Colors.BACKGROUND + """;
-        color: """ + Colors.FOREGROUND + """;
+def create_toggle_style():
+    """Create style for toggle switches"""
+    return _TOGGLE_STYLE
+
+MAIN_WINDOW_STYLE = f"""
+    QMainWindow {{
+        background-color: {Colors.BACKGROUND};
+        color: {Colors.FOREGROUND};
+    }}
+    
+    QTabWidget {{
+        background-color: {Colors.BACKGROUND};
+    }}
+    
+    QTabWidget::pane {{
+        border: 1px solid {Colors.BORDER};
+        background-color: {Colors.BACKGROUND};
+    }}
+    
+    QTabBar::tab {{
+        background-color: {Colors.BACKGROUND};
+        color: {Colors.FOREGROUND};
         padding: 8px 12px;
-        border: 1px solid """ + Colors.BORDER + """;
+        border: 1px solid {Colors.BORDER};
         border-bottom: none;
         border-top-left-radius: 4px;
         border-top-right-radius: 4px;
-    }
+    }}
     
-    QTabBar::tab:selected {
-        background-color: """ + Colors.ACTIVE + """;
-    }
+    QTabBar::tab:selected {{
+        background-color: {Colors.ACTIVE};
+    }}
     
-    QTabBar::tab:hover:!selected {
-        background-color: """ + Colors.HOVER + """;
-    }
+    QTabBar::tab:hover:!selected {{
+        background-color: {Colors.HOVER};
+    }}
     
-    QPushButton {
-        background-color: """ + Colors.PRIMARY + """;
-        color: """ + Colors.FOREGROUND + """;
+    QPushButton {{
+        background-color: {Colors.PRIMARY};
+        color: {Colors.FOREGROUND};
         border: none;
         padding: 8px 16px;
         border-radius: 4px;
-    }
+    }}
     
-    QPushButton:hover {
+    QPushButton:hover {{
         background-color: #5a96f8;
-    }
+    }}
     
-    QPushButton:pressed {
+    QPushButton:pressed {{
         background-color: #3a76d8;
-    }
+    }}
     
-    QPushButton:disabled {
-        background-color: """ + Colors.DISABLED + """;
-    }
+    QPushButton:disabled {{
+        background-color: {Colors.DISABLED};
+    }}
     
-    QLineEdit, QComboBox, QSpinBox {
+    QLineEdit, QComboBox, QSpinBox {{
         background-color: #3d3d3d;
-        color: """ + Colors.FOREGROUND + """;
-        border: 1px solid """ + Colors.BORDER + """;
+        color: {Colors.FOREGROUND};
+        border: 1px solid {Colors.BORDER};
         padding: 5px;
         border-radius: 4px;
-    }
+    }}
     
-    QComboBox::drop-down {
+    QComboBox::drop-down {{
         border: none;
         width: 20px;
-    }
+    }}
     
-    QComboBox::down-arrow {
+    QComboBox::down-arrow {{
         width: 12px;
         height: 12px;
-    }
+    }}
     
-    QLabel {
-        color: """ + Colors.FOREGROUND + """;
-    }
+    QLabel {{
+        color: {Colors.FOREGROUND};
+    }}
     
-    QScrollArea, QScrollBar {
-        background-color: """ + Colors.BACKGROUND + """;
-        color: """ + Colors.FOREGROUND + """;
-    }
+    QScrollArea, QScrollBar {{
+        background-color: {Colors.BACKGROUND};
+        color: {Colors.FOREGROUND};
+    }}
     
-    QGroupBox {
-        border: 1px solid """ + Colors.BORDER + """;
+    QGroupBox {{
+        border: 1px solid {Colors.BORDER};
         border-radius: 4px;
         margin-top: 10px;
         padding-top: 10px;
-        color: """ + Colors.FOREGROUND + """;
-    }
+        color: {Colors.FOREGROUND};
+    }}
     
-    QGroupBox::title {
+    QGroupBox::title {{
         subcontrol-origin: margin;
         subcontrol-position: top center;
         padding: 0 5px;
-    }
+    }}
 """
 
-FLOATING_BAR_STYLE = """
-    QWidget {
-        background-color: """ + Colors.BACKGROUND + """;
-        color: """ + Colors.FOREGROUND + """;
-        border: 1px solid """ + Colors.BORDER + """;
+FLOATING_BAR_STYLE = f"""
+    QWidget {{
+        background-color: {Colors.BACKGROUND};
+        color: {Colors.FOREGROUND};
+        border: 1px solid {Colors.BORDER};
         border-radius: 5px;
-    }
+    }}
     
-    QPushButton {
+    QPushButton {{
         background-color: transparent;
         border: none;
         padding: 5px;
         border-radius: 3px;
-    }
+    }}
     
-    QPushButton:hover {
-        background-color: """ + Colors.HOVER + """;
-    }
+    QPushButton:hover {{
+        background-color: {Colors.HOVER};
+    }}
     
-    QPushButton:pressed {
-        background-color: """ + Colors.ACTIVE + """;
-    }
+    QPushButton:pressed {{
+        background-color: {Colors.ACTIVE};
+    }}
     
-    QProgressBar {
-        border: 1px solid """ + Colors.BORDER + """;
+    QProgressBar {{
+        border: 1px solid {Colors.BORDER};
         border-radius: 3px;
         background-color: #3d3d3d;
         text-align: center;
-    }
+    }}
     
-    QProgressBar::chunk {
-        background-color: """ + Colors.PRIMARY + """;
+    QProgressBar::chunk {{
+        background-color: {Colors.PRIMARY};
         width: 10px;
         margin: 0px;
-    }
+    }}
     
-    QLabel {
-        color: """ + Colors.FOREGROUND + """;
-    }
+    QLabel {{
+        color: {Colors.FOREGROUND};
+    }}
 """ 
\ No newline at end of file
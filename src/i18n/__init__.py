@@ -9,20 +9,25 @@ Handles translations for the user interface
 import os
 import json
 import logging
+import functools
 from pathlib import Path
 
+from src.i18n.constants import INTERFACE_LANGUAGES
+
 logger = logging.getLogger("DogeDictate.I18n")
 
+# Parse translation files with orjson when it is installed; both accept UTF-8 bytes
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 class I18n:
     """Internationalization manager for DogeDictate"""
     
     # Supported languages
-    SUPPORTED_LANGUAGES = {
-        "en": "English",
-        "pt": "Português",
-        "fr": "Français",
-        "es": "Español"
-    }
+    SUPPORTED_LANGUAGES = {code: name for name, code in INTERFACE_LANGUAGES}
     
     # Default language
     DEFAULT_LANGUAGE = "en"
@@ -33,36 +38,33 @@ class I18n:
         self.translations = {}
         self.current_language = self.DEFAULT_LANGUAGE
         
-        # Load translations
-        self._load_translations()
+        # Language files are read on first use; remember the ones that don't exist
+        self._translations_dir = self._get_translations_dir()
+        self._missing = set()
+        
+        # Current language merged over the default one, built on first translate()
+        self._effective_current = None
         
         # Set language from config if available
         if config_manager:
             self.set_language(config_manager.get_value("interface", "language", self.DEFAULT_LANGUAGE))
     
-    def _load_translations(self):
-        """Load all translation files"""
-        try:
-            # Get the translations directory
-            translations_dir = self._get_translations_dir()
-            
-            # Load each language file
-            for lang_code in self.SUPPORTED_LANGUAGES.keys():
-                lang_file = os.path.join(translations_dir, f"{lang_code}.json")
-                
-                if os.path.exists(lang_file):
-                    with open(lang_file, "r", encoding="utf-8") as f:
-                        self.translations[lang_code] = json.load(f)
-                    logger.info(f"Loaded translations for {lang_code}")
-                else:
-                    logger.warning(f"Translation file not found for {lang_code}")
-                    self.translations[lang_code] = {}
+    def _ensure_loaded(self, lang_code):
+        """Load the translation file of a language, if it isn't loaded yet"""
+        if lang_code in self.translations or lang_code in self._missing:
+            return
         
+        lang_file = os.path.join(self._translations_dir, f"{lang_code}.json")
+        try:
+            with open(lang_file, "rb") as f:
+                self.translations[lang_code] = _json_loads(f.read())
+            logger.info(f"Loaded translations for {lang_code}")
+        except FileNotFoundError:
+            logger.warning(f"Translation file not found for {lang_code}")
+            self._missing.add(lang_code)
         except Exception as e:
-            logger.error(f"Error loading translations: {str(e)}")
-            # Initialize with empty translations
-            for lang_code in self.SUPPORTED_LANGUAGES.keys():
-                self.translations[lang_code] = {}
+            logger.error(f"Error loading translations for {lang_code}: {str(e)}")
+            self._missing.add(lang_code)
     
     def _get_translations_dir(self):
         """Get the translations directory"""
@@ -85,7 +87,12 @@ class I18n:
     def set_language(self, language_code):
         """Set the current language"""
         if language_code in self.SUPPORTED_LANGUAGES:
-            self.current_language = language_code
+            # Only invalidate memoized translations on an actual language change
+            if language_code != self.current_language:
+                self.current_language = language_code
+                self._effective_current = None
+                _cached_translate.cache_clear()
+            self._ensure_loaded(language_code)
             logger.info(f"Language set to {language_code}")
             
             # Save to config if available
@@ -96,7 +103,10 @@ class I18n:
             return True
         else:
             logger.warning(f"Unsupported language: {language_code}, using default")
-            self.current_language = self.DEFAULT_LANGUAGE
+            if self.current_language != self.DEFAULT_LANGUAGE:
+                self.current_language = self.DEFAULT_LANGUAGE
+                self._effective_current = None
+                _cached_translate.cache_clear()
             return False
     
     def get_language(self):
@@ -114,20 +124,25 @@ class I18n:
         """Get a list of supported languages"""
         return [{"code": code, "name": name} for code, name in self.SUPPORTED_LANGUAGES.items()]
     
+    def _build_effective(self):
+        """Merge the current language's translations over the default language's"""
+        self._ensure_loaded(self.DEFAULT_LANGUAGE)
+        self._ensure_loaded(self.current_language)
+        
+        merged = dict(self.translations.get(self.DEFAULT_LANGUAGE, {}))
+        merged.update(self.translations.get(self.current_language, {}))
+        self._effective_current = merged
+        return merged
+    
     def translate(self, key, default=None):
         """Translate a key to the current language"""
-        # Try to get the translation for the current language
-        translation = self.translations.get(self.current_language, {}).get(key)
-        
-        # If not found, try the default language
-        if translation is None and self.current_language != self.DEFAULT_LANGUAGE:
-            translation = self.translations.get(self.DEFAULT_LANGUAGE, {}).get(key)
+        # Keys missing from the current language fall back to the default language
+        effective = self._effective_current
+        if effective is None:
+            effective = self._build_effective()
         
         # If still not found, use the provided default or the key itself
-        if translation is None:
-            translation = default if default is not None else key
-        
-        return translation
+        return effective.get(key, key if default is None else default)
 
 # Create a global instance
 _i18n = None
@@ -136,6 +151,7 @@ def init(config_manager=None):
     """Initialize the internationalization system"""
     global _i18n
     _i18n = I18n(config_manager)
+    _cached_translate.cache_clear()
     return _i18n
 
 def get_instance():
@@ -145,6 +161,11 @@ def get_instance():
         _i18n = I18n()
     return _i18n
 
+@functools.lru_cache(maxsize=2048)
+def _cached_translate(language, key, default):
+    """Memoized translate, keyed by language so a language switch never returns stale text"""
+    return get_instance().translate(key, default)
+
 def _(key, default=None):
     """Shorthand for translate"""
-    return get_instance().translate(key, default) 
\ No newline at end of file
+    return _cached_translate(get_instance().current_language, key, default) 
\ No newline at end of file
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Language constants shared by the i18n module and the settings tabs
+"""
+
+# Interface languages: (display name, interface code)
+INTERFACE_LANGUAGES = (
+    ("English", "en"),
+    ("Português", "pt"),
+    ("Français", "fr"),
+    ("Español", "es")
+)
+
+# Translation target languages: (display name, interface code, BCP 47 region code)
+TARGET_LANGUAGES = (
+    ("Português (Brasil)", "pt", "pt-BR"),
+    ("Inglês (EUA)", "en", "en-US"),
+    ("Espanhol", "es", "es-ES"),
+    ("Francês", "fr", "fr-FR"),
+    ("Alemão", "de", "de-DE")
+)
\ No newline at end of file
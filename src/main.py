@@ -11,9 +11,10 @@ import traceback
 from pathlib import Path
 from datetime import datetime
 from PyQt5.QtWidgets import QApplication, QSplashScreen
-from PyQt5.QtGui import QPixmap, QPalette, QColor, QIcon
+from PyQt5.QtGui import QPixmap, QImage, QPalette, QColor, QIcon
 from PyQt5.QtCore import Qt, QMetaType
 import threading
+import concurrent.futures
 
 # Ajustar os caminhos de importação
 
@@ -245,16 +246,44 @@ def validate_microphone_config():
         logger.error(f"Erro ao validar configuração de microfone: {str(e)}")
         return False
 
+def load_splash_image():
+    """Ler a imagem da tela de splash (QImage pode ser lido fora da thread da interface)"""
+    # Tenta primeiro com caminho absoluto, depois com caminho relativo
+    splash_paths = [
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "resources", "splash.png"),
+        "resources/images/splash.png"
+    ]
+    
+    for splash_path in splash_paths:
+        logger.debug(f"Tentando carregar tela de splash do caminho: {splash_path}")
+        if not os.path.exists(splash_path):
+            logger.warning(f"Arquivo de splash não encontrado em: {splash_path}")
+            continue
+        
+        image = QImage(splash_path)
+        if not image.isNull():
+            return image
+    
+    return None
+
 def main():
     """Main application function"""
     try:
         # Registrar QMetaTypes para sinais e slots
         setup_qt_vector_metatype()
         
+        # Ler o splash e as traduções em segundo plano, em paralelo com o resto da inicialização
+        startup_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="Startup")
+        splash_future = startup_pool.submit(load_splash_image)
+        
         # Inicializar o gerenciador de configuração
         logger.info("Initializing config manager...")
         config_manager = initialize_config()
         
+        # As traduções só dependem do config
+        logger.info("Initializing internationalization...")
+        i18n_future = startup_pool.submit(init_i18n, config_manager)
+        
         # Verificar configurações
         interface_language = config_manager.get_value("interface", "language", "en")
         start_minimized = config_manager.get_value("interface", "start_minimized", False)
@@ -286,22 +315,10 @@ def main():
         logger.info("Creating splash screen...")
         splash_pixmap = None
         try:
-            # Tenta primeiro com caminho absoluto
-            splash_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "resources", "splash.png")
-            logger.debug(f"Tentando carregar tela de splash do caminho: {splash_path}")
-            if os.path.exists(splash_path):
-                splash_pixmap = QPixmap(splash_path)
-            else:
-                logger.warning(f"Arquivo de splash não encontrado em: {splash_path}")
-                
-            # Se falhou, tenta com caminho relativo
-            if splash_pixmap is None or splash_pixmap.isNull():
-                splash_path = "resources/images/splash.png"
-                logger.debug(f"Tentando carregar tela de splash do caminho alternativo: {splash_path}")
-                if os.path.exists(splash_path):
-                    splash_pixmap = QPixmap(splash_path)
-                else:
-                    logger.warning(f"Arquivo de splash não encontrado em: {splash_path}")
+            # O QPixmap só pode ser criado na thread da interface, depois do QApplication
+            splash_image = splash_future.result()
+            if splash_image is not None:
+                splash_pixmap = QPixmap.fromImage(splash_image)
         except Exception as e:
             logger.error(f"Erro ao carregar a tela de splash: {str(e)}")
             
@@ -335,9 +352,9 @@ def main():
         palette.setColor(QPalette.HighlightedText, Qt.black)
         app.setPalette(palette)
         
-        # Initialize internationalization
-        logger.info("Initializing internationalization...")
-        i18n = init_i18n(config_manager)
+        # Wait for the internationalization started after the config was loaded
+        i18n = i18n_future.result()
+        startup_pool.shutdown(wait=False)
         
         # Set interface language
         interface_language = config_manager.get_value("interface", "language", "en")
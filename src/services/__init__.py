@@ -5,18 +5,31 @@
 Services for DogeDictate
 """
 
-from src.services.whisper_service import WhisperService
-from src.services.azure_service import AzureService
-from src.services.google_service import GoogleService
-from src.services.translator_service import TranslatorService
-from src.services.stats_service import StatsService
-from src.services.local_whisper_service import LocalWhisperService
-from src.services.local_llm_translator_service import LocalLLMTranslatorService
+import importlib
 
-# Imports para compatibilidade
-from src.services.azure_translator_service import AzureTranslatorService
-from src.services.m2m100_translator_service import M2M100TranslatorService
-from src.services.azure_openai_service import AzureOpenAIService
+# Each service is imported on first access (PEP 562), so importing this package
+# doesn't pull in every speech/translation SDK at startup
+_LAZY = {
+    'WhisperService': 'src.services.whisper_service',
+    'AzureService': 'src.services.azure_service',
+    'GoogleService': 'src.services.google_service',
+    'TranslatorService': 'src.services.translator_service',
+    'StatsService': 'src.services.stats_service',
+    'LocalWhisperService': 'src.services.local_whisper_service',
+    'LocalLLMTranslatorService': 'src.services.local_llm_translator_service',
+    # Imports para compatibilidade
+    'AzureTranslatorService': 'src.services.azure_translator_service',
+    'M2M100TranslatorService': 'src.services.m2m100_translator_service',
+    'AzureOpenAIService': 'src.services.azure_openai_service'
+}
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    obj = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = obj
+    return obj
 
 __all__ = [
     'WhisperService', 